@@ -0,0 +1,28 @@
+"""Add drafts.version for optimistic concurrency control
+
+Revision ID: 0008_draft_version
+Revises: 0007_smart_autoplan_rules
+Create Date: 2026-10-17 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008_draft_version"
+down_revision = "0007_smart_autoplan_rules"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "drafts",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("drafts", "version")
@@ -1,5 +1,6 @@
 """Infrastructure adapters."""
 
+from tg_news_bot.adapters.bot_session import KeepAliveAiohttpSession
 from tg_news_bot.adapters.publisher import PublisherAdapter
 
-__all__ = ["PublisherAdapter"]
+__all__ = ["KeepAliveAiohttpSession", "PublisherAdapter"]
@@ -0,0 +1,50 @@
+"""aiogram HTTP session with a tunable keep-alive connection pool."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+from typing import Any
+
+import certifi
+from aiogram import __version__ as aiogram_version
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiohttp import ClientSession, TCPConnector
+from aiohttp.hdrs import USER_AGENT
+from aiohttp.http import SERVER_SOFTWARE
+
+
+class KeepAliveAiohttpSession(AiohttpSession):
+    """AiohttpSession whose connector keeps idle Bot API connections open longer.
+
+    aiogram exposes no option for the connector's keepalive_timeout, so the
+    ClientSession is built here with the same TLS context, DNS cache and
+    User-Agent that aiogram uses.
+    """
+
+    def __init__(self, *, limit: int, keepalive_timeout: float, **kwargs: Any) -> None:
+        super().__init__(limit=limit, **kwargs)
+        self.connection_limit = limit
+        self.keepalive_timeout = keepalive_timeout
+        self._client: ClientSession | None = None
+
+    async def create_session(self) -> ClientSession:
+        if self._client is None or self._client.closed:
+            connector = TCPConnector(
+                ssl=ssl.create_default_context(cafile=certifi.where()),
+                limit=self.connection_limit,
+                ttl_dns_cache=3600,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._client = ClientSession(
+                connector=connector,
+                headers={USER_AGENT: f"{SERVER_SOFTWARE} aiogram/{aiogram_version}"},
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+            # Give the SSL transports a moment to shut down, as aiogram does.
+            await asyncio.sleep(0.25)
+        await super().close()
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import hashlib
+
 from telegram_publisher import TelegramPublisher
 from telegram_publisher.exceptions import (
     PublisherEditNotAllowed as UpstreamPublisherEditNotAllowed,
@@ -18,9 +21,58 @@ from tg_news_bot.ports.publisher import (
 )
 
 
+_TEXT_DIGEST_CACHE_SIZE = 1024
+_MARKUP_DIGEST_CACHE_SIZE = 1024
+
+
+def _text_digest(text: str, keyboard, parse_mode: str | None) -> bytes:  # noqa: ANN001
+    payload = f"{parse_mode or ''}\x1f{keyboard!r}\x1f{text}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+
+
+def _markup_digest(keyboard) -> bytes:  # noqa: ANN001
+    return hashlib.blake2b(repr(keyboard).encode("utf-8"), digest_size=8).digest()
+
+
+def _remember(
+    digests: OrderedDict[tuple[int, int], bytes],
+    key: tuple[int, int],
+    digest: bytes,
+    limit: int,
+) -> None:
+    digests[key] = digest
+    digests.move_to_end(key)
+    while len(digests) > limit:
+        digests.popitem(last=False)
+
+
 class PublisherAdapter:
     def __init__(self, publisher: TelegramPublisher) -> None:
         self._publisher = publisher
+        # Digest of the last text/markup this process put into each text
+        # message, so a repeated edit_text can skip the Bot API round-trip
+        # that would only answer "message is not modified".
+        self._text_digests: OrderedDict[tuple[int, int], bytes] = OrderedDict()
+        # Same idea for inline keyboards: menu navigation and state refreshes
+        # often re-send the markup a message already carries.
+        self._markup_digests: OrderedDict[tuple[int, int], bytes] = OrderedDict()
+
+    def _remember_text(self, chat_id: int, message_id: int, digest: bytes) -> None:
+        _remember(self._text_digests, (chat_id, message_id), digest, _TEXT_DIGEST_CACHE_SIZE)
+
+    def _forget_text(self, chat_id: int, message_id: int) -> None:
+        self._text_digests.pop((chat_id, message_id), None)
+
+    def _remember_markup(self, chat_id: int, message_id: int, keyboard) -> None:  # noqa: ANN001
+        _remember(
+            self._markup_digests,
+            (chat_id, message_id),
+            _markup_digest(keyboard),
+            _MARKUP_DIGEST_CACHE_SIZE,
+        )
+
+    def _forget_markup(self, chat_id: int, message_id: int) -> None:
+        self._markup_digests.pop((chat_id, message_id), None)
 
     async def send_post(
         self,
@@ -31,12 +83,14 @@ class PublisherAdapter:
         keyboard,
     ) -> SendResult:
         try:
-            return await self._publisher.send_post(
+            result = await self._publisher.send_post(
                 chat_id=chat_id,
                 topic_id=topic_id,
                 content=content,
                 keyboard=keyboard,
             )
+            self._remember_markup(result.chat_id, result.message_id, keyboard)
+            return result
         except UpstreamPublisherNotFound as exc:
             raise PublisherNotFound(str(exc)) from exc
         except UpstreamPublisherEditNotAllowed as exc:
@@ -54,13 +108,18 @@ class PublisherAdapter:
         parse_mode: str | None = None,
     ) -> SendResult:
         try:
-            return await self._publisher.send_text(
+            result = await self._publisher.send_text(
                 chat_id=chat_id,
                 topic_id=topic_id,
                 text=text,
                 keyboard=keyboard,
                 parse_mode=parse_mode,
             )
+            self._remember_text(
+                result.chat_id, result.message_id, _text_digest(text, keyboard, parse_mode)
+            )
+            self._remember_markup(result.chat_id, result.message_id, keyboard)
+            return result
         except UpstreamPublisherNotFound as exc:
             raise PublisherNotFound(str(exc)) from exc
         except UpstreamPublisherEditNotAllowed as exc:
@@ -76,13 +135,17 @@ class PublisherAdapter:
         content: PostContent,
         keyboard,
     ) -> SendResult:
+        self._forget_text(chat_id, message_id)
+        self._forget_markup(chat_id, message_id)
         try:
-            return await self._publisher.edit_post(
+            result = await self._publisher.edit_post(
                 chat_id=chat_id,
                 message_id=message_id,
                 content=content,
                 keyboard=keyboard,
             )
+            self._remember_markup(result.chat_id, result.message_id, keyboard)
+            return result
         except UpstreamPublisherNotFound as exc:
             raise PublisherNotFound(str(exc)) from exc
         except UpstreamPublisherEditNotAllowed as exc:
@@ -100,6 +163,11 @@ class PublisherAdapter:
         parse_mode: str | None = None,
         disable_web_page_preview: bool = False,
     ) -> None:
+        digest = _text_digest(text, keyboard, parse_mode)
+        if self._text_digests.get((chat_id, message_id)) == digest:
+            return
+        self._forget_text(chat_id, message_id)
+        self._forget_markup(chat_id, message_id)
         try:
             await self._publisher.edit_text(
                 chat_id=chat_id,
@@ -114,7 +182,11 @@ class PublisherAdapter:
         except UpstreamPublisherEditNotAllowed as exc:
             raise PublisherEditNotAllowed(str(exc)) from exc
         except UpstreamPublisherNotModified as exc:
+            self._remember_text(chat_id, message_id, digest)
+            self._remember_markup(chat_id, message_id, keyboard)
             raise PublisherNotModified(str(exc)) from exc
+        self._remember_text(chat_id, message_id, digest)
+        self._remember_markup(chat_id, message_id, keyboard)
 
     async def edit_caption(
         self,
@@ -125,6 +197,8 @@ class PublisherAdapter:
         keyboard,
         parse_mode: str | None = None,
     ) -> None:
+        self._forget_text(chat_id, message_id)
+        self._forget_markup(chat_id, message_id)
         try:
             await self._publisher.edit_caption(
                 chat_id=chat_id,
@@ -139,6 +213,7 @@ class PublisherAdapter:
             raise PublisherEditNotAllowed(str(exc)) from exc
         except UpstreamPublisherNotModified as exc:
             raise PublisherNotModified(str(exc)) from exc
+        self._remember_markup(chat_id, message_id, keyboard)
 
     async def edit_reply_markup(
         self,
@@ -147,6 +222,11 @@ class PublisherAdapter:
         message_id: int,
         keyboard,
     ) -> None:
+        digest = _markup_digest(keyboard)
+        if self._markup_digests.get((chat_id, message_id)) == digest:
+            return
+        self._forget_text(chat_id, message_id)
+        self._forget_markup(chat_id, message_id)
         try:
             await self._publisher.edit_reply_markup(
                 chat_id=chat_id,
@@ -158,9 +238,13 @@ class PublisherAdapter:
         except UpstreamPublisherEditNotAllowed as exc:
             raise PublisherEditNotAllowed(str(exc)) from exc
         except UpstreamPublisherNotModified as exc:
+            self._remember_markup(chat_id, message_id, keyboard)
             raise PublisherNotModified(str(exc)) from exc
+        self._remember_markup(chat_id, message_id, keyboard)
 
     async def delete_message(self, *, chat_id: int, message_id: int) -> None:
+        self._forget_text(chat_id, message_id)
+        self._forget_markup(chat_id, message_id)
         try:
             await self._publisher.delete_message(chat_id=chat_id, message_id=message_id)
         except UpstreamPublisherNotFound as exc:
@@ -169,3 +253,16 @@ class PublisherAdapter:
             raise PublisherEditNotAllowed(str(exc)) from exc
         except UpstreamPublisherNotModified as exc:
             raise PublisherNotModified(str(exc)) from exc
+
+    async def delete_messages(self, *, chat_id: int, message_ids: list[int]) -> None:
+        for message_id in message_ids:
+            self._forget_text(chat_id, message_id)
+            self._forget_markup(chat_id, message_id)
+        try:
+            await self._publisher.delete_messages(chat_id=chat_id, message_ids=message_ids)
+        except UpstreamPublisherNotFound as exc:
+            raise PublisherNotFound(str(exc)) from exc
+        except UpstreamPublisherEditNotAllowed as exc:
+            raise PublisherEditNotAllowed(str(exc)) from exc
+        except UpstreamPublisherNotModified as exc:
+            raise PublisherNotModified(str(exc)) from exc
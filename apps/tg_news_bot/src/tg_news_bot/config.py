@@ -80,6 +80,7 @@ class TrendDiscoverySettings(BaseModel):
     max_sources_per_topic: int = Field(6, ge=1, le=30)
     min_topic_score: float = Field(2.0, ge=0.0, le=100.0)
     article_snippet_chars: int = Field(280, ge=80, le=1200)
+    publish_concurrency: int = Field(4, ge=1, le=20)
     github_trending_enabled: bool = True
     github_trending_url: str = "https://github.com/trending"
     steam_charts_enabled: bool = True
@@ -90,6 +91,7 @@ class TrendDiscoverySettings(BaseModel):
             "https://www.boxofficemojo.com/month/",
         ]
     )
+    arxiv_stream_parser: bool = True
     ai_enrichment: bool = True
     auto_ingest_min_score: float = Field(4.0, ge=0.0, le=100.0)
     auto_add_source_min_score: float = Field(4.0, ge=0.0, le=100.0)
@@ -369,6 +371,9 @@ class SchedulerSettings(BaseModel):
     max_publish_attempts: int = Field(3, ge=1, le=20)
     retry_backoff_seconds: int = Field(60, ge=5, le=3600)
     recover_failed_after_seconds: int = Field(300, ge=10, le=86400)
+    # Workers and queue bound for manual schedule input typed by the admin.
+    input_workers: int = Field(2, ge=1, le=32)
+    input_queue_size: int = Field(100, ge=1, le=10000)
     autoplan_peak_hours: list[int] = Field(default_factory=lambda: [9, 12, 18, 21])
     autoplan_peak_bonus: float = Field(0.6, ge=0.0, le=5.0)
     autoplan_topic_weights: dict[str, float] = Field(
@@ -511,6 +516,32 @@ class HealthSettings(BaseModel):
     port: int = Field(8080, ge=1, le=65535)
 
 
+class DatabaseSettings(BaseModel):
+    # Keep pool_size >= concurrent moderator transitions + background runners
+    # (ingestion, scheduler, trends); each holds one connection per session.
+    pool_size: int = Field(20, ge=1, le=500)
+    max_overflow: int = Field(40, ge=0, le=1000)
+    pool_timeout_seconds: float = Field(30.0, gt=0)
+    pool_recycle_seconds: int = Field(3600, ge=-1)
+    command_timeout_seconds: float = Field(60.0, gt=0)
+    disable_jit: bool = True
+    # Pre-ping detects connections dropped by a server restart, failover or an
+    # idle TCP timeout, which pool_recycle alone does not catch.
+    pool_pre_ping: bool = True
+    # Connections opened at startup so the first moderator bursts skip connect.
+    prewarm_connections: int = Field(5, ge=0, le=500)
+
+
+class TelegramSettings(BaseModel):
+    # Size of the keep-alive pool shared by every Bot API call of the process.
+    connection_limit: int = Field(64, ge=1, le=1000)
+    # How long idle pooled connections stay open; aiohttp closes them after
+    # 15s by default, which forces a new TLS handshake after every lull.
+    keepalive_timeout_seconds: float = Field(75.0, gt=0, le=3600)
+    # Client-side pacing of outbound Bot API calls (Telegram allows ~30/s per bot).
+    max_requests_per_second: float = Field(30.0, gt=0, le=1000)
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -542,6 +573,8 @@ class Settings(BaseSettings):
     text_generation: TextGenerationSettings = TextGenerationSettings()
     post_formatting: PostFormattingSettings = PostFormattingSettings()
     health: HealthSettings = HealthSettings()
+    db: DatabaseSettings = DatabaseSettings()
+    telegram: TelegramSettings = TelegramSettings()
 
     extracted_text_ttl_days: int = Field(14, ge=1)
 
@@ -211,6 +211,7 @@ class Draft(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
 
     source: Mapped[Source | None] = relationship("Source", back_populates="drafts")
     article: Mapped[Article | None] = relationship("Article", back_populates="drafts")
@@ -225,6 +226,8 @@ class Draft(Base):
         back_populates="draft",
     )
 
+    __mapper_args__ = {"version_id_col": version}
+
 
 class EditSession(Base):
     __tablename__ = "edit_sessions"
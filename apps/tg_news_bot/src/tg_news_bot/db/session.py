@@ -2,13 +2,60 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+
+import orjson
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from tg_news_bot.config import DatabaseSettings
+
+
+def json_dumps(value: Any) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
-def create_engine(database_url: str) -> AsyncEngine:
-    return create_async_engine(database_url, pool_pre_ping=True)
+def create_engine(
+    database_url: str,
+    pool: DatabaseSettings | None = None,
+) -> AsyncEngine:
+    pool = pool or DatabaseSettings()
+    connect_args: dict[str, Any] = {}
+    if make_url(database_url).get_driver_name() == "asyncpg":
+        connect_args["command_timeout"] = pool.command_timeout_seconds
+        if pool.disable_jit:
+            # Workflow queries are short point lookups; JIT only adds planning cost.
+            connect_args["server_settings"] = {"jit": "off"}
+    # Sessions are opened per callback/transition, so they must come from a
+    # real queue pool; NullPool would reconnect on every checkout.
+    return create_async_engine(
+        database_url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_pre_ping=pool.pool_pre_ping,
+        pool_size=pool.pool_size,
+        max_overflow=pool.max_overflow,
+        pool_timeout=pool.pool_timeout_seconds,
+        pool_recycle=pool.pool_recycle_seconds,
+        connect_args=connect_args,
+        json_serializer=json_dumps,
+        json_deserializer=orjson.loads,
+    )
 
 
-def create_session_factory(database_url: str) -> async_sessionmaker[AsyncSession]:
-    engine = create_engine(database_url)
+def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> None:
+    """Open ``connections`` pooled connections up front and return them to the pool."""
+    if connections <= 0:
+        return
+
+    async def _checkout() -> None:
+        async with engine.connect():
+            pass
+
+    # Concurrent checkouts force the pool to materialize distinct connections.
+    await asyncio.gather(*(_checkout() for _ in range(connections)))
@@ -4,20 +4,25 @@ import asyncio
 import sys
 from contextlib import suppress
 
+import orjson
 from pydantic import ValidationError
 from aiogram import Bot, Dispatcher
 
 from telegram_publisher import TelegramPublisher
-from tg_news_bot.adapters import PublisherAdapter
-from tg_news_bot.config import Settings
-from tg_news_bot.db.session import create_session_factory
+from tg_news_bot.adapters import KeepAliveAiohttpSession, PublisherAdapter
+from tg_news_bot.config import Settings, TelegramSettings
+from tg_news_bot.db.session import create_engine, create_session_factory, warm_pool
 from tg_news_bot.logging import configure_logging, get_logger
 from tg_news_bot.monitoring import configure_sentry
-from tg_news_bot.repositories.bot_settings import BotSettingsRepository
+from tg_news_bot.repositories.bot_settings import (
+    BotSettingsRepository,
+    CachedBotSettingsRepository,
+)
 from tg_news_bot.repositories.drafts import DraftRepository
 from tg_news_bot.repositories.scheduled_posts import ScheduledPostRepository
 from tg_news_bot.repositories.sources import SourceRepository
 from tg_news_bot.services.analytics import AnalyticsService
+from tg_news_bot.services.content_safety import ContentSafetyService
 from tg_news_bot.services.edit_sessions import EditSessionService
 from tg_news_bot.services.health import HealthServer
 from tg_news_bot.services.ingestion import IngestionConfig, IngestionRunner
@@ -37,6 +42,14 @@ from tg_news_bot.telegram.handlers.schedule_input import (
 from tg_news_bot.telegram.handlers.settings import SettingsContext, create_settings_router
 
 
+def create_bot_session(settings: TelegramSettings) -> KeepAliveAiohttpSession:
+    return KeepAliveAiohttpSession(
+        limit=settings.connection_limit,
+        keepalive_timeout=settings.keepalive_timeout_seconds,
+        json_loads=orjson.loads,
+    )
+
+
 async def _run() -> int:
     try:
         settings = Settings()
@@ -50,10 +63,23 @@ async def _run() -> int:
     log = get_logger(__name__)
     log.info("boot", settings=settings.public_dict())
 
-    session_factory = create_session_factory(settings.database_url)
-
-    bot = Bot(token=settings.bot_token)
-    publisher = PublisherAdapter(TelegramPublisher(bot))
+    engine = create_engine(settings.database_url, settings.db)
+    session_factory = create_session_factory(engine)
+    try:
+        await warm_pool(engine, settings.db.prewarm_connections)
+    except Exception:
+        log.warning("db.pool_warmup_failed", exc_info=True)
+
+    # One aiohttp session (and its keep-alive pool) serves the publisher,
+    # the workflow and polling for the whole process lifetime. Bot API
+    # responses (getUpdates batches included) are decoded with orjson.
+    bot = Bot(token=settings.bot_token, session=create_bot_session(settings.telegram))
+    publisher = PublisherAdapter(
+        TelegramPublisher(
+            bot,
+            max_requests_per_second=settings.telegram.max_requests_per_second,
+        )
+    )
     dispatcher = Dispatcher()
 
     trend_collector = TrendCollector(
@@ -76,11 +102,16 @@ async def _run() -> int:
         settings.text_generation,
         settings.llm,
     )
+    # Read-only BotSettings lookups on hot paths share one short-lived cache;
+    # the settings router invalidates it after every change.
+    cached_settings_repo = CachedBotSettingsRepository()
     workflow = DraftWorkflowService(
         session_factory,
         publisher,
+        settings_repo=cached_settings_repo,
         post_formatting=settings.post_formatting,
         text_pipeline=workflow_text_pipeline,
+        content_safety=ContentSafetyService(settings.content_safety),
         quality_gate=QualityGateService(settings.quality_gate),
     )
     trend_discovery = TrendDiscoveryService(
@@ -103,6 +134,7 @@ async def _run() -> int:
         scheduled_repo=ScheduledPostRepository(),
         draft_repo=DraftRepository(),
         analytics=AnalyticsService(session_factory),
+        settings_cache=cached_settings_repo,
     )
     dispatcher.include_router(create_settings_router(settings_context))
 
@@ -115,6 +147,7 @@ async def _run() -> int:
         session_factory=session_factory,
         edit_sessions=edit_service,
         publisher=publisher,
+        settings_repo=cached_settings_repo,
     )
     dispatcher.include_router(create_edit_router(edit_context))
 
@@ -127,6 +160,8 @@ async def _run() -> int:
         settings=settings,
         schedule_input=schedule_input_service,
         publisher=publisher,
+        workers=settings.scheduler.input_workers,
+        queue_size=settings.scheduler.input_queue_size,
     )
     dispatcher.include_router(create_schedule_input_router(schedule_input_context))
 
@@ -178,6 +213,8 @@ async def _run() -> int:
             trend_task.cancel()
             with suppress(asyncio.CancelledError):
                 await trend_task
+        await trend_discovery.aclose()
+        await trend_collector.aclose()
         await health_server.stop()
         await bot.session.close()
 
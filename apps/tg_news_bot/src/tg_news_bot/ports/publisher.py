@@ -82,3 +82,5 @@ class PublisherPort(Protocol):
     ) -> None: ...
 
     async def delete_message(self, *, chat_id: int, message_id: int) -> None: ...
+
+    async def delete_messages(self, *, chat_id: int, message_ids: list[int]) -> None: ...
@@ -2,12 +2,52 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tg_news_bot.db.models import BotSettings
 
 
+DEFAULT_SETTINGS_CACHE_TTL_SECONDS = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class BotSettingsSnapshot:
+    """Detached copy of the BotSettings columns read on hot paths."""
+
+    id: int
+    group_chat_id: int | None
+    inbox_topic_id: int | None
+    editing_topic_id: int | None
+    ready_topic_id: int | None
+    scheduled_topic_id: int | None
+    published_topic_id: int | None
+    archive_topic_id: int | None
+    trend_candidates_topic_id: int | None
+    channel_id: int | None
+    autoplan_rules: dict | None
+
+    @classmethod
+    def from_row(cls, row: BotSettings) -> BotSettingsSnapshot:
+        return cls(
+            id=row.id,
+            group_chat_id=row.group_chat_id,
+            inbox_topic_id=row.inbox_topic_id,
+            editing_topic_id=row.editing_topic_id,
+            ready_topic_id=row.ready_topic_id,
+            scheduled_topic_id=row.scheduled_topic_id,
+            published_topic_id=row.published_topic_id,
+            archive_topic_id=row.archive_topic_id,
+            trend_candidates_topic_id=row.trend_candidates_topic_id,
+            channel_id=row.channel_id,
+            autoplan_rules=row.autoplan_rules,
+        )
+
+
 class BotSettingsRepository:
     async def get(self, session: AsyncSession) -> BotSettings | None:
         result = await session.execute(select(BotSettings).limit(1))
@@ -21,3 +61,37 @@ class BotSettingsRepository:
         session.add(settings)
         await session.flush()
         return settings
+
+
+class CachedBotSettingsRepository(BotSettingsRepository):
+    """Serve BotSettings from memory for a short TTL.
+
+    Meant for hot read-only paths (edit-topic routing, transitions). The cache
+    holds a BotSettingsSnapshot rather than the mapped row: a row loaded in one
+    session is expired when that transaction rolls back and detached when the
+    session closes, so sharing it would break every later reader. Writers keep
+    using a plain repository and call invalidate() after committing.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_SETTINGS_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = max(0.0, ttl_seconds)
+        self._clock = clock
+        self._cached: BotSettingsSnapshot | None = None
+        self._expires_at = 0.0
+
+    async def get_or_create(self, session: AsyncSession) -> BotSettingsSnapshot:  # type: ignore[override]
+        now = self._clock()
+        if self._cached is not None and now < self._expires_at:
+            return self._cached
+        settings = BotSettingsSnapshot.from_row(await super().get_or_create(session))
+        self._cached = settings
+        self._expires_at = now + self._ttl_seconds
+        return settings
+
+    def invalidate(self) -> None:
+        self._cached = None
@@ -2,20 +2,62 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import select, update
+from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from tg_news_bot.db.models import Draft
+from tg_news_bot.db.models import (
+    Article,
+    Draft,
+    ScheduledPost,
+    ScheduledPostStatus,
+    Source,
+)
 from tg_news_bot.utils.url import normalize_title_key
 
 
+@dataclass(slots=True)
+class DraftWithRelated:
+    draft: Draft
+    source_tags: dict | None
+    article_text: str | None
+
+
 class DraftRepository:
     async def get(self, session: AsyncSession, draft_id: int) -> Draft | None:
         result = await session.execute(select(Draft).where(Draft.id == draft_id))
         return result.scalar_one_or_none()
 
+    async def get_many(
+        self, session: AsyncSession, draft_ids: list[int]
+    ) -> dict[int, Draft]:
+        if not draft_ids:
+            return {}
+        result = await session.execute(select(Draft).where(Draft.id.in_(draft_ids)))
+        return {draft.id: draft for draft in result.scalars()}
+
+    async def get_with_active_schedule(
+        self, session: AsyncSession, draft_id: int
+    ) -> tuple[Draft, datetime | None] | None:
+        result = await session.execute(
+            select(Draft, ScheduledPost.schedule_at)
+            .outerjoin(
+                ScheduledPost,
+                and_(
+                    ScheduledPost.draft_id == Draft.id,
+                    ScheduledPost.status == ScheduledPostStatus.SCHEDULED,
+                ),
+            )
+            .where(Draft.id == draft_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        draft, schedule_at = row
+        return draft, schedule_at
+
     async def get_by_normalized_url(self, session: AsyncSession, url: str) -> Draft | None:
         result = await session.execute(select(Draft).where(Draft.normalized_url == url))
         return result.scalar_one_or_none()
@@ -62,6 +104,26 @@ class DraftRepository:
             raise LookupError(f"Draft {draft_id} not found")
         return draft
 
+    async def get_for_update_with_related(
+        self, session: AsyncSession, draft_id: int
+    ) -> DraftWithRelated:
+        result = await session.execute(
+            select(Draft, Source.tags, Article.extracted_text)
+            .outerjoin(Source, Source.id == Draft.source_id)
+            .outerjoin(Article, Article.id == Draft.article_id)
+            .where(Draft.id == draft_id)
+            .with_for_update(of=Draft)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise LookupError(f"Draft {draft_id} not found")
+        draft, source_tags, article_text = row
+        return DraftWithRelated(
+            draft=draft,
+            source_tags=source_tags,
+            article_text=article_text,
+        )
+
     async def clear_expired_extracted_text(
         self, session: AsyncSession, *, now: datetime
     ) -> int:
@@ -34,9 +34,16 @@ class PublishFailureRepository:
         return failure
 
     async def mark_resolved_for_draft(self, session: AsyncSession, *, draft_id: int) -> None:
+        await self.mark_resolved_for_drafts(session, draft_ids=[draft_id])
+
+    async def mark_resolved_for_drafts(
+        self, session: AsyncSession, *, draft_ids: list[int]
+    ) -> None:
+        if not draft_ids:
+            return
         rows = await session.execute(
             update(PublishFailure)
-            .where(PublishFailure.draft_id == draft_id)
+            .where(PublishFailure.draft_id.in_(draft_ids))
             .where(PublishFailure.resolved.is_(False))
             .values(resolved=True)
         )
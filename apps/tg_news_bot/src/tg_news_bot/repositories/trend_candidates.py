@@ -5,7 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tg_news_bot.db.models import (
@@ -50,6 +51,20 @@ class TrendSourceCandidateInput:
     reasons: dict | None
 
 
+@dataclass(slots=True)
+class TrendCandidateAnnouncement:
+    candidate_id: int
+    group_chat_id: int
+    topic_id_telegram: int
+    message_id: int
+
+
+@dataclass(slots=True)
+class TrendCandidateMessageRef:
+    group_chat_id: int | None
+    message_id: int | None
+
+
 class TrendCandidateRepository:
     async def create_topic(
         self,
@@ -144,6 +159,76 @@ class TrendCandidateRepository:
         )
         return result.scalar_one_or_none()
 
+    async def mark_article_candidate_ingested(
+        self,
+        session: AsyncSession,
+        *,
+        candidate_id: int,
+        draft_id: int | None,
+        reviewed_by_user_id: int | None,
+        reviewed_at: datetime,
+    ) -> TrendCandidateMessageRef | None:
+        return await _update_returning_message_ref(
+            session,
+            update(TrendArticleCandidate)
+            .where(TrendArticleCandidate.id == candidate_id)
+            .values(
+                status=TrendCandidateStatus.INGESTED,
+                draft_id=draft_id,
+                reviewed_by_user_id=reviewed_by_user_id,
+                reviewed_at=reviewed_at,
+            )
+            .returning(TrendArticleCandidate.group_chat_id, TrendArticleCandidate.message_id),
+        )
+
+    async def mark_article_candidate_failed(
+        self,
+        session: AsyncSession,
+        *,
+        candidate_id: int,
+        reason: str | None,
+        reviewed_by_user_id: int | None,
+        reviewed_at: datetime,
+    ) -> TrendCandidateMessageRef | None:
+        reasons = func.coalesce(TrendArticleCandidate.reasons, literal({}, JSONB)).op(
+            "||",
+            return_type=JSONB,
+        )(literal({"last_ingest_reason": reason}, JSONB))
+        return await _update_returning_message_ref(
+            session,
+            update(TrendArticleCandidate)
+            .where(TrendArticleCandidate.id == candidate_id)
+            .values(
+                status=TrendCandidateStatus.FAILED,
+                reasons=reasons,
+                reviewed_by_user_id=reviewed_by_user_id,
+                reviewed_at=reviewed_at,
+            )
+            .returning(TrendArticleCandidate.group_chat_id, TrendArticleCandidate.message_id),
+        )
+
+    async def reject_article_candidate(
+        self,
+        session: AsyncSession,
+        *,
+        candidate_id: int,
+        reviewed_by_user_id: int | None,
+        reviewed_at: datetime,
+    ) -> TrendCandidateMessageRef | None:
+        """Reject a candidate that is not rejected yet; None if nothing was updated."""
+        return await _update_returning_message_ref(
+            session,
+            update(TrendArticleCandidate)
+            .where(TrendArticleCandidate.id == candidate_id)
+            .where(TrendArticleCandidate.status != TrendCandidateStatus.REJECTED)
+            .values(
+                status=TrendCandidateStatus.REJECTED,
+                reviewed_by_user_id=reviewed_by_user_id,
+                reviewed_at=reviewed_at,
+            )
+            .returning(TrendArticleCandidate.group_chat_id, TrendArticleCandidate.message_id),
+        )
+
     async def get_article_candidate_by_normalized_url(
         self,
         session: AsyncSession,
@@ -196,6 +281,21 @@ class TrendCandidateRepository:
         )
         return list(result.scalars().all())
 
+    async def list_unannounced_article_candidates(
+        self,
+        session: AsyncSession,
+        *,
+        topic_ids: list[int],
+    ) -> list[TrendArticleCandidate]:
+        result = await session.execute(
+            select(TrendArticleCandidate)
+            .where(TrendArticleCandidate.topic_id.in_(topic_ids))
+            .where(TrendArticleCandidate.status == TrendCandidateStatus.PENDING)
+            .where(TrendArticleCandidate.message_id.is_(None))
+            .order_by(TrendArticleCandidate.score.desc(), TrendArticleCandidate.id.asc())
+        )
+        return list(result.scalars().all())
+
     async def create_or_update_source_candidate(
         self,
         session: AsyncSession,
@@ -238,6 +338,28 @@ class TrendCandidateRepository:
         )
         return result.scalar_one_or_none()
 
+    async def reject_source_candidate(
+        self,
+        session: AsyncSession,
+        *,
+        candidate_id: int,
+        reviewed_by_user_id: int | None,
+        reviewed_at: datetime,
+    ) -> TrendCandidateMessageRef | None:
+        """Reject a candidate that is not rejected yet; None if nothing was updated."""
+        return await _update_returning_message_ref(
+            session,
+            update(TrendSourceCandidate)
+            .where(TrendSourceCandidate.id == candidate_id)
+            .where(TrendSourceCandidate.status != TrendCandidateStatus.REJECTED)
+            .values(
+                status=TrendCandidateStatus.REJECTED,
+                reviewed_by_user_id=reviewed_by_user_id,
+                reviewed_at=reviewed_at,
+            )
+            .returning(TrendSourceCandidate.group_chat_id, TrendSourceCandidate.message_id),
+        )
+
     async def get_source_candidate_by_topic_domain(
         self,
         session: AsyncSession,
@@ -290,3 +412,72 @@ class TrendCandidateRepository:
             .offset(max(offset, 0))
         )
         return list(result.scalars().all())
+
+    async def list_unannounced_source_candidates(
+        self,
+        session: AsyncSession,
+        *,
+        topic_ids: list[int],
+    ) -> list[TrendSourceCandidate]:
+        result = await session.execute(
+            select(TrendSourceCandidate)
+            .where(TrendSourceCandidate.topic_id.in_(topic_ids))
+            .where(TrendSourceCandidate.status == TrendCandidateStatus.PENDING)
+            .where(TrendSourceCandidate.message_id.is_(None))
+            .order_by(TrendSourceCandidate.score.desc(), TrendSourceCandidate.id.asc())
+        )
+        return list(result.scalars().all())
+
+    async def mark_article_candidates_announced(
+        self,
+        session: AsyncSession,
+        *,
+        announcements: list[TrendCandidateAnnouncement],
+    ) -> None:
+        await _mark_announced(session, TrendArticleCandidate.__table__, announcements)
+
+    async def mark_source_candidates_announced(
+        self,
+        session: AsyncSession,
+        *,
+        announcements: list[TrendCandidateAnnouncement],
+    ) -> None:
+        await _mark_announced(session, TrendSourceCandidate.__table__, announcements)
+
+
+async def _update_returning_message_ref(
+    session: AsyncSession,
+    statement,  # noqa: ANN001
+) -> TrendCandidateMessageRef | None:
+    result = await session.execute(statement.execution_options(synchronize_session=False))
+    row = result.one_or_none()
+    if row is None:
+        return None
+    return TrendCandidateMessageRef(group_chat_id=row[0], message_id=row[1])
+
+
+async def _mark_announced(
+    session: AsyncSession,
+    table,  # noqa: ANN001
+    announcements: list[TrendCandidateAnnouncement],
+) -> None:
+    if not announcements:
+        return
+    await session.execute(
+        update(table)
+        .where(table.c.id == bindparam("candidate_id"))
+        .values(
+            group_chat_id=bindparam("group_chat_id"),
+            topic_id_telegram=bindparam("topic_id_telegram"),
+            message_id=bindparam("message_id"),
+        ),
+        [
+            {
+                "candidate_id": item.candidate_id,
+                "group_chat_id": item.group_chat_id,
+                "topic_id_telegram": item.topic_id_telegram,
+                "message_id": item.message_id,
+            }
+            for item in announcements
+        ],
+    )
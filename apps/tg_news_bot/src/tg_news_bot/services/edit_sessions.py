@@ -209,8 +209,12 @@ class EditSessionService:
                 draft.post_message_id = None
             raise
 
-        await self._safe_delete(payload.chat_id, payload.message_id)
-        await self._finalize(session, active, EditSessionStatus.COMPLETED)
+        await self._finalize(
+            session,
+            active,
+            EditSessionStatus.COMPLETED,
+            extra_message_ids=[payload.message_id],
+        )
         return draft
 
     async def _update_post_message(
@@ -337,6 +341,8 @@ class EditSessionService:
         session: AsyncSession,
         edit_session: EditSession,
         status: EditSessionStatus,
+        *,
+        extra_message_ids: list[int] | None = None,
     ) -> None:
         edit_session.status = status
         instruction_id = edit_session.instruction_message_id
@@ -344,8 +350,26 @@ class EditSessionService:
         await session.flush()
         metrics.set_gauge("edit_sessions_active", 0)
 
+        message_ids = list(extra_message_ids or [])
         if instruction_id:
-            await self._safe_delete(edit_session.group_chat_id, instruction_id)
+            message_ids.append(instruction_id)
+        await self._delete_messages(edit_session.group_chat_id, message_ids)
+
+    async def _delete_messages(self, chat_id: int, message_ids: list[int]) -> None:
+        if not message_ids:
+            return
+        if len(message_ids) == 1:
+            await self._safe_delete(chat_id, message_ids[0])
+            return
+        try:
+            await self._publisher.delete_messages(chat_id=chat_id, message_ids=message_ids)
+        except PublisherNotFound:
+            return
+        except PublisherEditNotAllowed:
+            # The batch fails as a whole when one message is not deletable
+            # (e.g. an admin message without rights); remove the rest one by one.
+            for message_id in message_ids:
+                await self._safe_delete(chat_id, message_id)
 
     async def _safe_delete(self, chat_id: int, message_id: int) -> None:
         try:
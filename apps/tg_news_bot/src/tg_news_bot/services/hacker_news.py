@@ -0,0 +1,98 @@
+"""Hacker News API helpers shared by trend collectors."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import time
+
+import httpx
+import orjson
+
+
+HN_TOP_STORIES_URL = "https://hacker-news.firebaseio.com/v0/topstories.json"
+HN_ITEM_URL = "https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
+HN_ITEM_CONCURRENCY = 16
+HN_ITEM_CACHE_SIZE = 4096
+HN_ITEM_CACHE_TTL_SECONDS = 600.0
+
+
+class _ItemCache:
+    """Small TTL cache; the top-stories list changes slowly between collect cycles."""
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._rows: dict[int, tuple[float, dict]] = {}
+
+    def get(self, story_id: int) -> dict | None:
+        row = self._rows.get(story_id)
+        if row is None:
+            return None
+        expires_at, payload = row
+        if expires_at <= self._clock():
+            del self._rows[story_id]
+            return None
+        return payload
+
+    def put(self, story_id: int, payload: dict) -> None:
+        self._rows.pop(story_id, None)
+        if len(self._rows) >= self._maxsize:
+            del self._rows[next(iter(self._rows))]
+        self._rows[story_id] = (self._clock() + self._ttl_seconds, payload)
+
+    def clear(self) -> None:
+        self._rows.clear()
+
+
+_item_cache = _ItemCache(maxsize=HN_ITEM_CACHE_SIZE, ttl_seconds=HN_ITEM_CACHE_TTL_SECONDS)
+
+
+async def fetch_hn_top_story_ids(http: httpx.AsyncClient, *, limit: int) -> list[int]:
+    response = await http.get(HN_TOP_STORIES_URL)
+    response.raise_for_status()
+    story_ids: list[int] = []
+    for raw_id in list(orjson.loads(response.content) or [])[:limit]:
+        try:
+            story_ids.append(int(raw_id))
+        except (TypeError, ValueError):
+            continue
+    return story_ids
+
+
+async def fetch_hn_items(
+    http: httpx.AsyncClient,
+    story_ids: list[int],
+    *,
+    concurrency: int = HN_ITEM_CONCURRENCY,
+) -> list[dict | None]:
+    """Fetch story payloads concurrently; failed or empty items come back as None.
+
+    Payloads are shared through a process-wide TTL cache, so callers must not mutate them.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _fetch(story_id: int) -> dict | None:
+        cached = _item_cache.get(story_id)
+        if cached is not None:
+            return cached
+        async with semaphore:
+            try:
+                response = await http.get(HN_ITEM_URL.format(story_id=story_id))
+                response.raise_for_status()
+                payload = orjson.loads(response.content)
+            except Exception:
+                return None
+        if not isinstance(payload, dict):
+            return None
+        _item_cache.put(story_id, payload)
+        return payload
+
+    return list(await asyncio.gather(*(_fetch(story_id) for story_id in story_ids)))
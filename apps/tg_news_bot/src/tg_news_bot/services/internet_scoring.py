@@ -77,6 +77,7 @@ class InternetScoringService:
         self._log = get_logger(__name__)
         self._cached_context: InternetScoringContext | None = None
         self._cached_until: datetime | None = None
+        self._ranked_signals: tuple[dict[str, float], list[tuple[str, float]]] | None = None
 
     async def build_context(self) -> InternetScoringContext:
         now = datetime.now(timezone.utc)
@@ -187,19 +188,9 @@ class InternetScoringService:
 
         signal_hits: list[str] = []
         signal_score = 0.0
-        for keyword, weight in sorted(
-            signal_boosts.items(),
-            key=lambda item: item[1],
-            reverse=True,
-        ):
+        for keyword, applied in self._ranked_signal_boosts(signal_boosts):
             if keyword not in compact_text:
                 continue
-            applied = min(
-                float(weight) * self._settings.signal_keyword_multiplier,
-                self._settings.max_signal_boost_per_keyword,
-            )
-            if applied <= 0:
-                continue
             signal_hits.append(keyword)
             signal_score += applied
             if signal_score >= self._settings.max_total_signal_boost:
@@ -213,6 +204,23 @@ class InternetScoringService:
 
         return InternetScoreResult(total=score, components=components, signal_hits=signal_hits)
 
+    def _ranked_signal_boosts(self, signal_boosts: dict[str, float]) -> list[tuple[str, float]]:
+        # A scan scores every item against the same (never mutated) context dict,
+        # so sorting and capping run once per context rather than once per item.
+        cached = self._ranked_signals
+        if cached is not None and cached[0] is signal_boosts:
+            return cached[1]
+        ranked: list[tuple[str, float]] = []
+        for keyword, weight in sorted(signal_boosts.items(), key=lambda item: item[1], reverse=True):
+            applied = min(
+                float(weight) * self._settings.signal_keyword_multiplier,
+                self._settings.max_signal_boost_per_keyword,
+            )
+            if applied > 0:
+                ranked.append((keyword, applied))
+        self._ranked_signals = (signal_boosts, ranked)
+        return ranked
+
     async def _load_db_signal_boosts(self) -> dict[str, float]:
         if not self._settings.enabled:
             return {}
@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from telegram_publisher import ButtonSpec, keyboard_from_specs
 from tg_news_bot.config import PostFormattingSettings
 from tg_news_bot.db.models import Draft, DraftState
 from tg_news_bot.services.workflow_types import DraftAction
-from tg_news_bot.telegram.callbacks import build_callback
+from tg_news_bot.telegram.callbacks import build_callback, callback_prefix, encode_action
 
 _DEFAULT_FORMATTING = PostFormattingSettings()
+_STATE_KEYBOARD_CACHE_SIZE = 256
 
 
 def build_state_keyboard(draft: Draft, state: DraftState):
-    source_url = draft.normalized_url
+    return _state_keyboard(draft.id, state, draft.normalized_url)
+
+
+# The layout depends only on these three values, and the same keyboard is
+# rebuilt for every move, refresh and edit of a draft. Callers only read it.
+@lru_cache(maxsize=_STATE_KEYBOARD_CACHE_SIZE)
+def _state_keyboard(draft_id: int, state: DraftState, source_url: str):
     source_button = ButtonSpec(text="Источник", url=source_url)
 
     if state == DraftState.INBOX:
@@ -23,13 +31,13 @@ def build_state_keyboard(draft: Draft, state: DraftState):
             [
                 ButtonSpec(
                     text="В редакцию",
-                    callback_data=build_callback(draft.id, DraftAction.TO_EDITING),
+                    callback_data=build_callback(draft_id, DraftAction.TO_EDITING),
                 )
             ],
             [
                 ButtonSpec(
                     text="В архив",
-                    callback_data=build_callback(draft.id, DraftAction.TO_ARCHIVE),
+                    callback_data=build_callback(draft_id, DraftAction.TO_ARCHIVE),
                 )
             ],
             [source_button],
@@ -39,19 +47,19 @@ def build_state_keyboard(draft: Draft, state: DraftState):
             [
                 ButtonSpec(
                     text="Сделать выжимку",
-                    callback_data=build_callback(draft.id, "process_now"),
+                    callback_data=build_callback(draft_id, "process_now"),
                 )
             ],
             [
                 ButtonSpec(
                     text="В публикацию",
-                    callback_data=build_callback(draft.id, DraftAction.TO_READY),
+                    callback_data=build_callback(draft_id, DraftAction.TO_READY),
                 )
             ],
             [
                 ButtonSpec(
                     text="В архив",
-                    callback_data=build_callback(draft.id, DraftAction.TO_ARCHIVE),
+                    callback_data=build_callback(draft_id, DraftAction.TO_ARCHIVE),
                 )
             ],
             [source_button],
@@ -61,25 +69,25 @@ def build_state_keyboard(draft: Draft, state: DraftState):
             [
                 ButtonSpec(
                     text="Publish сейчас",
-                    callback_data=build_callback(draft.id, DraftAction.PUBLISH_NOW),
+                    callback_data=build_callback(draft_id, DraftAction.PUBLISH_NOW),
                 )
             ],
             [
                 ButtonSpec(
                     text="Schedule",
-                    callback_data=build_callback(draft.id, "schedule_open"),
+                    callback_data=build_callback(draft_id, "schedule_open"),
                 )
             ],
             [
                 ButtonSpec(
                     text="Edit",
-                    callback_data=build_callback(draft.id, DraftAction.TO_EDITING),
+                    callback_data=build_callback(draft_id, DraftAction.TO_EDITING),
                 )
             ],
             [
                 ButtonSpec(
                     text="В архив",
-                    callback_data=build_callback(draft.id, DraftAction.TO_ARCHIVE),
+                    callback_data=build_callback(draft_id, DraftAction.TO_ARCHIVE),
                 )
             ],
             [source_button],
@@ -89,25 +97,25 @@ def build_state_keyboard(draft: Draft, state: DraftState):
             [
                 ButtonSpec(
                     text="Изменить время",
-                    callback_data=build_callback(draft.id, "schedule_open"),
+                    callback_data=build_callback(draft_id, "schedule_open"),
                 )
             ],
             [
                 ButtonSpec(
                     text="Опубликовать сейчас",
-                    callback_data=build_callback(draft.id, DraftAction.PUBLISH_NOW),
+                    callback_data=build_callback(draft_id, DraftAction.PUBLISH_NOW),
                 )
             ],
             [
                 ButtonSpec(
                     text="Отменить",
-                    callback_data=build_callback(draft.id, DraftAction.CANCEL_SCHEDULE),
+                    callback_data=build_callback(draft_id, DraftAction.CANCEL_SCHEDULE),
                 )
             ],
             [
                 ButtonSpec(
                     text="В архив",
-                    callback_data=build_callback(draft.id, DraftAction.TO_ARCHIVE),
+                    callback_data=build_callback(draft_id, DraftAction.TO_ARCHIVE),
                 )
             ],
             [source_button],
@@ -117,19 +125,19 @@ def build_state_keyboard(draft: Draft, state: DraftState):
             [
                 ButtonSpec(
                     text="Repost",
-                    callback_data=build_callback(draft.id, DraftAction.REPOST),
+                    callback_data=build_callback(draft_id, DraftAction.REPOST),
                 )
             ],
             [
                 ButtonSpec(
                     text="В редакцию",
-                    callback_data=build_callback(draft.id, DraftAction.TO_EDITING),
+                    callback_data=build_callback(draft_id, DraftAction.TO_EDITING),
                 )
             ],
             [
                 ButtonSpec(
                     text="В архив",
-                    callback_data=build_callback(draft.id, DraftAction.TO_ARCHIVE),
+                    callback_data=build_callback(draft_id, DraftAction.TO_ARCHIVE),
                 )
             ],
             [source_button],
@@ -150,25 +158,28 @@ def build_schedule_keyboard(
 ):
     tz = ZoneInfo(timezone_name)
     local_now = now.astimezone(tz)
+    # Every button of a menu targets the same draft; format its head once.
+    prefix = callback_prefix(draft.id)
     tz_row = [
         ButtonSpec(
             text=f"TZ: {timezone_name}",
-            callback_data=build_callback(draft.id, "schedule_tz_info"),
+            callback_data=prefix + encode_action("schedule_tz_info"),
         )
     ]
 
+    at_head = prefix + encode_action("schedule_at_")
+    day_head = prefix + encode_action("schedule_day_")
+    time_head = prefix + encode_action("schedule_time_")
+
     def schedule_at(dt: datetime) -> str:
         ts = int(dt.astimezone(timezone.utc).timestamp())
-        return build_callback(draft.id, f"schedule_at_{ts}")
+        return f"{at_head}{ts}"
 
     def schedule_day(day_value: date) -> str:
-        return build_callback(draft.id, f"schedule_day_{day_value:%Y%m%d}")
+        return f"{day_head}{day_value:%Y%m%d}"
 
     def schedule_time(day_value: date, hour: int, minute: int) -> str:
-        return build_callback(
-            draft.id,
-            f"schedule_time_{day_value:%Y%m%d}_{hour:02d}{minute:02d}",
-        )
+        return f"{time_head}{day_value:%Y%m%d}_{hour:02d}{minute:02d}"
 
     if menu == "list":
         options: list[list[ButtonSpec]] = [tz_row]
@@ -180,7 +191,7 @@ def build_schedule_keyboard(
             [
                 ButtonSpec(
                     text="Назад",
-                    callback_data=build_callback(draft.id, "schedule_open"),
+                    callback_data=prefix + encode_action("schedule_open"),
                 )
             ]
         )
@@ -208,7 +219,7 @@ def build_schedule_keyboard(
             [
                 ButtonSpec(
                     text="Назад",
-                    callback_data=build_callback(draft.id, "schedule_open"),
+                    callback_data=prefix + encode_action("schedule_open"),
                 )
             ]
         )
@@ -253,7 +264,7 @@ def build_schedule_keyboard(
                 [
                     ButtonSpec(
                         text="На сегодня слотов нет",
-                        callback_data=build_callback(draft.id, "schedule_day_menu"),
+                        callback_data=prefix + encode_action("schedule_day_menu"),
                     )
                 ]
             )
@@ -268,7 +279,7 @@ def build_schedule_keyboard(
             [
                 ButtonSpec(
                     text="К датам",
-                    callback_data=build_callback(draft.id, "schedule_day_menu"),
+                    callback_data=prefix + encode_action("schedule_day_menu"),
                 )
             ]
         )
@@ -276,7 +287,7 @@ def build_schedule_keyboard(
             [
                 ButtonSpec(
                     text="Назад",
-                    callback_data=build_callback(draft.id, "schedule_open"),
+                    callback_data=prefix + encode_action("schedule_open"),
                 )
             ]
         )
@@ -290,18 +301,46 @@ def build_schedule_keyboard(
 
     tomorrow_10 = (local_now + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
     presets.append([ButtonSpec(text="Завтра 10:00", callback_data=schedule_at(tomorrow_10))])
-    presets.append([ButtonSpec(text="Выбрать вручную", callback_data=build_callback(draft.id, "schedule_list"))])
-    presets.append([ButtonSpec(text="Ввести вручную", callback_data=build_callback(draft.id, "schedule_manual_open"))])
-    presets.append([ButtonSpec(text="Отменить ввод", callback_data=build_callback(draft.id, "schedule_manual_cancel"))])
+    presets.append(
+        [
+            ButtonSpec(
+                text="Выбрать вручную",
+                callback_data=prefix + encode_action("schedule_list"),
+            )
+        ]
+    )
+    presets.append(
+        [
+            ButtonSpec(
+                text="Ввести вручную",
+                callback_data=prefix + encode_action("schedule_manual_open"),
+            )
+        ]
+    )
+    presets.append(
+        [
+            ButtonSpec(
+                text="Отменить ввод",
+                callback_data=prefix + encode_action("schedule_manual_cancel"),
+            )
+        ]
+    )
     presets.append(
         [
             ButtonSpec(
                 text="Дата и время",
-                callback_data=build_callback(draft.id, "schedule_day_menu"),
+                callback_data=prefix + encode_action("schedule_day_menu"),
+            )
+        ]
+    )
+    presets.append(
+        [
+            ButtonSpec(
+                text="Назад",
+                callback_data=prefix + encode_action("schedule_back"),
             )
         ]
     )
-    presets.append([ButtonSpec(text="Назад", callback_data=build_callback(draft.id, "schedule_back"))])
     return keyboard_from_specs(presets)
 
 
@@ -0,0 +1,70 @@
+"""Coalesce rapid reply-markup edits of the same message."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+
+from tg_news_bot.ports.publisher import PublisherPort
+
+DEFAULT_COALESCE_WINDOW_SECONDS = 0.05
+
+
+@dataclass(slots=True)
+class _PendingEdit:
+    keyboard: object
+    done: asyncio.Future
+    waiters: int = field(default=0)
+
+
+class ReplyMarkupCoalescer:
+    """Send only the latest keyboard for a message within a short window.
+
+    Menu navigation fires one edit per button press; when presses arrive
+    faster than the window, earlier keyboards are superseded and every caller
+    shares the outcome of the single edit that is actually sent.
+    """
+
+    def __init__(
+        self,
+        publisher: PublisherPort,
+        *,
+        window_seconds: float = DEFAULT_COALESCE_WINDOW_SECONDS,
+    ) -> None:
+        self._publisher = publisher
+        self._window_seconds = max(0.0, window_seconds)
+        self._pending: dict[tuple[int, int], _PendingEdit] = {}
+
+    async def submit(self, *, chat_id: int, message_id: int, keyboard) -> None:  # noqa: ANN001
+        key = (chat_id, message_id)
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.keyboard = keyboard
+            pending.waiters += 1
+            await asyncio.shield(pending.done)
+            return
+
+        pending = _PendingEdit(
+            keyboard=keyboard,
+            done=asyncio.get_running_loop().create_future(),
+        )
+        self._pending[key] = pending
+        try:
+            await asyncio.sleep(self._window_seconds)
+            # Later submits start a new window: this edit carries an older keyboard.
+            del self._pending[key]
+            await self._publisher.edit_reply_markup(
+                chat_id=chat_id,
+                message_id=message_id,
+                keyboard=pending.keyboard,
+            )
+        except BaseException as exc:
+            if self._pending.get(key) is pending:
+                del self._pending[key]
+            if pending.waiters:
+                if isinstance(exc, asyncio.CancelledError):
+                    pending.done.cancel()
+                else:
+                    pending.done.set_exception(exc)
+            raise
+        pending.done.set_result(None)
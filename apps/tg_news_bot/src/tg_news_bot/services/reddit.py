@@ -0,0 +1,49 @@
+"""Reddit listing helpers shared by trend collectors."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import httpx
+import orjson
+
+
+REDDIT_USER_AGENT = "tg-news-bot/1.0"
+
+
+@dataclass(slots=True)
+class RedditPost:
+    title: str
+    url: str
+    selftext: str
+    created_utc: int | None
+
+
+async def fetch_reddit_posts(http: httpx.AsyncClient, url: str, *, limit: int) -> list[RedditPost]:
+    response = await http.get(url, headers={"User-Agent": REDDIT_USER_AGENT})
+    response.raise_for_status()
+    return parse_reddit_listing(response.content, limit=limit)
+
+
+def parse_reddit_listing(content: bytes, *, limit: int) -> list[RedditPost]:
+    """Pick the four fields the collectors use out of a listing; non-dict children are skipped."""
+    payload = orjson.loads(content)
+    listing = payload.get("data") if isinstance(payload, dict) else None
+    children = listing.get("children") if isinstance(listing, dict) else None
+    if not isinstance(children, list):
+        return []
+    posts: list[RedditPost] = []
+    for child in children[:limit]:
+        data = child.get("data") if isinstance(child, dict) else None
+        if not isinstance(data, dict):
+            continue
+        created_utc = data.get("created_utc")
+        posts.append(
+            RedditPost(
+                title=str(data.get("title") or ""),
+                url=str(data.get("url") or ""),
+                selftext=str(data.get("selftext") or ""),
+                created_utc=int(created_utc) if created_utc else None,
+            )
+        )
+    return posts
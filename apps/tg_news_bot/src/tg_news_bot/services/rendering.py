@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from html import escape
 import re
 
@@ -42,6 +43,15 @@ _CANONICAL_HASHTAGS = {
     "technology": "technology",
     "tech": "technology",
 }
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+_OPEN_ANCHOR_RE = re.compile(r"<a\s+[^>]*>")
+_TAG_INVALID_CHARS_RE = re.compile(r"[^0-9a-zA-Zа-яА-ЯёЁ_]+")
+_CYRILLIC_RE = re.compile(r"[а-яё]")
+_SOURCE_LINE_RE = re.compile(
+    r"^\s*источник\s*[:(]?\s*(?P<url>https?://\S+)?\s*\)?\s*$", re.IGNORECASE
+)
+_URL_ONLY_LINE_RE = re.compile(r"^\s*https?://\S+\s*$", re.IGNORECASE)
+_SPLIT_CACHE_SIZE = 512
 _HASHTAG_STOPWORDS = {
     "update",
     "updates",
@@ -156,7 +166,7 @@ def _truncate_html_preserving_tags(text: str, *, max_len: int) -> str:
     clipped = _trim_unfinished_html_tag(clipped)
 
     open_b = clipped.count("<b>") - clipped.count("</b>")
-    open_a = len(re.findall(r"<a\s+[^>]*>", clipped)) - clipped.count("</a>")
+    open_a = len(_OPEN_ANCHOR_RE.findall(clipped)) - clipped.count("</a>")
     suffix = ""
     if open_a > 0:
         suffix += "</a>" * open_a
@@ -283,16 +293,29 @@ def _reason_label(key: str) -> str:
 
 
 def _split_title_body(draft: Draft) -> tuple[str, str]:
-    raw = _normalize_escaped_whitespace((draft.post_text_ru or "").strip())
-    raw = _remove_trailing_source(raw, normalized_url=draft.normalized_url)
-    title_fallback = _normalize_escaped_whitespace(
-        (draft.title_en or "").strip()
-    ) or DEFAULT_TITLE
+    return _split_title_body_text(
+        draft.post_text_ru or "",
+        draft.title_en or "",
+        draft.normalized_url,
+    )
+
+
+# POST content is rendered on every move and refresh of a draft; the split is
+# keyed on the exact strings it reads, so edits can never hit a stale entry.
+@lru_cache(maxsize=_SPLIT_CACHE_SIZE)
+def _split_title_body_text(
+    post_text: str,
+    title_en: str,
+    normalized_url: str,
+) -> tuple[str, str]:
+    raw = _normalize_escaped_whitespace(post_text.strip())
+    raw = _remove_trailing_source(raw, normalized_url=normalized_url)
+    title_fallback = _normalize_escaped_whitespace(title_en.strip()) or DEFAULT_TITLE
 
     if not raw:
         return title_fallback, DEFAULT_BODY
 
-    parts = [part.strip() for part in re.split(r"\n\s*\n", raw, maxsplit=1)]
+    parts = [part.strip() for part in _PARAGRAPH_BREAK_RE.split(raw, maxsplit=1)]
     if len(parts) == 2 and parts[0]:
         title = parts[0]
         body = parts[1] or DEFAULT_BODY
@@ -401,7 +424,7 @@ def _iter_tag_variants(value: str, *, mode: str) -> list[str]:
 
 
 def _normalize_tag(value: str) -> str:
-    text = re.sub(r"[^0-9a-zA-Zа-яА-ЯёЁ_]+", "_", value.strip().lower()).strip("_")
+    text = _TAG_INVALID_CHARS_RE.sub("_", value.strip().lower()).strip("_")
     if not text:
         return ""
     if text[0].isdigit():
@@ -436,7 +459,7 @@ def _normalize_hashtag_mode(value: str) -> str:
 
 
 def _contains_cyrillic(value: str) -> bool:
-    return bool(re.search(r"[а-яё]", value.lower()))
+    return bool(_CYRILLIC_RE.search(value.lower()))
 
 
 def _normalize_escaped_whitespace(value: str) -> str:
@@ -456,21 +479,19 @@ def _remove_trailing_source(value: str, *, normalized_url: str) -> str:
         return value
 
     known_url = normalized_url.strip()
-    source_re = re.compile(r"^\s*источник\s*[:(]?\s*(?P<url>https?://\S+)?\s*\)?\s*$", re.IGNORECASE)
-    url_only_re = re.compile(r"^\s*https?://\S+\s*$", re.IGNORECASE)
 
     while lines:
         candidate = lines[-1].strip()
         if not candidate:
             lines.pop()
             continue
-        source_match = source_re.match(candidate)
+        source_match = _SOURCE_LINE_RE.match(candidate)
         if source_match:
             url = (source_match.group("url") or "").rstrip(").,")
             if not url or not known_url or url.startswith(known_url):
                 lines.pop()
                 continue
-        if url_only_re.match(candidate):
+        if _URL_ONLY_LINE_RE.match(candidate):
             clean_url = candidate.rstrip(").,")
             if not known_url or clean_url.startswith(known_url):
                 lines.pop()
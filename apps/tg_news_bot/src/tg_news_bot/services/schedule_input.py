@@ -32,6 +32,7 @@ class ScheduleInputService:
         self._session_factory = session_factory
         self._workflow = workflow
         self._timezone_name = timezone_name
+        self._tz = ZoneInfo(timezone_name)
         self._ttl_minutes = ttl_minutes
         self._repo = repository or ScheduleInputSessionRepository()
 
@@ -103,7 +104,7 @@ class ScheduleInputService:
             async with session.begin():
                 await self._repo.complete(session, session_id=active.id)
 
-        local_schedule = schedule_at.astimezone(ZoneInfo(self._timezone_name))
+        local_schedule = schedule_at.astimezone(self._tz)
         return ScheduleInputResult(
             accepted=True,
             message=f"Запланировано на {local_schedule:%d.%m.%Y %H:%M} ({self._timezone_name})",
@@ -119,7 +120,7 @@ class ScheduleInputService:
         if not raw:
             return None, "Отправьте дату и время"
 
-        tz = ZoneInfo(self._timezone_name)
+        tz = self._tz
         formats = [
             "%d.%m.%Y %H:%M",
             "%Y-%m-%d %H:%M",
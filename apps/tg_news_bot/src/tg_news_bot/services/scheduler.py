@@ -60,6 +60,8 @@ class SchedulerRunner:
 
     async def _process_due(self) -> None:
         now = datetime.now(timezone.utc)
+        superseded: list[tuple[int, list[int]]] = []
+        published_ids: list[int] = []
         async with self._session_factory() as session:
             async with session.begin():
                 await self._recover_failed_jobs(session, now=now)
@@ -82,22 +84,24 @@ class SchedulerRunner:
                         continue
 
                     try:
+                        post_content = await self._workflow._render_post_content(draft)
                         if not draft.published_message_id:
-                            await self._workflow._publish_now(session, draft, settings)
-                        await self._workflow._move_in_group(
-                            session=session,
+                            await self._workflow._publish_now(
+                                draft, settings, post_content=post_content
+                            )
+                        old_ids = await self._workflow._move_in_group(
                             draft=draft,
                             settings=settings,
                             target_state=DraftState.PUBLISHED,
+                            post_content=post_content,
                         )
+                        if old_ids:
+                            superseded.append((draft.group_chat_id, old_ids))
                         draft.state = DraftState.PUBLISHED
                         scheduled.status = ScheduledPostStatus.PUBLISHED
                         scheduled.last_error = None
                         scheduled.next_retry_at = None
-                        await self._publish_failure_repo.mark_resolved_for_draft(
-                            session,
-                            draft_id=draft.id,
-                        )
+                        published_ids.append(draft.id)
                         metrics.inc_counter("scheduler_publish_success_total")
                     except Exception:
                         scheduled.attempts = int(scheduled.attempts or 0) + 1
@@ -141,6 +145,15 @@ class SchedulerRunner:
                             ),
                         )
 
+                # One UPDATE ... IN for the whole batch instead of one per draft.
+                await self._publish_failure_repo.mark_resolved_for_drafts(
+                    session,
+                    draft_ids=published_ids,
+                )
+
+        for chat_id, old_ids in superseded:
+            await self._workflow._delete_messages(chat_id, old_ids)
+
     async def _recover_failed_jobs(self, session: AsyncSession, *, now: datetime) -> None:
         recover_from = now - timedelta(seconds=self._config.recover_failed_after_seconds)
         failed = await self._scheduled_repo.list_failed_without_retry_for_update(
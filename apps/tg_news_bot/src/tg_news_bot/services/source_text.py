@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import re
 
 
+_SANITIZE_CACHE_SIZE = 64
+_INLINE_META_PREFIX_RE = re.compile(r"(?is)^\s*date\s*:\s*.*?\bsource\s*:\s*.*?\bsummary\s*:\s*")
 _BULLET_PREFIX_RE = re.compile(r"^\s*[-*•\u2013\u2014]+\s*")
 _META_LABEL_RE = re.compile(r"(?i)^(date|source|summary|share)\s*:\s*(.*)$")
 _SEPARATOR_RE = re.compile(r"^\s*[-*•\u2013\u2014]+\s*$")
@@ -35,16 +38,17 @@ def _parse_meta_label(line: str) -> tuple[str, str] | None:
 def sanitize_source_text(text: str | None) -> str:
     if not text:
         return ""
+    return _sanitize_cached(text)
 
+
+# The same stored article text is sanitized again by every editing run and by
+# the quality gate on TO_READY; remember the most recent results.
+@lru_cache(maxsize=_SANITIZE_CACHE_SIZE)
+def _sanitize_cached(text: str) -> str:
     cleaned = text.strip()
     # Inline metadata prefix from some sources:
     # "Date: ... Source: ... Summary: ...<content>"
-    cleaned = re.sub(
-        r"(?is)^\s*date\s*:\s*.*?\bsource\s*:\s*.*?\bsummary\s*:\s*",
-        "",
-        cleaned,
-        count=1,
-    ).strip()
+    cleaned = _INLINE_META_PREFIX_RE.sub("", cleaned, count=1).strip()
     cleaned = _NATURE_BROWSER_NOTICE_RE.sub("", cleaned).strip()
     cleaned = _NATURE_ACCESS_OPTIONS_RE.sub("", cleaned).strip()
 
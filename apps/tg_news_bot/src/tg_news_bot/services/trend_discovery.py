@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+import heapq
 import html
+from itertools import chain
 import re
 from urllib.parse import urljoin, urlparse
 
 import feedparser
 import httpx
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from telegram_publisher import ButtonSpec, keyboard_from_specs
+from telegram_publisher.types import SendResult
 from tg_news_bot.config import Settings, TrendDiscoveryProfileSettings
 from tg_news_bot.db.models import (
     BotSettings,
@@ -35,6 +38,7 @@ from tg_news_bot.repositories.bot_settings import BotSettingsRepository
 from tg_news_bot.repositories.sources import SourceRepository
 from tg_news_bot.repositories.trend_candidates import (
     TrendArticleCandidateInput,
+    TrendCandidateAnnouncement,
     TrendCandidateRepository,
     TrendSourceCandidateInput,
     TrendTopicInput,
@@ -43,17 +47,46 @@ from tg_news_bot.repositories.trend_topic_profiles import (
     TrendTopicProfileInput,
     TrendTopicProfileRepository,
 )
+from tg_news_bot.services.hacker_news import fetch_hn_items, fetch_hn_top_story_ids
 from tg_news_bot.services.internet_scoring import (
     InternetScoringContext,
     InternetScoringService,
 )
+from tg_news_bot.services.reddit import fetch_reddit_posts
 from tg_news_bot.services.text_generation import OpenAICompatClient
-from tg_news_bot.utils.url import extract_domain, normalize_url
+from tg_news_bot.utils.feeds import FeedEntry, stream_feed_entries
+from tg_news_bot.utils.http import create_http_client
+from tg_news_bot.utils.url import extract_domain, normalize_parsed_url
 
 if False:  # pragma: no cover
     from tg_news_bot.services.ingestion import IngestionRunner
 
 
+_WS_RE = re.compile(r"\s+")
+_HTTP_URL_RE = re.compile(r"https?://[^/?#]", re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r"(?is)<[^>]+>")
+_SLUG_RE = re.compile(r"[^0-9a-zA-Zа-яА-Я]+")
+
+
+_ARTICLE_CARD_TEMPLATE = (
+    "<b>Кандидат трендовой статьи #{id}</b>\n"
+    "topic_id: {topic_id}\n"
+    "оценка: {score:.2f}\n"
+    "домен: {domain}\n"
+    "заголовок: {title}\n"
+    "{snippet_line}"
+    "ссылка: {url}"
+)
+_SOURCE_CARD_TEMPLATE = (
+    "<b>Кандидат трендового источника #{id}</b>\n"
+    "topic_id: {topic_id}\n"
+    "оценка: {score:.2f}\n"
+    "домен: {domain}"
+    "{link_line}"
+    "{mentions_line}"
+)
+
+
 @dataclass(slots=True)
 class NetworkTrendItem:
     title: str
@@ -97,6 +130,21 @@ class TrendCandidateActionResult:
     source_id: int | None = None
 
 
+@dataclass(slots=True)
+class _ProfileMatcher:
+    config: TrendDiscoveryProfileSettings
+    seed_pattern: re.Pattern[str] | None
+    trusted_domains: frozenset[str]
+
+    @classmethod
+    def build(cls, config: TrendDiscoveryProfileSettings) -> _ProfileMatcher:
+        return cls(
+            config=config,
+            seed_pattern=_keyword_pattern(config.seed_keywords),
+            trusted_domains=frozenset(value.lower() for value in config.trusted_domains),
+        )
+
+
 class TrendDiscoveryService:
     def __init__(
         self,
@@ -126,6 +174,7 @@ class TrendDiscoveryService:
         )
         self._log = get_logger(__name__)
         self._llm_client = self._build_llm_client()
+        self._http: httpx.AsyncClient | None = None
 
     def _build_llm_client(self) -> OpenAICompatClient | None:
         discovery = self._settings.trend_discovery
@@ -235,6 +284,9 @@ class TrendDiscoveryService:
                 trust_by_domain = self._build_trust_by_domain(existing_sources)
                 known_domains = set(trust_by_domain.keys())
 
+                max_articles_per_topic = discovery.max_articles_per_topic
+                max_sources_per_topic = discovery.max_sources_per_topic
+                snippet_chars = discovery.article_snippet_chars
                 topic_candidates = await self._build_topic_candidates(
                     items=items,
                     profiles=profiles,
@@ -259,7 +311,7 @@ class TrendDiscoveryService:
                     topic_ids.append(topic.id)
 
                     min_article_score = float(profile.min_article_score or 0.0)
-                    for row in matched[: discovery.max_articles_per_topic]:
+                    for row in matched[:max_articles_per_topic]:
                         if row.score < min_article_score:
                             continue
                         candidate = await self._candidates_repo.create_or_update_article_candidate(
@@ -270,7 +322,7 @@ class TrendDiscoveryService:
                                 url=row.item.url,
                                 normalized_url=row.item.normalized_url,
                                 domain=row.item.domain,
-                                snippet=_trim(row.item.summary, discovery.article_snippet_chars),
+                                snippet=_trim(row.item.summary, snippet_chars),
                                 score=row.score,
                                 reasons={
                                     "seed_hits": row.seed_hits,
@@ -292,7 +344,7 @@ class TrendDiscoveryService:
                     source_candidates = self._build_source_candidates(
                         matched_items=matched,
                         known_domains=known_domains,
-                        max_items=discovery.max_sources_per_topic,
+                        max_items=max_sources_per_topic,
                     )
                     for source_payload in source_candidates:
                         source_candidate = await self._candidates_repo.create_or_update_source_candidate(
@@ -400,52 +452,59 @@ class TrendDiscoveryService:
 
         ingest_result = await self._ingestion_runner.ingest_url(url=url)
         reviewed_at = datetime.now(timezone.utc)
+        reviewed_by_user_id = user_id if user_id > 0 else None
 
         async with self._session_factory() as session:
             async with session.begin():
-                candidate = await self._candidates_repo.get_article_candidate(session, candidate_id)
-                if candidate is None:
-                    return TrendCandidateActionResult(False, f"Кандидат статьи #{candidate_id} не найден.")
-                candidate.reviewed_by_user_id = user_id if user_id > 0 else None
-                candidate.reviewed_at = reviewed_at
                 if ingest_result.created:
-                    candidate.status = TrendCandidateStatus.INGESTED
-                    candidate.draft_id = ingest_result.draft_id
-                    await session.flush()
-                    await self._clear_candidate_keyboard(candidate.group_chat_id, candidate.message_id)
-                    if ingest_result.draft_id is None:
-                        return TrendCandidateActionResult(True, "Статья отправлена во Входящие.")
-                    return TrendCandidateActionResult(
-                        True,
-                        f"Статья отправлена во Входящие как Draft #{ingest_result.draft_id}",
+                    message_ref = await self._candidates_repo.mark_article_candidate_ingested(
+                        session,
+                        candidate_id=candidate_id,
                         draft_id=ingest_result.draft_id,
+                        reviewed_by_user_id=reviewed_by_user_id,
+                        reviewed_at=reviewed_at,
                     )
-                candidate.status = TrendCandidateStatus.FAILED
-                reasons = candidate.reasons if isinstance(candidate.reasons, dict) else {}
-                reasons["last_ingest_reason"] = ingest_result.reason
-                candidate.reasons = reasons
-                await session.flush()
-                await self._clear_candidate_keyboard(candidate.group_chat_id, candidate.message_id)
+                else:
+                    message_ref = await self._candidates_repo.mark_article_candidate_failed(
+                        session,
+                        candidate_id=candidate_id,
+                        reason=ingest_result.reason,
+                        reviewed_by_user_id=reviewed_by_user_id,
+                        reviewed_at=reviewed_at,
+                    )
+        if message_ref is None:
+            return TrendCandidateActionResult(False, f"Кандидат статьи #{candidate_id} не найден.")
+        await self._clear_candidate_keyboard(message_ref.group_chat_id, message_ref.message_id)
 
+        if not ingest_result.created:
+            return TrendCandidateActionResult(
+                False,
+                f"Не удалось загрузить статью: {ingest_result.reason or 'unknown'}",
+            )
+        if ingest_result.draft_id is None:
+            return TrendCandidateActionResult(True, "Статья отправлена во Входящие.")
         return TrendCandidateActionResult(
-            False,
-            f"Не удалось загрузить статью: {ingest_result.reason or 'unknown'}",
+            True,
+            f"Статья отправлена во Входящие как Draft #{ingest_result.draft_id}",
+            draft_id=ingest_result.draft_id,
         )
 
     async def reject_article_candidate(self, *, candidate_id: int, user_id: int) -> TrendCandidateActionResult:
         reviewed_at = datetime.now(timezone.utc)
         async with self._session_factory() as session:
             async with session.begin():
-                candidate = await self._candidates_repo.get_article_candidate(session, candidate_id)
-                if candidate is None:
-                    return TrendCandidateActionResult(False, f"Кандидат статьи #{candidate_id} не найден.")
-                if candidate.status == TrendCandidateStatus.REJECTED:
+                message_ref = await self._candidates_repo.reject_article_candidate(
+                    session,
+                    candidate_id=candidate_id,
+                    reviewed_by_user_id=user_id if user_id > 0 else None,
+                    reviewed_at=reviewed_at,
+                )
+                if message_ref is None:
+                    candidate = await self._candidates_repo.get_article_candidate(session, candidate_id)
+                    if candidate is None:
+                        return TrendCandidateActionResult(False, f"Кандидат статьи #{candidate_id} не найден.")
                     return TrendCandidateActionResult(True, "Кандидат уже отклонён.")
-                candidate.status = TrendCandidateStatus.REJECTED
-                candidate.reviewed_by_user_id = user_id if user_id > 0 else None
-                candidate.reviewed_at = reviewed_at
-                await session.flush()
-                await self._clear_candidate_keyboard(candidate.group_chat_id, candidate.message_id)
+        await self._clear_candidate_keyboard(message_ref.group_chat_id, message_ref.message_id)
         return TrendCandidateActionResult(True, f"Кандидат статьи #{candidate_id} отклонён.")
 
     async def add_source_candidate(
@@ -520,16 +579,18 @@ class TrendDiscoveryService:
         reviewed_at = datetime.now(timezone.utc)
         async with self._session_factory() as session:
             async with session.begin():
-                candidate = await self._candidates_repo.get_source_candidate(session, candidate_id)
-                if candidate is None:
-                    return TrendCandidateActionResult(False, f"Кандидат источника #{candidate_id} не найден.")
-                if candidate.status == TrendCandidateStatus.REJECTED:
+                message_ref = await self._candidates_repo.reject_source_candidate(
+                    session,
+                    candidate_id=candidate_id,
+                    reviewed_by_user_id=user_id if user_id > 0 else None,
+                    reviewed_at=reviewed_at,
+                )
+                if message_ref is None:
+                    candidate = await self._candidates_repo.get_source_candidate(session, candidate_id)
+                    if candidate is None:
+                        return TrendCandidateActionResult(False, f"Кандидат источника #{candidate_id} не найден.")
                     return TrendCandidateActionResult(True, "Кандидат уже отклонён.")
-                candidate.status = TrendCandidateStatus.REJECTED
-                candidate.reviewed_by_user_id = user_id if user_id > 0 else None
-                candidate.reviewed_at = reviewed_at
-                await session.flush()
-                await self._clear_candidate_keyboard(candidate.group_chat_id, candidate.message_id)
+        await self._clear_candidate_keyboard(message_ref.group_chat_id, message_ref.message_id)
         return TrendCandidateActionResult(True, f"Кандидат источника #{candidate_id} отклонён.")
 
     async def publish_pending_candidates(self, *, topic_ids: list[int]) -> int:
@@ -543,117 +604,179 @@ class TrendDiscoveryService:
         if topic_id is None:
             return 0
 
-        sent = 0
-        async with self._session_factory() as session:
-            async with session.begin():
-                article_rows = list(
-                    (
-                        await session.execute(
-                            select(TrendArticleCandidate)
-                            .where(TrendArticleCandidate.topic_id.in_(topic_ids))
-                            .where(TrendArticleCandidate.status == TrendCandidateStatus.PENDING)
-                            .where(TrendArticleCandidate.message_id.is_(None))
-                            .order_by(TrendArticleCandidate.score.desc(), TrendArticleCandidate.id.asc())
-                        )
-                    ).scalars().all()
+        # AsyncSession is not safe for concurrent use, so each query gets its own session.
+        article_rows, source_rows = await asyncio.gather(
+            self._list_unannounced_articles(topic_ids),
+            self._list_unannounced_sources(topic_ids),
+        )
+
+        publisher = self._publisher
+        chat_id = settings.group_chat_id
+        concurrency = self._settings.trend_discovery.publish_concurrency
+        semaphore = asyncio.Semaphore(concurrency)
+        async with asyncio.TaskGroup() as group:
+            article_tasks = [
+                group.create_task(
+                    self._send_candidate_card(
+                        publisher,
+                        semaphore,
+                        chat_id=chat_id,
+                        topic_id=topic_id,
+                        text=self._render_article_card(row),
+                        keyboard=self._article_card_keyboard(row),
+                        candidate_id=row.id,
+                        failure_event="trend_discovery.publish_article_candidate_failed",
+                    )
                 )
-                source_rows = list(
-                    (
-                        await session.execute(
-                            select(TrendSourceCandidate)
-                            .where(TrendSourceCandidate.topic_id.in_(topic_ids))
-                            .where(TrendSourceCandidate.status == TrendCandidateStatus.PENDING)
-                            .where(TrendSourceCandidate.message_id.is_(None))
-                            .order_by(TrendSourceCandidate.score.desc(), TrendSourceCandidate.id.asc())
-                        )
-                    ).scalars().all()
+                for row in article_rows
+            ]
+            source_tasks = [
+                group.create_task(
+                    self._send_candidate_card(
+                        publisher,
+                        semaphore,
+                        chat_id=chat_id,
+                        topic_id=topic_id,
+                        text=self._render_source_card(row),
+                        keyboard=self._source_card_keyboard(row),
+                        candidate_id=row.id,
+                        failure_event="trend_discovery.publish_source_candidate_failed",
+                    )
                 )
+                for row in source_rows
+            ]
 
-        for row in article_rows:
-            keyboard = keyboard_from_specs(
-                [
-                    [
-                        ButtonSpec(text="Добавить во входящие", callback_data=f"trend:article:{row.id}:ingest"),
-                        ButtonSpec(text="Отклонить", callback_data=f"trend:article:{row.id}:reject"),
-                    ],
-                    [ButtonSpec(text="Открыть статью", url=row.url)],
-                ]
-            )
-            try:
-                result = await self._publisher.send_text(
-                    chat_id=settings.group_chat_id,
-                    topic_id=topic_id,
-                    text=self._render_article_card(row),
-                    keyboard=keyboard,
-                    parse_mode="HTML",
-                )
-            except Exception:
-                self._log.exception("trend_discovery.publish_article_candidate_failed", candidate_id=row.id)
-                continue
-            sent += 1
+        article_announcements = _announcements(article_rows, article_tasks, topic_id)
+        source_announcements = _announcements(source_rows, source_tasks, topic_id)
+        sent = len(article_announcements) + len(source_announcements)
+        if sent:
             async with self._session_factory() as session:
                 async with session.begin():
-                    current = await self._candidates_repo.get_article_candidate(session, row.id)
-                    if current is None:
-                        continue
-                    current.group_chat_id = result.chat_id
-                    current.topic_id_telegram = topic_id
-                    current.message_id = result.message_id
-                    await session.flush()
-
-        for row in source_rows:
-            source_url = self._normalize_source_url(row.source_url or f"https://{row.domain}")
-            keyboard = keyboard_from_specs(
-                [
-                    [
-                        ButtonSpec(text="Добавить источник", callback_data=f"trend:source:{row.id}:add"),
-                        ButtonSpec(text="Отклонить", callback_data=f"trend:source:{row.id}:reject"),
-                    ],
-                    [ButtonSpec(text="Открыть сайт", url=source_url)],
-                ]
-            )
+                    await self._candidates_repo.mark_article_candidates_announced(
+                        session,
+                        announcements=article_announcements,
+                    )
+                    await self._candidates_repo.mark_source_candidates_announced(
+                        session,
+                        announcements=source_announcements,
+                    )
+
+        return sent
+
+    async def _send_candidate_card(
+        self,
+        publisher: PublisherPort,
+        semaphore: asyncio.Semaphore,
+        *,
+        chat_id: int,
+        topic_id: int,
+        text: str,
+        keyboard,  # noqa: ANN001
+        candidate_id: int,
+        failure_event: str,
+    ) -> SendResult | None:
+        async with semaphore:
             try:
-                result = await self._publisher.send_text(
-                    chat_id=settings.group_chat_id,
+                return await publisher.send_text(
+                    chat_id=chat_id,
                     topic_id=topic_id,
-                    text=self._render_source_card(row),
+                    text=text,
                     keyboard=keyboard,
                     parse_mode="HTML",
                 )
             except Exception:
-                self._log.exception("trend_discovery.publish_source_candidate_failed", candidate_id=row.id)
-                continue
-            sent += 1
-            async with self._session_factory() as session:
-                async with session.begin():
-                    current = await self._candidates_repo.get_source_candidate(session, row.id)
-                    if current is None:
-                        continue
-                    current.group_chat_id = result.chat_id
-                    current.topic_id_telegram = topic_id
-                    current.message_id = result.message_id
-                    await session.flush()
+                self._log.exception(failure_event, candidate_id=candidate_id)
+                return None
 
-        return sent
+    @staticmethod
+    def _article_card_keyboard(row: TrendArticleCandidate):  # noqa: ANN205
+        return keyboard_from_specs(
+            [
+                [
+                    ButtonSpec(text="Добавить во входящие", callback_data=f"trend:article:{row.id}:ingest"),
+                    ButtonSpec(text="Отклонить", callback_data=f"trend:article:{row.id}:reject"),
+                ],
+                [ButtonSpec(text="Открыть статью", url=row.url)],
+            ]
+        )
+
+    def _source_card_keyboard(self, row: TrendSourceCandidate):  # noqa: ANN201
+        source_url = self._normalize_source_url(row.source_url or f"https://{row.domain}")
+        return keyboard_from_specs(
+            [
+                [
+                    ButtonSpec(text="Добавить источник", callback_data=f"trend:source:{row.id}:add"),
+                    ButtonSpec(text="Отклонить", callback_data=f"trend:source:{row.id}:reject"),
+                ],
+                [ButtonSpec(text="Открыть сайт", url=source_url)],
+            ]
+        )
+
+    async def _list_unannounced_articles(self, topic_ids: list[int]) -> list[TrendArticleCandidate]:
+        async with self._session_factory() as session:
+            async with session.begin():
+                return await self._candidates_repo.list_unannounced_article_candidates(
+                    session,
+                    topic_ids=topic_ids,
+                )
+
+    async def _list_unannounced_sources(self, topic_ids: list[int]) -> list[TrendSourceCandidate]:
+        async with self._session_factory() as session:
+            async with session.begin():
+                return await self._candidates_repo.list_unannounced_source_candidates(
+                    session,
+                    topic_ids=topic_ids,
+                )
+
+    def _get_http(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = create_http_client()
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def _collect_network_items(self, *, since: datetime) -> list[NetworkTrendItem]:
         limit = self._settings.trend_discovery.item_limit_per_source
-        rows: list[NetworkTrendItem] = []
-        async with httpx.AsyncClient(timeout=20, follow_redirects=True) as http:
-            rows.extend(await self._collect_arxiv(http, since, limit))
-            rows.extend(await self._collect_hn(http, since, limit))
-            rows.extend(await self._collect_reddit(http, since, limit))
-            rows.extend(await self._collect_x(http, since, limit))
-            rows.extend(await self._collect_github_trending(http, since, limit))
-            rows.extend(await self._collect_steam_charts(http, since, limit))
-            rows.extend(await self._collect_boxoffice(http, since, limit))
-
-        dedup: dict[str, NetworkTrendItem] = {}
-        for item in rows:
-            current = dedup.get(item.normalized_url)
-            if current is None or item.observed_at > current.observed_at:
-                dedup[item.normalized_url] = item
-        return list(dedup.values())
+        http = self._get_http()
+        collectors = (
+            self._collect_arxiv,
+            self._collect_hn,
+            self._collect_reddit,
+            self._collect_x,
+            self._collect_github_trending,
+            self._collect_steam_charts,
+            self._collect_boxoffice,
+        )
+
+        async def _indexed(index: int, collect) -> tuple[int, list[NetworkTrendItem]]:  # noqa: ANN001
+            return index, await collect(http, since, limit)
+
+        # Collectors handle their own fetch errors, so they run concurrently and
+        # each batch is folded into the dedup map as soon as it completes; items
+        # that lose dedup are released without waiting for the slowest collector.
+        # Entries carry (collector, position) keys so that ties and the output
+        # order stay the same as a sequential pass in collector order.
+        dedup: dict[str, tuple[NetworkTrendItem, tuple[int, int], tuple[int, int]]] = {}
+        for next_batch in asyncio.as_completed(
+            [_indexed(index, collect) for index, collect in enumerate(collectors)]
+        ):
+            index, batch = await next_batch
+            for position, item in enumerate(batch):
+                order = (index, position)
+                current = dedup.get(item.normalized_url)
+                if current is None:
+                    dedup[item.normalized_url] = (item, order, order)
+                    continue
+                current_item, current_order, first_order = current
+                if item.observed_at > current_item.observed_at or (
+                    item.observed_at == current_item.observed_at and order < current_order
+                ):
+                    current_item, current_order = item, order
+                dedup[item.normalized_url] = (current_item, current_order, min(first_order, order))
+        return [row[0] for row in sorted(dedup.values(), key=lambda row: row[2])]
 
     async def _collect_arxiv(
         self,
@@ -661,30 +784,46 @@ class TrendDiscoveryService:
         since: datetime,
         limit: int,
     ) -> list[NetworkTrendItem]:
-        items: list[NetworkTrendItem] = []
         feeds = list(self._settings.trends.arxiv_feeds)
         per_feed = max(5, limit // max(len(feeds), 1))
-        for feed_url in feeds:
-            try:
+        batches = await asyncio.gather(
+            *(self._collect_arxiv_feed(http, feed_url, since, per_feed) for feed_url in feeds)
+        )
+        return [item for batch in batches for item in batch]
+
+    async def _collect_arxiv_feed(
+        self,
+        http: httpx.AsyncClient,
+        feed_url: str,
+        since: datetime,
+        per_feed: int,
+    ) -> list[NetworkTrendItem]:
+        items: list[NetworkTrendItem] = []
+        stream_parser = self._settings.trend_discovery.arxiv_stream_parser
+        try:
+            if stream_parser:
+                entries = await stream_feed_entries(http, feed_url, limit=per_feed)
+            else:
                 response = await http.get(feed_url)
                 response.raise_for_status()
-                parsed = feedparser.parse(response.text)
-                for entry in parsed.entries[:per_feed]:
-                    observed = self._extract_observed(entry, datetime.now(timezone.utc))
-                    if observed < since:
-                        continue
-                    built = self._build_item(
-                        source_name="ARXIV",
-                        source_ref=feed_url,
-                        title=str(entry.get("title") or ""),
-                        url=str(entry.get("link") or ""),
-                        summary=str(entry.get("summary") or ""),
-                        observed=observed,
-                    )
-                    if built:
-                        items.append(built)
-            except Exception:
-                self._log.exception("trend_discovery.arxiv_fetch_failed", feed_url=feed_url)
+                entries = await asyncio.to_thread(self._feedparser_entries, response.text, per_feed)
+            fetched_at = datetime.now(timezone.utc)
+            for entry in entries:
+                observed = entry.published or fetched_at
+                if observed < since:
+                    continue
+                built = self._build_item(
+                    source_name="ARXIV",
+                    source_ref=feed_url,
+                    title=entry.title,
+                    url=entry.link,
+                    summary=entry.summary,
+                    observed=observed,
+                )
+                if built:
+                    items.append(built)
+        except Exception:
+            self._log.exception("trend_discovery.arxiv_fetch_failed", feed_url=feed_url)
         return items
 
     async def _collect_hn(
@@ -695,34 +834,34 @@ class TrendDiscoveryService:
     ) -> list[NetworkTrendItem]:
         items: list[NetworkTrendItem] = []
         try:
-            response = await http.get("https://hacker-news.firebaseio.com/v0/topstories.json")
-            response.raise_for_status()
-            story_ids = list(response.json() or [])[:limit]
-            for story_id in story_ids:
-                try:
-                    row = await http.get(f"https://hacker-news.firebaseio.com/v0/item/{int(story_id)}.json")
-                    row.raise_for_status()
-                    payload = row.json() or {}
-                    observed = datetime.fromtimestamp(
-                        int(payload.get("time") or int(datetime.now(timezone.utc).timestamp())),
-                        tz=timezone.utc,
-                    )
-                    if observed < since:
-                        continue
-                    built = self._build_item(
-                        source_name="HN",
-                        source_ref="https://news.ycombinator.com/",
-                        title=str(payload.get("title") or ""),
-                        url=str(payload.get("url") or f"https://news.ycombinator.com/item?id={int(story_id)}"),
-                        summary=str(payload.get("text") or ""),
-                        observed=observed,
-                    )
-                    if built:
-                        items.append(built)
-                except Exception:
-                    continue
+            story_ids = await fetch_hn_top_story_ids(http, limit=limit)
+            payloads = await fetch_hn_items(http, story_ids)
         except Exception:
             self._log.exception("trend_discovery.hn_fetch_failed")
+            return items
+        # Compare raw epoch seconds first; datetimes are built only for kept items.
+        since_ts = since.timestamp()
+        now_ts = int(datetime.now(timezone.utc).timestamp())
+        for story_id, payload in zip(story_ids, payloads):
+            if payload is None:
+                continue
+            try:
+                observed_ts = int(payload.get("time") or now_ts)
+                if observed_ts < since_ts:
+                    continue
+                observed = datetime.fromtimestamp(observed_ts, tz=timezone.utc)
+                built = self._build_item(
+                    source_name="HN",
+                    source_ref="https://news.ycombinator.com/",
+                    title=str(payload.get("title") or ""),
+                    url=str(payload.get("url") or f"https://news.ycombinator.com/item?id={story_id}"),
+                    summary=str(payload.get("text") or ""),
+                    observed=observed,
+                )
+                if built:
+                    items.append(built)
+            except Exception:
+                continue
         return items
 
     async def _collect_reddit(
@@ -731,38 +870,42 @@ class TrendDiscoveryService:
         since: datetime,
         limit: int,
     ) -> list[NetworkTrendItem]:
-        items: list[NetworkTrendItem] = []
         feeds = list(self._settings.trends.reddit_feeds)
         per_feed = max(5, limit // max(len(feeds), 1))
-        headers = {"User-Agent": "tg-news-bot/1.0"}
-        for feed_url in feeds:
-            try:
-                response = await http.get(feed_url, headers=headers)
-                response.raise_for_status()
-                payload = response.json() or {}
-                children = payload.get("data", {}).get("children", [])
-                if not isinstance(children, list):
+        batches = await asyncio.gather(
+            *(self._collect_reddit_feed(http, feed_url, since, per_feed) for feed_url in feeds)
+        )
+        return [item for batch in batches for item in batch]
+
+    async def _collect_reddit_feed(
+        self,
+        http: httpx.AsyncClient,
+        feed_url: str,
+        since: datetime,
+        per_feed: int,
+    ) -> list[NetworkTrendItem]:
+        items: list[NetworkTrendItem] = []
+        try:
+            posts = await fetch_reddit_posts(http, feed_url, limit=per_feed)
+            since_ts = since.timestamp()
+            now_ts = int(datetime.now(timezone.utc).timestamp())
+            for post in posts:
+                observed_ts = post.created_utc or now_ts
+                if observed_ts < since_ts:
                     continue
-                for child in children[:per_feed]:
-                    data = child.get("data", {}) if isinstance(child, dict) else {}
-                    observed = datetime.fromtimestamp(
-                        int(data.get("created_utc") or int(datetime.now(timezone.utc).timestamp())),
-                        tz=timezone.utc,
-                    )
-                    if observed < since:
-                        continue
-                    built = self._build_item(
-                        source_name="REDDIT",
-                        source_ref=feed_url,
-                        title=str(data.get("title") or ""),
-                        url=str(data.get("url") or ""),
-                        summary=str(data.get("selftext") or ""),
-                        observed=observed,
-                    )
-                    if built:
-                        items.append(built)
-            except Exception:
-                self._log.exception("trend_discovery.reddit_fetch_failed", feed_url=feed_url)
+                observed = datetime.fromtimestamp(observed_ts, tz=timezone.utc)
+                built = self._build_item(
+                    source_name="REDDIT",
+                    source_ref=feed_url,
+                    title=post.title,
+                    url=post.url,
+                    summary=post.selftext,
+                    observed=observed,
+                )
+                if built:
+                    items.append(built)
+        except Exception:
+            self._log.exception("trend_discovery.reddit_fetch_failed", feed_url=feed_url)
         return items
 
     async def _collect_x(
@@ -774,29 +917,39 @@ class TrendDiscoveryService:
         feeds = list(self._settings.trends.x_feeds)
         if not feeds:
             return []
-        items: list[NetworkTrendItem] = []
         per_feed = max(5, limit // max(len(feeds), 1))
-        for feed_url in feeds:
-            try:
-                response = await http.get(feed_url)
-                response.raise_for_status()
-                parsed = feedparser.parse(response.text)
-                for entry in parsed.entries[:per_feed]:
-                    observed = self._extract_observed(entry, datetime.now(timezone.utc))
-                    if observed < since:
-                        continue
-                    built = self._build_item(
-                        source_name="X",
-                        source_ref=feed_url,
-                        title=str(entry.get("title") or ""),
-                        url=str(entry.get("link") or ""),
-                        summary=str(entry.get("summary") or ""),
-                        observed=observed,
-                    )
-                    if built:
-                        items.append(built)
-            except Exception:
-                self._log.exception("trend_discovery.x_fetch_failed", feed_url=feed_url)
+        batches = await asyncio.gather(
+            *(self._collect_x_feed(http, feed_url, since, per_feed) for feed_url in feeds)
+        )
+        return [item for batch in batches for item in batch]
+
+    async def _collect_x_feed(
+        self,
+        http: httpx.AsyncClient,
+        feed_url: str,
+        since: datetime,
+        per_feed: int,
+    ) -> list[NetworkTrendItem]:
+        items: list[NetworkTrendItem] = []
+        try:
+            entries = await stream_feed_entries(http, feed_url, limit=per_feed)
+            fetched_at = datetime.now(timezone.utc)
+            for entry in entries:
+                observed = entry.published or fetched_at
+                if observed < since:
+                    continue
+                built = self._build_item(
+                    source_name="X",
+                    source_ref=feed_url,
+                    title=entry.title,
+                    url=entry.link,
+                    summary=entry.summary,
+                    observed=observed,
+                )
+                if built:
+                    items.append(built)
+        except Exception:
+            self._log.exception("trend_discovery.x_fetch_failed", feed_url=feed_url)
         return items
 
     async def _collect_github_trending(
@@ -1000,7 +1153,14 @@ class TrendDiscoveryService:
         topic_limit: int,
         internet_context: InternetScoringContext,
     ) -> list[tuple[object, list[ProfileMatchedItem], str, float, float, dict]]:
-        rows: list[tuple[object, list[ProfileMatchedItem], str, float, float, dict]] = []
+        survivors: list[tuple[object, list[ProfileMatchedItem], float, int, int]] = []
+        min_topic_score = self._settings.trend_discovery.min_topic_score
+        # Text and domain keys do not depend on the profile, so build them once per scan.
+        prepared: list[tuple[NetworkTrendItem, str, str]] = []
+        for item in items:
+            text = _compact_lower(f"{item.title} {item.summary}")
+            if text:
+                prepared.append((item, text, item.domain.lower()))
         for profile in profiles:
             config = TrendDiscoveryProfileSettings(
                 name=profile.name,
@@ -1010,26 +1170,49 @@ class TrendDiscoveryService:
                 min_article_score=float(profile.min_article_score or 0.0),
                 enabled=bool(profile.enabled),
             )
+            matcher = _ProfileMatcher.build(config)
             matched: list[ProfileMatchedItem] = []
-            for item in items:
+            domains: set[str] = set()
+            source_names: set[str] = set()
+            for item, text, domain in prepared:
                 scored = self._score_item_for_profile(
-                    config,
+                    matcher,
                     item,
                     trust_by_domain,
                     internet_context,
+                    text=text,
+                    domain=domain,
                 )
                 if scored:
                     matched.append(scored)
+                    if item.domain:
+                        domains.add(item.domain)
+                    source_names.add(item.source_name)
             if not matched:
                 continue
             matched.sort(key=lambda item: item.score, reverse=True)
-            unique_domains = len({row.item.domain for row in matched if row.item.domain})
-            unique_sources = len({row.item.source_name for row in matched})
-            topic_score = self._topic_score(matched, unique_domains, unique_sources)
-            if topic_score < self._settings.trend_discovery.min_topic_score:
+            unique_domains = len(domains)
+            unique_sources = len(source_names)
+            topic_score = self._topic_score(
+                [row.score for row in matched[:15]],
+                unique_domains,
+                unique_sources,
+            )
+            if topic_score < min_topic_score:
                 continue
+            survivors.append((profile, matched, topic_score, unique_domains, unique_sources))
 
-            ai_title = await self._ai_topic_title(profile.name, matched)
+        # Titles do not affect ranking, so only the topics that will be kept are
+        # sent to the LLM, and those requests run concurrently.
+        survivors = heapq.nlargest(topic_limit, survivors, key=lambda row: row[2])
+        ai_titles = await asyncio.gather(
+            *(self._ai_topic_title(profile.name, matched) for profile, matched, *_ in survivors)
+        )
+
+        rows: list[tuple[object, list[ProfileMatchedItem], str, float, float, dict]] = []
+        for (profile, matched, topic_score, unique_domains, unique_sources), ai_title in zip(
+            survivors, ai_titles
+        ):
             topic_name = ai_title or self._fallback_topic_name(profile.name, matched)
             confidence = max(0.05, min(1.0, topic_score / 8.0))
             reasons = {
@@ -1043,9 +1226,7 @@ class TrendDiscoveryService:
             if ai_title:
                 reasons["ai_title"] = ai_title
             rows.append((profile, matched, topic_name, topic_score, confidence, reasons))
-
-        rows.sort(key=lambda row: row[3], reverse=True)
-        return rows[:topic_limit]
+        return rows
 
     async def _ai_topic_title(self, profile_name: str, matched: list[ProfileMatchedItem]) -> str | None:
         if self._llm_client is None:
@@ -1072,15 +1253,19 @@ class TrendDiscoveryService:
 
     def _score_item_for_profile(
         self,
-        profile: TrendDiscoveryProfileSettings,
+        matcher: _ProfileMatcher,
         item: NetworkTrendItem,
         trust_by_domain: dict[str, float],
         internet_context: InternetScoringContext,
+        *,
+        text: str,
+        domain: str,
     ) -> ProfileMatchedItem | None:
-        text = _compact(f"{item.title} {item.summary}").lower()
-        if not text:
+        # One regex scan rejects most items before the per-keyword tally.
+        if matcher.seed_pattern is None or matcher.seed_pattern.search(text) is None:
             return None
 
+        profile = matcher.config
         seeds = [keyword for keyword in profile.seed_keywords if keyword in text]
         if not seeds:
             return None
@@ -1089,14 +1274,13 @@ class TrendDiscoveryService:
         if len(excludes) >= len(seeds):
             return None
 
-        trusted_domains = {value.lower() for value in profile.trusted_domains}
-        trust_raw = trust_by_domain.get(item.domain.lower())
+        trust_raw = trust_by_domain.get(domain)
         score_result = self._internet_scoring.score_item(
             text=text,
             source_name=item.source_name,
             seed_hits=seeds,
             exclude_hits=excludes,
-            trusted_domain_match=item.domain.lower() in trusted_domains,
+            trusted_domain_match=domain in matcher.trusted_domains,
             source_trust_score=trust_raw,
             signal_boosts=internet_context.signal_boosts,
         )
@@ -1117,25 +1301,21 @@ class TrendDiscoveryService:
         )
 
     @staticmethod
-    def _topic_score(matched: list[ProfileMatchedItem], unique_domains: int, unique_sources: int) -> float:
-        top_rows = matched[:15]
-        if not top_rows:
+    def _topic_score(top_scores: list[float], unique_domains: int, unique_sources: int) -> float:
+        if not top_scores:
             return 0.0
-        avg_score = sum(min(row.score, 5.0) for row in top_rows) / float(len(top_rows))
+        avg_score = sum(min(score, 5.0) for score in top_scores) / float(len(top_scores))
         return avg_score + min(unique_domains, 12) * 0.2 + min(unique_sources, 4) * 0.35
 
     @staticmethod
     def _top_keywords(matched: list[ProfileMatchedItem], limit: int = 5) -> list[str]:
-        counts: Counter[str] = Counter()
-        for row in matched:
-            counts.update(item.lower() for item in row.seed_hits)
+        # Seed hits come from profile keywords that _normalize_keywords already lowercased.
+        counts = Counter(chain.from_iterable(row.seed_hits for row in matched))
         return [value for value, _ in counts.most_common(limit)]
 
     @staticmethod
     def _top_signal_hits(matched: list[ProfileMatchedItem], limit: int = 5) -> list[str]:
-        counts: Counter[str] = Counter()
-        for row in matched:
-            counts.update(item.lower() for item in row.signal_hits)
+        counts = Counter(map(str.lower, chain.from_iterable(row.signal_hits for row in matched)))
         return [value for value, _ in counts.most_common(limit)]
 
     def _fallback_topic_name(self, profile_name: str, matched: list[ProfileMatchedItem]) -> str:
@@ -1159,23 +1339,24 @@ class TrendDiscoveryService:
                 continue
             grouped[domain].append(row)
 
-        rows: list[dict] = []
+        scored_groups: list[tuple[str, list[ProfileMatchedItem], float, float]] = []
         for domain, group in grouped.items():
             avg_score = sum(item.score for item in group) / float(len(group))
-            rows.append(
-                {
-                    "domain": domain,
-                    "source_url": self._normalize_source_url(f"https://{domain}"),
-                    "score": avg_score + min(len(group), 8) * 0.25,
-                    "reasons": {
-                        "mentions": len(group),
-                        "avg_article_score": round(avg_score, 3),
-                        "sources": sorted({item.item.source_name for item in group}),
-                    },
-                }
-            )
-        rows.sort(key=lambda item: float(item["score"]), reverse=True)
-        return rows[:max_items]
+            scored_groups.append((domain, group, avg_score, avg_score + min(len(group), 8) * 0.25))
+        top_groups = heapq.nlargest(max_items, scored_groups, key=lambda row: row[3])
+        return [
+            {
+                "domain": domain,
+                "source_url": self._normalize_source_url(f"https://{domain}"),
+                "score": score,
+                "reasons": {
+                    "mentions": len(group),
+                    "avg_article_score": round(avg_score, 3),
+                    "sources": sorted({item.item.source_name for item in group}),
+                },
+            }
+            for domain, group, avg_score, score in top_groups
+        ]
 
     async def _load_bot_settings(self) -> BotSettings | None:
         async with self._session_factory() as session:
@@ -1184,20 +1365,23 @@ class TrendDiscoveryService:
 
     async def _find_source_by_domain(self, session: AsyncSession, domain: str) -> Source | None:
         rows = await self._sources_repo.list_all(session)
-        target = domain.lower()
-        for row in rows:
-            if extract_domain(row.url).lower() == target:
-                return row
-        return None
+        return self._index_sources_by_domain(rows).get(domain.lower())
 
     def _build_trust_by_domain(self, sources: list[Source]) -> dict[str, float]:
-        result: dict[str, float] = {}
+        return {
+            domain: float(source.trust_score or 0.0)
+            for domain, source in self._index_sources_by_domain(sources).items()
+        }
+
+    @staticmethod
+    def _index_sources_by_domain(sources: list[Source]) -> dict[str, Source]:
+        # The newest source wins when several share a domain (list_all orders by id).
+        index: dict[str, Source] = {}
         for source in sources:
             domain = extract_domain(source.url).lower()
-            if not domain:
-                continue
-            result[domain] = float(source.trust_score or 0.0)
-        return result
+            if domain:
+                index[domain] = source
+        return index
 
     def _build_item(
         self,
@@ -1213,11 +1397,13 @@ class TrendDiscoveryService:
         clean_url = _compact(url)
         if not clean_title or not clean_url:
             return None
+        # Cheap reject for non-HTTP links before the full parse.
+        if _HTTP_URL_RE.match(clean_url) is None:
+            return None
         parsed = urlparse(clean_url)
         if parsed.scheme not in {"http", "https"} or not parsed.netloc:
             return None
-        normalized = normalize_url(clean_url)
-        domain = extract_domain(normalized)
+        normalized, domain = normalize_parsed_url(parsed)
         if not domain:
             return None
         return NetworkTrendItem(
@@ -1231,24 +1417,29 @@ class TrendDiscoveryService:
             observed_at=observed,
         )
 
+    @classmethod
+    def _feedparser_entries(cls, text: str, limit: int) -> list[FeedEntry]:
+        parsed = feedparser.parse(text)
+        return [
+            FeedEntry(
+                title=str(entry.get("title") or ""),
+                link=str(entry.get("link") or ""),
+                summary=str(entry.get("summary") or ""),
+                published=cls._extract_observed(entry),
+            )
+            for entry in parsed.entries[:limit]
+        ]
+
     @staticmethod
-    def _extract_observed(entry, fallback: datetime) -> datetime:  # noqa: ANN001
+    def _extract_observed(entry) -> datetime | None:  # noqa: ANN001
         for key in ("published_parsed", "updated_parsed"):
             value = entry.get(key)
             if value:
                 try:
-                    return datetime(
-                        value.tm_year,
-                        value.tm_mon,
-                        value.tm_mday,
-                        value.tm_hour,
-                        value.tm_min,
-                        value.tm_sec,
-                        tzinfo=timezone.utc,
-                    )
+                    return datetime(*value[:6], tzinfo=timezone.utc)
                 except Exception:
                     continue
-        return fallback
+        return None
 
     def _clamp_hours(self, value: int | None) -> int:
         settings = self._settings.trend_discovery
@@ -1264,33 +1455,39 @@ class TrendDiscoveryService:
 
     @staticmethod
     def _render_article_card(row: TrendArticleCandidate) -> str:
-        lines = [
-            f"<b>Кандидат трендовой статьи #{row.id}</b>",
-            f"topic_id: {row.topic_id}",
-            f"оценка: {float(row.score):.2f}",
-            f"домен: {html.escape(row.domain or '-')}",
-            f"заголовок: {html.escape(_trim(row.title or '-', 180))}",
-        ]
+        snippet_line = ""
         if row.snippet:
-            lines.append(f"кратко: {html.escape(_trim(row.snippet, 260))}")
-        lines.append(f"ссылка: {html.escape(row.url)}")
-        return "\n".join(lines)
+            snippet_line = f"кратко: {html.escape(_trim(row.snippet, 260))}\n"
+        return _ARTICLE_CARD_TEMPLATE.format_map(
+            {
+                "id": row.id,
+                "topic_id": row.topic_id,
+                "score": float(row.score),
+                "domain": html.escape(row.domain or "-"),
+                "title": html.escape(_trim(row.title or "-", 180)),
+                "snippet_line": snippet_line,
+                "url": html.escape(row.url),
+            }
+        )
 
     @staticmethod
     def _render_source_card(row: TrendSourceCandidate) -> str:
-        lines = [
-            f"<b>Кандидат трендового источника #{row.id}</b>",
-            f"topic_id: {row.topic_id}",
-            f"оценка: {float(row.score):.2f}",
-            f"домен: {html.escape(row.domain)}",
-        ]
+        link_line = ""
         if row.source_url:
-            lines.append(f"ссылка: {html.escape(row.source_url)}")
+            link_line = f"\nссылка: {html.escape(row.source_url)}"
         reasons = row.reasons if isinstance(row.reasons, dict) else {}
         mentions = reasons.get("mentions")
-        if mentions is not None:
-            lines.append(f"упоминаний: {mentions}")
-        return "\n".join(lines)
+        mentions_line = "" if mentions is None else f"\nупоминаний: {mentions}"
+        return _SOURCE_CARD_TEMPLATE.format_map(
+            {
+                "id": row.id,
+                "topic_id": row.topic_id,
+                "score": float(row.score),
+                "domain": html.escape(row.domain),
+                "link_line": link_line,
+                "mentions_line": mentions_line,
+            }
+        )
 
     async def _clear_candidate_keyboard(self, chat_id: int | None, message_id: int | None) -> None:
         if self._publisher is None or chat_id is None or message_id is None:
@@ -1317,24 +1514,56 @@ class TrendDiscoveryService:
         return f"https://{compact}"
 
 
+def _announcements(
+    rows: list[TrendArticleCandidate] | list[TrendSourceCandidate],
+    tasks: list[asyncio.Task[SendResult | None]],
+    topic_id: int,
+) -> list[TrendCandidateAnnouncement]:
+    result: list[TrendCandidateAnnouncement] = []
+    for row, task in zip(rows, tasks):
+        sent = task.result()
+        if sent is None:
+            continue
+        result.append(
+            TrendCandidateAnnouncement(
+                candidate_id=row.id,
+                group_chat_id=sent.chat_id,
+                topic_id_telegram=topic_id,
+                message_id=sent.message_id,
+            )
+        )
+    return result
+
+
 def _normalize_keywords(value) -> list[str]:  # noqa: ANN001
     if not isinstance(value, list):
         return []
     result: list[str] = []
     for item in value:
-        text = _compact(str(item)).lower()
+        text = _compact_lower(str(item))
         if text:
             result.append(text)
     return result
 
 
+def _keyword_pattern(keywords: list[str]) -> re.Pattern[str] | None:
+    unique = sorted(set(keywords), key=len, reverse=True)
+    if not unique:
+        return None
+    return re.compile("|".join(re.escape(keyword) for keyword in unique))
+
+
 def _strip_html(value: str) -> str:
-    text = re.sub(r"(?is)<[^>]+>", " ", value or "")
+    text = _HTML_TAG_RE.sub(" ", value or "")
     return _compact(html.unescape(text))
 
 
 def _compact(value: str) -> str:
-    return re.sub(r"\s+", " ", (value or "").strip())
+    return _WS_RE.sub(" ", (value or "").strip())
+
+
+def _compact_lower(value: str) -> str:
+    return _WS_RE.sub(" ", (value or "").strip().lower())
 
 
 def _trim(value: str, limit: int) -> str:
@@ -1345,5 +1574,5 @@ def _trim(value: str, limit: int) -> str:
 
 
 def _slug(value: str) -> str:
-    text = re.sub(r"[^0-9a-zA-Zа-яА-Я]+", "-", _compact(value).lower()).strip("-")
+    text = _SLUG_RE.sub("-", _compact_lower(value)).strip("-")
     return text or "topic"
@@ -6,9 +6,10 @@ import asyncio
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import re
+import time
 
-import feedparser
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -16,39 +17,47 @@ from tg_news_bot.config import TrendsSettings
 from tg_news_bot.db.models import TrendSignalSource
 from tg_news_bot.logging import get_logger
 from tg_news_bot.repositories.trend_signals import TrendSignalInput, TrendSignalRepository
+from tg_news_bot.services.hacker_news import fetch_hn_items, fetch_hn_top_story_ids
 from tg_news_bot.services.metrics import metrics
+from tg_news_bot.services.reddit import fetch_reddit_posts
+from tg_news_bot.utils.feeds import stream_feed_entries
+from tg_news_bot.utils.http import create_http_client
 
 
-_STOPWORDS = {
-    "the",
-    "and",
-    "for",
-    "with",
-    "from",
-    "that",
-    "this",
-    "into",
-    "over",
-    "under",
-    "about",
-    "after",
-    "before",
-    "study",
-    "new",
-    "news",
-    "report",
-    "show",
-    "shows",
-    "using",
-    "use",
-    "based",
-    "have",
-    "has",
-    "had",
-    "will",
-    "would",
-    "could",
-}
+_BOOSTS_CACHE_TTL_SECONDS = 120.0
+
+_STOPWORDS = frozenset(
+    {
+        "the",
+        "and",
+        "for",
+        "with",
+        "from",
+        "that",
+        "this",
+        "into",
+        "over",
+        "under",
+        "about",
+        "after",
+        "before",
+        "study",
+        "new",
+        "news",
+        "report",
+        "show",
+        "shows",
+        "using",
+        "use",
+        "based",
+        "have",
+        "has",
+        "had",
+        "will",
+        "would",
+        "could",
+    }
+)
 
 
 @dataclass(slots=True)
@@ -72,7 +81,8 @@ class TrendCollector:
         self._repo = repository or TrendSignalRepository()
         self._log = get_logger(__name__)
         self._cached_boosts: dict[str, float] = {}
-        self._cached_at: datetime | None = None
+        self._cached_at: float | None = None
+        self._http: httpx.AsyncClient | None = None
 
     async def run(self) -> None:
         while True:
@@ -88,24 +98,21 @@ class TrendCollector:
         if not self._settings.enabled:
             return TrendCollectionStats()
 
-        counters: list[tuple[TrendSignalSource, Counter[str]]] = []
         stats = TrendCollectionStats()
-        async with httpx.AsyncClient(timeout=20, follow_redirects=True) as http:
-            arxiv_counter = await self._collect_arxiv(http)
-            counters.append((TrendSignalSource.ARXIV, arxiv_counter))
-            stats.sources_ok += 1
-
-            hn_counter = await self._collect_hn(http)
-            counters.append((TrendSignalSource.HN, hn_counter))
-            stats.sources_ok += 1
-
-            reddit_counter = await self._collect_reddit(http)
-            counters.append((TrendSignalSource.REDDIT, reddit_counter))
-            stats.sources_ok += 1
-
-            x_counter = await self._collect_x(http)
-            counters.append((TrendSignalSource.X, x_counter))
-            stats.sources_ok += 1
+        http = self._get_http()
+        arxiv_counter, hn_counter, reddit_counter, x_counter = await asyncio.gather(
+            self._collect_arxiv(http),
+            self._collect_hn(http),
+            self._collect_reddit(http),
+            self._collect_x(http),
+        )
+        counters: list[tuple[TrendSignalSource, Counter[str]]] = [
+            (TrendSignalSource.ARXIV, arxiv_counter),
+            (TrendSignalSource.HN, hn_counter),
+            (TrendSignalSource.REDDIT, reddit_counter),
+            (TrendSignalSource.X, x_counter),
+        ]
+        stats.sources_ok += len(counters)
 
         now = datetime.now(timezone.utc)
         to_insert: list[TrendSignalInput] = []
@@ -136,11 +143,11 @@ class TrendCollector:
     async def get_keyword_boosts(self, *, max_items: int = 80) -> dict[str, float]:
         if not self._settings.enabled:
             return {}
-        now = datetime.now(timezone.utc)
-        if self._cached_at and (now - self._cached_at).total_seconds() < 120:
+        checked_at = time.monotonic()
+        if self._cached_at is not None and checked_at - self._cached_at < _BOOSTS_CACHE_TTL_SECONDS:
             return dict(self._cached_boosts)
 
-        since = now - timedelta(hours=self._settings.lookback_hours)
+        since = datetime.now(timezone.utc) - timedelta(hours=self._settings.lookback_hours)
         async with self._session_factory() as session:
             async with session.begin():
                 rows = await self._repo.list_recent_keyword_scores(
@@ -156,7 +163,7 @@ class TrendCollector:
                 continue
             boosts[keyword] = boost
         self._cached_boosts = boosts
-        self._cached_at = now
+        self._cached_at = checked_at
         return dict(boosts)
 
     async def list_recent_signals(self, *, hours: int, limit: int) -> list[tuple[str, str, float, datetime]]:
@@ -170,90 +177,104 @@ class TrendCollector:
             for row in rows
         ]
 
+    def _get_http(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = create_http_client(headers={"User-Agent": "tg-news-bot/1.0"})
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     async def _collect_arxiv(self, http: httpx.AsyncClient) -> Counter[str]:
-        counter: Counter[str] = Counter()
-        for url in self._settings.arxiv_feeds:
-            try:
-                response = await http.get(url)
-                response.raise_for_status()
-                parsed = feedparser.parse(response.text)
-                for entry in parsed.entries[:60]:
-                    title = str(entry.get("title") or "")
-                    counter.update(_extract_keywords(title, self._settings))
-            except Exception:
-                self._log.exception("trends.arxiv_fetch_failed", url=url)
-        return counter
+        return _merge_counters(
+            await asyncio.gather(
+                *(
+                    self._collect_feed_titles(http, url, failure_event="trends.arxiv_fetch_failed")
+                    for url in self._settings.arxiv_feeds
+                )
+            )
+        )
 
     async def _collect_hn(self, http: httpx.AsyncClient) -> Counter[str]:
         counter: Counter[str] = Counter()
         try:
-            top = await http.get("https://hacker-news.firebaseio.com/v0/topstories.json")
-            top.raise_for_status()
-            story_ids = list(top.json() or [])[: self._settings.hn_top_n]
-            for story_id in story_ids:
-                try:
-                    item = await http.get(
-                        f"https://hacker-news.firebaseio.com/v0/item/{int(story_id)}.json"
-                    )
-                    item.raise_for_status()
-                    payload = item.json() or {}
-                    title = str(payload.get("title") or "")
-                    counter.update(_extract_keywords(title, self._settings))
-                except Exception:
-                    continue
+            story_ids = await fetch_hn_top_story_ids(http, limit=self._settings.hn_top_n)
+            payloads = await fetch_hn_items(http, story_ids)
         except Exception:
             self._log.exception("trends.hn_fetch_failed")
+            return counter
+        for payload in payloads:
+            if payload is None:
+                continue
+            title = str(payload.get("title") or "")
+            counter.update(_extract_keywords(title, self._settings))
         return counter
 
     async def _collect_reddit(self, http: httpx.AsyncClient) -> Counter[str]:
+        return _merge_counters(
+            await asyncio.gather(*(self._collect_reddit_feed(http, url) for url in self._settings.reddit_feeds))
+        )
+
+    async def _collect_reddit_feed(self, http: httpx.AsyncClient, url: str) -> Counter[str]:
         counter: Counter[str] = Counter()
-        headers = {"User-Agent": "tg-news-bot/1.0"}
-        for url in self._settings.reddit_feeds:
-            try:
-                response = await http.get(url, headers=headers)
-                response.raise_for_status()
-                payload = response.json() or {}
-                children = (
-                    payload.get("data", {}).get("children", [])
-                    if isinstance(payload, dict)
-                    else []
-                )
-                for row in children[:80]:
-                    data = row.get("data", {}) if isinstance(row, dict) else {}
-                    title = str(data.get("title") or "")
-                    counter.update(_extract_keywords(title, self._settings))
-            except Exception:
-                self._log.exception("trends.reddit_fetch_failed", url=url)
+        try:
+            for post in await fetch_reddit_posts(http, url, limit=80):
+                counter.update(_extract_keywords(post.title, self._settings))
+        except Exception:
+            self._log.exception("trends.reddit_fetch_failed", url=url)
         return counter
 
     async def _collect_x(self, http: httpx.AsyncClient) -> Counter[str]:
+        return _merge_counters(
+            await asyncio.gather(
+                *(
+                    self._collect_feed_titles(http, url, failure_event="trends.x_fetch_failed")
+                    for url in self._settings.x_feeds
+                )
+            )
+        )
+
+    async def _collect_feed_titles(
+        self,
+        http: httpx.AsyncClient,
+        url: str,
+        *,
+        failure_event: str,
+    ) -> Counter[str]:
         counter: Counter[str] = Counter()
-        for url in self._settings.x_feeds:
-            try:
-                response = await http.get(url)
-                response.raise_for_status()
-                parsed = feedparser.parse(response.text)
-                for entry in parsed.entries[:60]:
-                    title = str(entry.get("title") or "")
-                    counter.update(_extract_keywords(title, self._settings))
-            except Exception:
-                self._log.exception("trends.x_fetch_failed", url=url)
+        try:
+            for entry in await stream_feed_entries(http, url, limit=60):
+                counter.update(_extract_keywords(entry.title, self._settings))
+        except Exception:
+            self._log.exception(failure_event, url=url)
         return counter
 
 
+def _merge_counters(counters: list[Counter[str]]) -> Counter[str]:
+    merged: Counter[str] = Counter()
+    for counter in counters:
+        merged.update(counter)
+    return merged
+
+
 def _extract_keywords(text: str, settings: TrendsSettings) -> list[str]:
-    tokens = [item.strip().lower() for item in re.split(r"[^a-zA-Z0-9+#-]+", text) if item.strip()]
+    if settings.min_keyword_length > settings.max_keyword_length:
+        return []
+    pattern = _token_pattern(settings.min_keyword_length, settings.max_keyword_length)
     result: list[str] = []
-    for token in tokens:
-        if token in _STOPWORDS:
-            continue
-        if len(token) < settings.min_keyword_length:
-            continue
-        if len(token) > settings.max_keyword_length:
-            continue
-        if token.startswith("http"):
-            continue
-        if token.isdigit():
+    for match in pattern.findall(text):
+        token = match.lower()
+        if token in _STOPWORDS or token.startswith("http") or token.isdigit():
             continue
         result.append(token)
     return result
+
+
+@lru_cache(maxsize=4)
+def _token_pattern(min_length: int, max_length: int) -> re.Pattern[str]:
+    # Tokens outside the length bounds must be skipped whole, not cut into pieces.
+    return re.compile(
+        rf"(?<![a-zA-Z0-9+#-])[a-zA-Z0-9+#-]{{{min_length},{max_length}}}(?![a-zA-Z0-9+#-])"
+    )
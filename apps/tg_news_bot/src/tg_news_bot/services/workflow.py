@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import suppress
 from datetime import date, datetime, timezone
+from functools import lru_cache
 
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
+from telegram_publisher.types import PostContent
 from tg_news_bot.ports.publisher import (
     PublisherEditNotAllowed,
     PublisherNotFound,
@@ -25,18 +30,17 @@ from tg_news_bot.db.models import (
     PublishFailureContext,
     ScheduledPostStatus,
 )
-from tg_news_bot.repositories.bot_settings import BotSettingsRepository
-from tg_news_bot.repositories.articles import ArticleRepository
+from tg_news_bot.repositories.bot_settings import BotSettingsRepository, BotSettingsSnapshot
 from tg_news_bot.repositories.drafts import DraftRepository
 from tg_news_bot.repositories.publish_failures import PublishFailureRepository
 from tg_news_bot.repositories.scheduled_posts import ScheduledPostRepository
-from tg_news_bot.repositories.sources import SourceRepository
 from tg_news_bot.services.keyboards import (
     build_schedule_keyboard,
     build_source_button_keyboard,
     build_state_keyboard,
 )
 from tg_news_bot.services.edit_sessions import EditSessionService
+from tg_news_bot.services.markup_coalescer import ReplyMarkupCoalescer
 from tg_news_bot.services.rendering import render_card_text, render_post_content
 from tg_news_bot.services.content_safety import ContentSafetyService
 from tg_news_bot.services.metrics import metrics
@@ -47,6 +51,82 @@ from tg_news_bot.services.text_generation import TextPipeline, compose_post_text
 from tg_news_bot.services.workflow_types import DraftAction, TransitionRequest
 
 
+_PUBLISH_ACTIONS: frozenset[DraftAction] = frozenset(
+    {DraftAction.PUBLISH_NOW, DraftAction.REPOST}
+)
+# Draft columns a transition may change before its write-back transaction.
+_TRANSITION_FIELDS = (
+    "post_text_ru",
+    "score_reasons",
+    "published_message_id",
+    "published_at",
+    "tg_image_file_id",
+    "tg_image_unique_id",
+    "has_image",
+    "image_status",
+    "group_chat_id",
+    "topic_id",
+    "post_message_id",
+    "card_message_id",
+)
+_TRANSITION_MAX_ATTEMPTS = 3
+_TRANSITION_RETRY_DELAY_SECONDS = 0.05
+# Post bodies at least this long are rendered off the event loop.
+_THREAD_RENDER_MIN_CHARS = 32_000
+
+_TRANSITIONS_BY_STATE: dict[DraftState, dict[DraftAction, DraftState]] = {
+    DraftState.INBOX: {
+        DraftAction.TO_EDITING: DraftState.EDITING,
+        DraftAction.TO_ARCHIVE: DraftState.ARCHIVE,
+    },
+    DraftState.EDITING: {
+        DraftAction.TO_READY: DraftState.READY,
+        DraftAction.TO_ARCHIVE: DraftState.ARCHIVE,
+    },
+    DraftState.READY: {
+        DraftAction.TO_EDITING: DraftState.EDITING,
+        DraftAction.TO_ARCHIVE: DraftState.ARCHIVE,
+        DraftAction.SCHEDULE: DraftState.SCHEDULED,
+        DraftAction.PUBLISH_NOW: DraftState.PUBLISHED,
+    },
+    DraftState.SCHEDULED: {
+        DraftAction.SCHEDULE: DraftState.SCHEDULED,
+        DraftAction.CANCEL_SCHEDULE: DraftState.READY,
+        DraftAction.PUBLISH_NOW: DraftState.PUBLISHED,
+        DraftAction.TO_ARCHIVE: DraftState.ARCHIVE,
+    },
+    DraftState.PUBLISHED: {
+        DraftAction.REPOST: DraftState.PUBLISHED,
+        DraftAction.TO_EDITING: DraftState.EDITING,
+        DraftAction.TO_ARCHIVE: DraftState.ARCHIVE,
+    },
+    DraftState.ARCHIVE: {},
+}
+_TOPIC_ATTR_BY_STATE: dict[DraftState, str] = {
+    DraftState.INBOX: "inbox_topic_id",
+    DraftState.EDITING: "editing_topic_id",
+    DraftState.READY: "ready_topic_id",
+    DraftState.SCHEDULED: "scheduled_topic_id",
+    DraftState.PUBLISHED: "published_topic_id",
+    DraftState.ARCHIVE: "archive_topic_id",
+}
+_TRANSITIONS: dict[tuple[DraftState, DraftAction], DraftState] = {
+    (state, action): target
+    for state, actions in _TRANSITIONS_BY_STATE.items()
+    for action, target in actions.items()
+}
+
+
+@lru_cache(maxsize=1)
+def _default_content_safety() -> ContentSafetyService:
+    return ContentSafetyService(ContentSafetySettings())
+
+
+@lru_cache(maxsize=1)
+def _default_quality_gate() -> QualityGateService:
+    return QualityGateService(QualityGateSettings())
+
+
 class DraftWorkflowService:
     def __init__(
         self,
@@ -60,11 +140,10 @@ class DraftWorkflowService:
         edit_session_service: EditSessionService | None = None,
         post_formatting: PostFormattingSettings | None = None,
         publish_failure_repo: PublishFailureRepository | None = None,
-        source_repo: SourceRepository | None = None,
-        article_repo: ArticleRepository | None = None,
         text_pipeline: TextPipeline | None = None,
         content_safety: ContentSafetyService | None = None,
         quality_gate: QualityGateService | None = None,
+        markup_coalescer: ReplyMarkupCoalescer | None = None,
     ) -> None:
         self._session_factory = session_factory
         self._publisher = publisher
@@ -75,117 +154,202 @@ class DraftWorkflowService:
         self._edit_sessions = edit_session_service or EditSessionService(publisher)
         self._post_formatting = post_formatting
         self._publish_failure_repo = publish_failure_repo or PublishFailureRepository()
-        self._source_repo = source_repo or SourceRepository()
-        self._article_repo = article_repo or ArticleRepository()
         self._text_pipeline = text_pipeline
-        self._content_safety = content_safety or ContentSafetyService(ContentSafetySettings())
-        self._quality_gate = quality_gate or QualityGateService(QualityGateSettings())
+        self._content_safety = content_safety or _default_content_safety()
+        self._quality_gate = quality_gate or _default_quality_gate()
+        self._markup_coalescer = markup_coalescer or ReplyMarkupCoalescer(publisher)
 
     async def transition(self, request: TransitionRequest) -> Draft:
+        attempt = 1
+        while True:
+            try:
+                return await self._transition_once(request)
+            except StaleDataError:
+                if attempt >= _TRANSITION_MAX_ATTEMPTS:
+                    raise
+                await asyncio.sleep(_TRANSITION_RETRY_DELAY_SECONDS * 2 ** (attempt - 1))
+                attempt += 1
+
+    async def _transition_once(self, request: TransitionRequest) -> Draft:
+        # Phase 1: a short read. No row lock is taken and the connection goes
+        # back to the pool before any Bot API call.
         async with self._session_factory() as session:
-            async with session.begin():
-                draft = await self._draft_repo.get_for_update(session, request.draft_id)
-                settings = await self._settings_repo.get_or_create(session)
-                source_state = draft.state
-                move_handled = False
+            draft = await self._draft_repo.get(session, request.draft_id)
+            if draft is None:
+                raise LookupError(f"Draft {request.draft_id} not found")
+            settings = await self._settings_repo.get_or_create(session)
+            target_state = self._resolve_target_state(draft.state, request.action)
+            if target_state is None:
+                return draft
+            card_schedule_at = await self._card_schedule_at(
+                session, draft, target_state, request.schedule_at
+            )
 
-                target_state = self._resolve_target_state(
-                    draft.state, request.action
+        source_state = draft.state
+        expected_version = draft.version
+        if request.action == DraftAction.SCHEDULE and request.schedule_at is None:
+            raise ValueError("schedule_at is required for schedule action")
+        if request.action == DraftAction.TO_READY:
+            quality = self._quality_gate.evaluate(
+                current_text=draft.post_text_ru,
+                title=draft.title_en,
+                source_text=draft.extracted_text,
+            )
+            if quality.text:
+                draft.post_text_ru = quality.text
+            self._annotate_quality_gate(draft, quality.reasons)
+            if quality.should_archive:
+                target_state = DraftState.ARCHIVE
+            else:
+                self._ensure_ready_content_is_safe(draft)
+
+        # Phase 2: Bot API I/O with no session held. New message ids are kept
+        # on the detached draft and written back in phase 3.
+        should_move = not (
+            request.action == DraftAction.SCHEDULE and source_state == DraftState.SCHEDULED
+        )
+        published_id = draft.published_message_id
+        post_content: PostContent | None = None
+        superseded: list[int] = []
+        if request.action in _PUBLISH_ACTIONS:
+            try:
+                # The channel post and the group POST share one rendering.
+                post_content = await self._render_post_content(draft)
+                should_publish = not (
+                    request.action == DraftAction.PUBLISH_NOW
+                    and self._has_published_channel_message(draft)
                 )
-                if target_state is None:
-                    return draft
-
-                if request.action == DraftAction.SCHEDULE:
-                    if request.schedule_at is None:
-                        raise ValueError("schedule_at is required for schedule action")
-                    await self._schedule_service.schedule(
-                        session, draft_id=draft.id, schedule_at=request.schedule_at
-                    )
-                if request.action == DraftAction.CANCEL_SCHEDULE:
-                    await self._schedule_service.cancel(session, draft_id=draft.id)
-                if request.action == DraftAction.TO_READY:
-                    quality = self._quality_gate.evaluate(
-                        current_text=draft.post_text_ru,
-                        title=draft.title_en,
-                        source_text=draft.extracted_text,
+                if should_publish:
+                    await self._publish_now(draft, settings, post_content=post_content)
+                if should_move:
+                    superseded = await self._move_in_group(
+                        draft=draft,
+                        settings=settings,
+                        target_state=target_state,
+                        schedule_at=card_schedule_at,
+                        post_content=post_content,
                     )
-                    if quality.text:
-                        draft.post_text_ru = quality.text
-                    self._annotate_quality_gate(draft, quality.reasons)
-                    if quality.should_archive:
-                        target_state = DraftState.ARCHIVE
-                    else:
-                        self._ensure_ready_content_is_safe(draft)
+            except Exception:
+                metrics.inc_counter("publish_fail_total")
+                await self._record_publish_failure(
+                    draft,
+                    source_state=source_state,
+                    channel_post_sent=draft.published_message_id != published_id,
+                )
+                raise
+        elif should_move:
+            superseded = await self._move_in_group(
+                draft=draft,
+                settings=settings,
+                target_state=target_state,
+                schedule_at=card_schedule_at,
+            )
+        sent = self._sent_messages(
+            draft,
+            settings,
+            moved=should_move,
+            published=draft.published_message_id != published_id,
+        )
 
-                if request.action in {DraftAction.PUBLISH_NOW, DraftAction.REPOST}:
-                    try:
-                        should_publish = not (
-                            request.action == DraftAction.PUBLISH_NOW
-                            and self._has_published_channel_message(draft)
+        # Phase 3: a short write guarded by Draft.version. If another
+        # transition committed in the meantime, the messages sent above are
+        # removed and the whole transition is retried on fresh data.
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    current = await self._draft_repo.get_for_update(session, draft.id)
+                    if current.version != expected_version:
+                        raise StaleDataError(
+                            f"Draft {draft.id} changed during transition"
                         )
-                        if should_publish:
-                            await self._publish_now(session, draft, settings)
-                        should_move = not (
-                            request.action == DraftAction.SCHEDULE
-                            and source_state == DraftState.SCHEDULED
+                    for field in _TRANSITION_FIELDS:
+                        setattr(current, field, getattr(draft, field))
+                    current.state = target_state
+
+                    if request.action == DraftAction.SCHEDULE:
+                        await self._schedule_service.schedule(
+                            session, draft_id=draft.id, schedule_at=request.schedule_at
                         )
-                        if should_move:
-                            await self._move_in_group(
-                                session=session,
-                                draft=draft,
-                                settings=settings,
-                                target_state=target_state,
-                            )
-                            move_handled = True
+                    if request.action == DraftAction.CANCEL_SCHEDULE:
+                        await self._schedule_service.cancel(session, draft_id=draft.id)
+                    if request.action in _PUBLISH_ACTIONS:
                         await self._publish_failure_repo.mark_resolved_for_draft(
                             session,
                             draft_id=draft.id,
                         )
-                    except Exception:
-                        metrics.inc_counter("publish_fail_total")
-                        await self._publish_failure_repo.create(
-                            session,
-                            draft_id=draft.id,
-                            context=PublishFailureContext.MANUAL,
-                            error_message="publish_now_failed",
-                            attempt_no=1,
-                            details={"state": source_state.value},
-                        )
-                        raise
-                    if draft.state == DraftState.SCHEDULED:
-                        await self._schedule_service.mark_published(
-                            session, draft_id=draft.id
-                        )
+                        if source_state == DraftState.SCHEDULED:
+                            await self._schedule_service.mark_published(
+                                session, draft_id=draft.id
+                            )
+        except Exception:
+            for chat_id, message_ids in sent:
+                await self._delete_messages(chat_id, message_ids)
+            raise
 
-                if not move_handled:
-                    should_move = not (
-                        request.action == DraftAction.SCHEDULE
-                        and source_state == DraftState.SCHEDULED
-                    )
-                    if should_move:
-                        await self._move_in_group(
-                            session=session,
-                            draft=draft,
-                            settings=settings,
-                            target_state=target_state,
+        # Edit sessions send or delete their instruction message, so they get
+        # their own transaction once the draft row is committed.
+        if target_state == DraftState.EDITING or request.action == DraftAction.TO_ARCHIVE:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    if target_state == DraftState.EDITING:
+                        await self._edit_sessions.start(
+                            session, draft_id=draft.id, user_id=request.user_id
                         )
-                    elif target_state == DraftState.SCHEDULED:
-                        await self._refresh_scheduled_messages(session=session, draft=draft)
+                    else:
+                        await self._edit_sessions.cancel(session, draft_id=draft.id)
 
-                draft.state = target_state
-                if source_state != target_state:
-                    metrics.inc_counter(
-                        "drafts_state_total", labels={"state": target_state.value}
-                    )
+        if source_state != target_state:
+            metrics.inc_counter("drafts_state_total", labels={"state": target_state.value})
+        if not should_move and target_state == DraftState.SCHEDULED:
+            await self._refresh_scheduled_messages(
+                draft=current, schedule_at=card_schedule_at
+            )
+        if superseded:
+            await self._delete_messages(current.group_chat_id, superseded)
+        return current
 
-                if target_state == DraftState.EDITING:
-                    await self._edit_sessions.start(
-                        session, draft_id=draft.id, user_id=request.user_id
-                    )
-                if request.action in {DraftAction.TO_ARCHIVE}:
-                    await self._edit_sessions.cancel(session, draft_id=draft.id)
+    async def _record_publish_failure(
+        self,
+        draft: Draft,
+        *,
+        source_state: DraftState,
+        channel_post_sent: bool,
+    ) -> None:
+        async with self._session_factory() as session:
+            async with session.begin():
+                if channel_post_sent:
+                    # The channel post is already public; keep its id so a
+                    # retry moves the draft without posting it twice.
+                    current = await self._draft_repo.get_for_update(session, draft.id)
+                    if not current.published_message_id:
+                        current.published_message_id = draft.published_message_id
+                        current.published_at = draft.published_at
+                await self._publish_failure_repo.create(
+                    session,
+                    draft_id=draft.id,
+                    context=PublishFailureContext.MANUAL,
+                    error_message="publish_now_failed",
+                    attempt_no=1,
+                    details={"state": source_state.value},
+                )
 
-                return draft
+    @staticmethod
+    def _sent_messages(
+        draft: Draft,
+        settings: BotSettings | BotSettingsSnapshot,
+        *,
+        moved: bool,
+        published: bool,
+    ) -> list[tuple[int, list[int]]]:
+        sent: list[tuple[int, list[int]]] = []
+        if moved and draft.group_chat_id:
+            group_ids = [draft.post_message_id, draft.card_message_id]
+            sent.append(
+                (draft.group_chat_id, [message_id for message_id in group_ids if message_id])
+            )
+        if published and settings.channel_id and draft.published_message_id:
+            sent.append((settings.channel_id, [draft.published_message_id]))
+        return sent
 
     async def show_schedule_menu(
         self,
@@ -211,7 +375,7 @@ class DraftWorkflowService:
             selected_day=selected_day,
         )
         try:
-            await self._publisher.edit_reply_markup(
+            await self._markup_coalescer.submit(
                 chat_id=draft.group_chat_id,
                 message_id=draft.post_message_id,
                 keyboard=keyboard,
@@ -220,22 +384,28 @@ class DraftWorkflowService:
             return
 
     async def restore_state_keyboard(self, *, draft_id: int) -> None:
+        await self.restore_state_keyboards([draft_id])
+
+    async def restore_state_keyboards(self, draft_ids: list[int]) -> None:
+        """Put the state keyboard back on several POSTs with one draft query."""
         async with self._session_factory() as session:
-            draft = await self._draft_repo.get(session, draft_id)
-            if not draft:
-                return
-            if not draft.group_chat_id or not draft.post_message_id:
-                return
+            drafts = await self._draft_repo.get_many(session, draft_ids)
 
-        keyboard = build_state_keyboard(draft, draft.state)
-        try:
-            await self._publisher.edit_reply_markup(
+        edits = [
+            self._markup_coalescer.submit(
                 chat_id=draft.group_chat_id,
                 message_id=draft.post_message_id,
-                keyboard=keyboard,
+                keyboard=build_state_keyboard(draft, draft.state),
             )
-        except (PublisherNotFound, PublisherEditNotAllowed, PublisherNotModified):
-            return
+            for draft in drafts.values()
+            if draft.group_chat_id and draft.post_message_id
+        ]
+        results = await asyncio.gather(*edits, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, (PublisherNotFound, PublisherEditNotAllowed, PublisherNotModified)
+            ):
+                raise result
 
     async def process_editing_text(self, *, draft_id: int) -> None:
         if self._text_pipeline is None:
@@ -243,22 +413,16 @@ class DraftWorkflowService:
 
         async with self._session_factory() as session:
             async with session.begin():
-                draft = await self._draft_repo.get_for_update(session, draft_id)
+                loaded = await self._draft_repo.get_for_update_with_related(
+                    session, draft_id
+                )
+                draft = loaded.draft
                 if draft.state != DraftState.EDITING:
                     raise ValueError("processing is available only for EDITING drafts")
 
-                source_tags: dict | None = None
-                if draft.source_id is not None:
-                    source = await self._source_repo.get_by_id(session, draft.source_id)
-                    if source:
-                        source_tags = source.tags
-                topic_hints = self._topic_hints_from_tags(source_tags)
+                topic_hints = self._topic_hints_from_tags(loaded.source_tags)
 
-                source_text = draft.extracted_text
-                if not source_text and draft.article_id is not None:
-                    article = await self._article_repo.get_by_id(session, draft.article_id)
-                    if article and article.extracted_text:
-                        source_text = article.extracted_text
+                source_text = draft.extracted_text or loaded.article_text
 
                 source_text = sanitize_source_text(source_text)
                 if not source_text:
@@ -275,50 +439,34 @@ class DraftWorkflowService:
                     generated.title_ru,
                     generated.summary_ru,
                 )
-                await session.flush()
 
         await self._refresh_draft_messages(draft_id=draft_id)
 
+    @staticmethod
     def _resolve_target_state(
-        self, current: DraftState, action: DraftAction
+        current: DraftState, action: DraftAction
     ) -> DraftState | None:
-        transitions = {
-            DraftState.INBOX: {
-                DraftAction.TO_EDITING: DraftState.EDITING,
-                DraftAction.TO_ARCHIVE: DraftState.ARCHIVE,
-            },
-            DraftState.EDITING: {
-                DraftAction.TO_READY: DraftState.READY,
-                DraftAction.TO_ARCHIVE: DraftState.ARCHIVE,
-            },
-            DraftState.READY: {
-                DraftAction.TO_EDITING: DraftState.EDITING,
-                DraftAction.TO_ARCHIVE: DraftState.ARCHIVE,
-                DraftAction.SCHEDULE: DraftState.SCHEDULED,
-                DraftAction.PUBLISH_NOW: DraftState.PUBLISHED,
-            },
-            DraftState.SCHEDULED: {
-                DraftAction.SCHEDULE: DraftState.SCHEDULED,
-                DraftAction.CANCEL_SCHEDULE: DraftState.READY,
-                DraftAction.PUBLISH_NOW: DraftState.PUBLISHED,
-                DraftAction.TO_ARCHIVE: DraftState.ARCHIVE,
-            },
-            DraftState.PUBLISHED: {
-                DraftAction.REPOST: DraftState.PUBLISHED,
-                DraftAction.TO_EDITING: DraftState.EDITING,
-                DraftAction.TO_ARCHIVE: DraftState.ARCHIVE,
-            },
-            DraftState.ARCHIVE: {},
-        }
-        target = transitions.get(current, {}).get(action)
-        return target
+        return _TRANSITIONS.get((current, action))
+
+    async def _render_post_content(self, draft: Draft) -> PostContent:
+        # Typical posts render in well under a millisecond; only oversized
+        # bodies are worth the hop to a worker thread.
+        if len(draft.post_text_ru or "") < _THREAD_RENDER_MIN_CHARS:
+            return render_post_content(draft, formatting=self._post_formatting)
+        return await asyncio.to_thread(
+            render_post_content, draft, formatting=self._post_formatting
+        )
 
     async def _publish_now(
-        self, session: AsyncSession, draft: Draft, settings: BotSettings
+        self,
+        draft: Draft,
+        settings: BotSettings | BotSettingsSnapshot,
+        *,
+        post_content: PostContent | None = None,
     ) -> None:
         if not settings.channel_id:
             raise RuntimeError("channel_id is not configured")
-        content = render_post_content(draft, formatting=self._post_formatting)
+        content = post_content or await self._render_post_content(draft)
         keyboard = build_source_button_keyboard(
             draft,
             formatting=self._post_formatting,
@@ -332,41 +480,46 @@ class DraftWorkflowService:
         metrics.inc_counter("publish_success_total")
         draft.published_message_id = result.message_id
         draft.published_at = datetime.now(timezone.utc)
-        await session.flush()
 
     async def _move_in_group(
         self,
         *,
-        session: AsyncSession,
         draft: Draft,
-        settings: BotSettings,
+        settings: BotSettings | BotSettingsSnapshot,
         target_state: DraftState,
-    ) -> None:
+        schedule_at: datetime | None = None,
+        post_content: PostContent | None = None,
+    ) -> list[int]:
+        """Send the POST/CARD pair for target_state and store the new ids.
+
+        ``schedule_at`` is the time shown on the CARD. Returns the ids of the
+        superseded pair; callers delete them once the new ids are committed,
+        so a failed commit never leaves the draft pointing at deleted messages.
+        """
         group_chat_id = settings.group_chat_id
         if not group_chat_id:
             raise RuntimeError("group_chat_id is not configured")
         topic_id = self._topic_id_for_state(settings, target_state)
 
+        # Render both messages up front: the CARD follows the POST without any
+        # work in between, and a rendering error cannot orphan a sent POST.
         keyboard = build_state_keyboard(draft, target_state)
-        post_content = render_post_content(draft, formatting=self._post_formatting)
+        if post_content is None:
+            post_content = await self._render_post_content(draft)
+        card_text = render_card_text(
+            draft,
+            schedule_at=schedule_at,
+            state=target_state,
+        )
+        # The pair cannot be one sendMediaGroup call: media groups take no
+        # reply_markup (the POST carries the state keyboard) and cannot hold
+        # a plain text message like the CARD.
         post = await self._publisher.send_post(
             chat_id=group_chat_id,
             topic_id=topic_id,
             content=post_content,
             keyboard=keyboard,
         )
-        if post.photo_file_id:
-            draft.tg_image_file_id = post.photo_file_id
-            draft.tg_image_unique_id = post.photo_unique_id
-            draft.has_image = True
-            draft.image_status = ImageStatus.OK
-
-        schedule_at = await self._active_schedule_at(session, draft.id)
-        card_text = render_card_text(
-            draft,
-            schedule_at=schedule_at,
-            state=target_state,
-        )
         try:
             card = await self._publisher.send_text(
                 chat_id=group_chat_id,
@@ -375,38 +528,50 @@ class DraftWorkflowService:
                 keyboard=None,
                 parse_mode=None,
             )
-        except Exception:
-            # Keep POST/CARD pair consistent: if CARD send fails, remove freshly sent POST.
-            try:
-                await self._safe_delete(group_chat_id, post.message_id)
-            except Exception:
-                pass
+        except BaseException:
+            # Keep POST/CARD pair consistent: if CARD send fails or the move is
+            # cancelled, remove the freshly sent POST. The undo is shielded so
+            # cancelling the transition cannot drop it halfway.
+            with suppress(Exception):
+                await asyncio.shield(self._safe_delete(group_chat_id, post.message_id))
             raise
 
         old_post_id = draft.post_message_id
         old_card_id = draft.card_message_id
+        if post.photo_file_id:
+            draft.tg_image_file_id = post.photo_file_id
+            draft.tg_image_unique_id = post.photo_unique_id
+            draft.has_image = True
+            draft.image_status = ImageStatus.OK
         draft.group_chat_id = group_chat_id
         draft.topic_id = topic_id
         draft.post_message_id = post.message_id
         draft.card_message_id = card.message_id
-        await session.flush()
-
-        if old_post_id:
-            await self._safe_delete(group_chat_id, old_post_id)
-        if old_card_id:
-            await self._safe_delete(group_chat_id, old_card_id)
+        return [message_id for message_id in (old_post_id, old_card_id) if message_id]
 
     async def _refresh_scheduled_messages(
         self,
         *,
-        session: AsyncSession,
         draft: Draft,
+        schedule_at: datetime | None = None,
     ) -> None:
         if not draft.group_chat_id:
             return
         if not draft.post_message_id:
             return
         keyboard = build_state_keyboard(draft, DraftState.SCHEDULED)
+        edits = [self._edit_post_keyboard(draft, keyboard)]
+        if draft.card_message_id:
+            card_text = render_card_text(
+                draft,
+                schedule_at=schedule_at,
+                state=DraftState.SCHEDULED,
+            )
+            edits.append(self._edit_card_text(draft, card_text))
+        # POST and CARD are independent messages, so both edits go out together.
+        await asyncio.gather(*edits)
+
+    async def _edit_post_keyboard(self, draft: Draft, keyboard) -> None:  # noqa: ANN001
         try:
             await self._publisher.edit_reply_markup(
                 chat_id=draft.group_chat_id,
@@ -416,19 +581,25 @@ class DraftWorkflowService:
         except (PublisherNotFound, PublisherEditNotAllowed, PublisherNotModified):
             return
 
-        if not draft.card_message_id:
+    async def _edit_post_content(self, draft: Draft) -> None:
+        keyboard = build_state_keyboard(draft, draft.state)
+        post_content = await self._render_post_content(draft)
+        try:
+            await self._publisher.edit_post(
+                chat_id=draft.group_chat_id,
+                message_id=draft.post_message_id,
+                content=post_content,
+                keyboard=keyboard,
+            )
+        except (PublisherNotFound, PublisherEditNotAllowed, PublisherNotModified):
             return
-        schedule_at = await self._active_schedule_at(session, draft.id)
-        card_text = render_card_text(
-            draft,
-            schedule_at=schedule_at,
-            state=DraftState.SCHEDULED,
-        )
+
+    async def _edit_card_text(self, draft: Draft, text: str) -> None:
         try:
             await self._publisher.edit_text(
                 chat_id=draft.group_chat_id,
                 message_id=draft.card_message_id,
-                text=card_text,
+                text=text,
                 keyboard=None,
                 parse_mode=None,
                 disable_web_page_preview=True,
@@ -436,12 +607,37 @@ class DraftWorkflowService:
         except (PublisherNotFound, PublisherEditNotAllowed, PublisherNotModified):
             return
 
+    async def _delete_messages(self, chat_id: int, message_ids: list[int]) -> None:
+        # One deleteMessages call removes a whole POST/CARD pair; ids that are
+        # already gone are skipped by Telegram.
+        if not message_ids:
+            return
+        try:
+            await self._publisher.delete_messages(chat_id=chat_id, message_ids=message_ids)
+        except (PublisherNotFound, PublisherEditNotAllowed):
+            return
+
     async def _safe_delete(self, chat_id: int, message_id: int) -> None:
         try:
             await self._publisher.delete_message(chat_id=chat_id, message_id=message_id)
         except (PublisherNotFound, PublisherEditNotAllowed):
             return
 
+    async def _card_schedule_at(
+        self,
+        session: AsyncSession,
+        draft: Draft,
+        state: DraftState,
+        known: datetime | None,
+    ) -> datetime | None:
+        # The CARD only shows a schedule for SCHEDULED drafts, and a SCHEDULE
+        # action already knows the time it just stored.
+        if state != DraftState.SCHEDULED:
+            return None
+        if known is not None:
+            return known
+        return await self._active_schedule_at(session, draft.id)
+
     async def _active_schedule_at(
         self,
         session: AsyncSession,
@@ -455,16 +651,9 @@ class DraftWorkflowService:
         return scheduled.schedule_at
 
     @staticmethod
-    def _topic_id_for_state(settings: BotSettings, state: DraftState) -> int:
-        mapping = {
-            DraftState.INBOX: settings.inbox_topic_id,
-            DraftState.EDITING: settings.editing_topic_id,
-            DraftState.READY: settings.ready_topic_id,
-            DraftState.SCHEDULED: settings.scheduled_topic_id,
-            DraftState.PUBLISHED: settings.published_topic_id,
-            DraftState.ARCHIVE: settings.archive_topic_id,
-        }
-        topic_id = mapping.get(state)
+    def _topic_id_for_state(settings: BotSettings | BotSettingsSnapshot, state: DraftState) -> int:
+        attr = _TOPIC_ATTR_BY_STATE.get(state)
+        topic_id = getattr(settings, attr) if attr else None
         if not topic_id:
             raise RuntimeError(f"topic_id for {state} is not configured")
         return int(topic_id)
@@ -475,39 +664,20 @@ class DraftWorkflowService:
 
     async def _refresh_draft_messages(self, *, draft_id: int) -> None:
         async with self._session_factory() as session:
-            draft = await self._draft_repo.get(session, draft_id)
-            if not draft:
+            # The active schedule comes with the draft row, so a SCHEDULED
+            # CARD keeps its time without a second query.
+            loaded = await self._draft_repo.get_with_active_schedule(session, draft_id)
+            if loaded is None:
                 return
+            draft, schedule_at = loaded
             if not draft.group_chat_id or not draft.post_message_id:
                 return
 
-        keyboard = build_state_keyboard(draft, draft.state)
-        post_content = render_post_content(draft, formatting=self._post_formatting)
-        try:
-            await self._publisher.edit_post(
-                chat_id=draft.group_chat_id,
-                message_id=draft.post_message_id,
-                content=post_content,
-                keyboard=keyboard,
-            )
-        except PublisherNotModified:
-            pass
-        except (PublisherNotFound, PublisherEditNotAllowed):
-            return
-
-        if not draft.card_message_id:
-            return
-        try:
-            await self._publisher.edit_text(
-                chat_id=draft.group_chat_id,
-                message_id=draft.card_message_id,
-                text=render_card_text(draft),
-                keyboard=None,
-                parse_mode=None,
-                disable_web_page_preview=True,
-            )
-        except (PublisherNotFound, PublisherEditNotAllowed, PublisherNotModified):
-            return
+        edits = [self._edit_post_content(draft)]
+        if draft.card_message_id:
+            card_text = render_card_text(draft, schedule_at=schedule_at)
+            edits.append(self._edit_card_text(draft, card_text))
+        await asyncio.gather(*edits)
 
     async def refresh_draft_messages(self, *, draft_id: int) -> None:
         await self._refresh_draft_messages(draft_id=draft_id)
@@ -536,19 +706,12 @@ class DraftWorkflowService:
     def _topic_hints_from_tags(source_tags: dict | None) -> list[str]:
         if not source_tags:
             return []
-        topics_value = source_tags.get("topics")
-        if isinstance(topics_value, list):
-            return [
-                str(item).strip().lower()
-                for item in topics_value
-                if str(item).strip()
-            ]
-        if isinstance(topics_value, str):
-            text = topics_value.strip().lower()
-            return [text] if text else []
-        topic_value = source_tags.get("topic")
-        if isinstance(topic_value, str):
-            text = topic_value.strip().lower()
-            return [text] if text else []
-        return []
+        values = source_tags.get("topics")
+        if isinstance(values, str):
+            values = (values,)
+        elif not isinstance(values, list):
+            topic_value = source_tags.get("topic")
+            values = (topic_value,) if isinstance(topic_value, str) else ()
+        hints = (str(item).strip().lower() for item in values)
+        return [hint for hint in hints if hint]
 
@@ -4,9 +4,44 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import enum
+import re
 
 
 CALLBACK_PREFIX = "draft"
+# One pass validates the prefix and the numeric id, without building a list.
+_CALLBACK_RE = re.compile(rf"{CALLBACK_PREFIX}:(\d+):([^:]*)")
+
+
+# Callback data is capped at 64 bytes and travels with every keyboard, so
+# actions are sent as short codes. Handlers only ever see the full names.
+_ACTION_CODES: dict[str, str] = {
+    "to_editing": "e",
+    "to_ready": "r",
+    "to_archive": "a",
+    "publish_now": "p",
+    "schedule": "s",
+    "cancel_schedule": "cs",
+    "repost": "rp",
+    "cancel_edit": "ce",
+    "process_now": "pn",
+    "schedule_open": "so",
+    "schedule_tz_info": "tz",
+    "schedule_list": "sl",
+    "schedule_day_menu": "dm",
+    "schedule_manual_open": "mo",
+    "schedule_manual_cancel": "mc",
+    "schedule_back": "sb",
+}
+# Parameterised actions: the code is followed directly by the digits of the
+# argument, e.g. "schedule_day_20250103" -> "d20250103".
+_FAMILY_CODES: dict[str, str] = {
+    "schedule_day_": "d",
+    "schedule_time_": "t",
+    "schedule_at_": "at",
+}
+_CODE_ACTIONS = {code: action for action, code in _ACTION_CODES.items()}
+_CODE_FAMILIES = {code: family for family, code in _FAMILY_CODES.items()}
+_CODE_RE = re.compile(r"([a-z]+)(\d.*)?")
 
 
 @dataclass(slots=True)
@@ -15,20 +50,46 @@ class DraftCallback:
     action: str
 
 
+def callback_prefix(draft_id: int) -> str:
+    """Return the shared "draft:<id>:" head for building many callbacks at once."""
+    return f"{CALLBACK_PREFIX}:{draft_id}:"
+
+
+def encode_action(action: str) -> str:
+    """Return the short wire form of an action; unknown actions pass through."""
+    code = _ACTION_CODES.get(action)
+    if code is not None:
+        return code
+    for family, family_code in _FAMILY_CODES.items():
+        if action.startswith(family):
+            return family_code + action[len(family) :]
+    return action
+
+
+def decode_action(value: str) -> str:
+    match = _CODE_RE.fullmatch(value)
+    if match is None:
+        return value
+    code, argument = match.groups()
+    if argument is None:
+        return _CODE_ACTIONS.get(code, value)
+    family = _CODE_FAMILIES.get(code)
+    if family is None:
+        return value
+    return family + argument
+
+
 def build_callback(draft_id: int, action: str | enum.Enum) -> str:
     action_value = action.value if isinstance(action, enum.Enum) else action
-    return f"{CALLBACK_PREFIX}:{draft_id}:{action_value}"
+    return f"{CALLBACK_PREFIX}:{draft_id}:{encode_action(action_value)}"
 
 
 def parse_callback(data: str) -> DraftCallback | None:
     if not data:
         return None
-    parts = data.split(":")
-    if len(parts) != 3:
-        return None
-    prefix, draft_id, action = parts
-    if prefix != CALLBACK_PREFIX:
-        return None
-    if not draft_id.isdigit():
+    match = _CALLBACK_RE.fullmatch(data)
+    if match is None:
         return None
-    return DraftCallback(draft_id=int(draft_id), action=action)
+    # Keyboards sent before the short codes still carry full action names;
+    # decode_action leaves those untouched.
+    return DraftCallback(draft_id=int(match.group(1)), action=decode_action(match.group(2)))
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from zoneinfo import ZoneInfo
 
 from aiogram import Router
@@ -19,7 +21,17 @@ from tg_news_bot.services.schedule_input import ScheduleInputService
 from tg_news_bot.services.trend_discovery import TrendDiscoveryService
 from tg_news_bot.services.workflow import DraftWorkflowService
 from tg_news_bot.services.workflow_types import DraftAction, TransitionRequest
-from tg_news_bot.telegram.callbacks import parse_callback
+from tg_news_bot.telegram.callbacks import DraftCallback, parse_callback
+
+CallbackHandler = Callable[[CallbackQuery, DraftCallback, datetime], Awaitable[None]]
+
+
+def _parse_compact_day(raw: str) -> date:
+    # Schedule buttons encode days as fixed-width YYYYMMDD; slicing avoids a
+    # strptime format parse on every press. date() still validates the value.
+    if len(raw) != 8 or not raw.isdigit():
+        raise ValueError(f"invalid day: {raw!r}")
+    return date(int(raw[:4]), int(raw[4:6]), int(raw[6:8]))
 
 
 @dataclass(slots=True)
@@ -35,6 +47,10 @@ class CallbackContext:
 def create_callback_router(context: CallbackContext) -> Router:
     router = Router()
     log = get_logger(__name__)
+    # The scheduler timezone is validated with the settings and never changes
+    # at runtime, so it is resolved once instead of on every time button.
+    schedule_tz = ZoneInfo(context.settings.scheduler.timezone)
+    background_jobs: set[asyncio.Task] = set()
 
     def parse_trend_callback(data: str) -> tuple[str, int, str] | None:
         parts = data.split(":")
@@ -58,6 +74,220 @@ def create_callback_router(context: CallbackContext) -> Router:
         except TelegramBadRequest:
             return
 
+    def launch_background_job(*, job_name: str, coro) -> None:  # noqa: ANN001
+        task = asyncio.create_task(coro)
+        background_jobs.add(task)
+
+        def _on_done(done_task: asyncio.Task) -> None:
+            background_jobs.discard(done_task)
+            if done_task.cancelled():
+                return
+            try:
+                done_task.result()
+            except Exception:
+                log.exception("callback.background_job_failed", job=job_name)
+
+        task.add_done_callback(_on_done)
+
+    async def cancel_edit_session(draft_id: int) -> None:
+        async with context.session_factory() as session:
+            async with session.begin():
+                await context.edit_sessions.cancel(session, draft_id=draft_id)
+
+    async def on_cancel_edit(
+        query: CallbackQuery, parsed: DraftCallback, now_utc: datetime  # noqa: ARG001
+    ) -> None:
+        # Nothing in the answer depends on the cancel, so the button is
+        # acknowledged right away and the session is closed in the background.
+        launch_background_job(
+            job_name="cancel_edit",
+            coro=cancel_edit_session(parsed.draft_id),
+        )
+        await safe_answer(query)
+
+    async def on_process_now(
+        query: CallbackQuery, parsed: DraftCallback, now_utc: datetime  # noqa: ARG001
+    ) -> None:
+        await context.workflow.process_editing_text(draft_id=parsed.draft_id)
+        await safe_answer(query, text="Выжимка и перевод обновлены")
+
+    def show_menu(menu: str) -> CallbackHandler:
+        async def on_show_menu(
+            query: CallbackQuery, parsed: DraftCallback, now_utc: datetime
+        ) -> None:
+            await context.workflow.show_schedule_menu(
+                draft_id=parsed.draft_id,
+                menu=menu,
+                now=now_utc,
+                timezone_name=context.settings.scheduler.timezone,
+            )
+            await safe_answer(query)
+
+        return on_show_menu
+
+    async def on_schedule_tz_info(
+        query: CallbackQuery, parsed: DraftCallback, now_utc: datetime  # noqa: ARG001
+    ) -> None:
+        await safe_answer(
+            query,
+            text=f"Таймзона расписания: {context.settings.scheduler.timezone}",
+        )
+
+    async def on_schedule_manual_open(
+        query: CallbackQuery, parsed: DraftCallback, now_utc: datetime  # noqa: ARG001
+    ) -> None:
+        if not query.message or not query.message.message_thread_id:
+            await safe_answer(query, text="Откройте меню в топике")
+            return
+        await context.schedule_input.open_session(
+            draft_id=parsed.draft_id,
+            chat_id=query.message.chat.id,
+            topic_id=query.message.message_thread_id,
+            user_id=query.from_user.id,
+        )
+        await safe_answer(
+            query,
+            text=(
+                "Введите дату/время: ДД.ММ.ГГГГ ЧЧ:ММ "
+                f"(TZ {context.settings.scheduler.timezone})"
+            ),
+        )
+
+    async def on_schedule_manual_cancel(
+        query: CallbackQuery, parsed: DraftCallback, now_utc: datetime  # noqa: ARG001
+    ) -> None:
+        await context.schedule_input.cancel_for_draft(draft_id=parsed.draft_id)
+        await safe_answer(query, text="Ввод даты отменён")
+
+    async def on_schedule_back(
+        query: CallbackQuery, parsed: DraftCallback, now_utc: datetime  # noqa: ARG001
+    ) -> None:
+        await context.schedule_input.cancel_for_draft(draft_id=parsed.draft_id)
+        await context.workflow.restore_state_keyboard(draft_id=parsed.draft_id)
+        await safe_answer(query)
+
+    async def on_schedule_day(
+        query: CallbackQuery, parsed: DraftCallback, now_utc: datetime
+    ) -> None:
+        raw = parsed.action.removeprefix("schedule_day_")
+        try:
+            selected_day = _parse_compact_day(raw)
+        except ValueError:
+            await safe_answer(query, text="Некорректная дата")
+            return
+        await context.workflow.show_schedule_menu(
+            draft_id=parsed.draft_id,
+            menu="times",
+            now=now_utc,
+            timezone_name=context.settings.scheduler.timezone,
+            selected_day=selected_day,
+        )
+        await safe_answer(query)
+
+    async def on_schedule_time(
+        query: CallbackQuery, parsed: DraftCallback, now_utc: datetime
+    ) -> None:
+        raw = parsed.action.removeprefix("schedule_time_")
+        selected_day = None
+        try:
+            day_raw, time_raw = raw.split("_", maxsplit=1)
+            selected_day = _parse_compact_day(day_raw)
+            if len(time_raw) != 4 or not time_raw.isdigit():
+                raise ValueError
+            hour = int(time_raw[:2])
+            minute = int(time_raw[2:])
+            if hour > 23 or minute > 59:
+                raise ValueError
+            local_dt = datetime(
+                selected_day.year,
+                selected_day.month,
+                selected_day.day,
+                hour,
+                minute,
+                tzinfo=schedule_tz,
+            )
+            schedule_at = local_dt.astimezone(timezone.utc)
+        except ValueError:
+            await safe_answer(query, text="Некорректное время")
+            return
+
+        if schedule_at <= now_utc:
+            if selected_day is not None:
+                await context.workflow.show_schedule_menu(
+                    draft_id=parsed.draft_id,
+                    menu="times",
+                    now=now_utc,
+                    timezone_name=context.settings.scheduler.timezone,
+                    selected_day=selected_day,
+                )
+            await safe_answer(query, text="Время уже прошло")
+            return
+
+        request = TransitionRequest(
+            draft_id=parsed.draft_id,
+            action=DraftAction.SCHEDULE,
+            user_id=query.from_user.id,
+            schedule_at=schedule_at,
+        )
+        await context.workflow.transition(request)
+        await context.schedule_input.cancel_for_draft(draft_id=parsed.draft_id)
+        await safe_answer(query)
+
+    async def on_schedule_at(
+        query: CallbackQuery, parsed: DraftCallback, now_utc: datetime
+    ) -> None:
+        raw = parsed.action.removeprefix("schedule_at_")
+        if raw.isdigit():
+            schedule_at = datetime.fromtimestamp(int(raw), tz=timezone.utc)
+            if schedule_at <= now_utc:
+                await safe_answer(query, text="Время уже прошло")
+                return
+            request = TransitionRequest(
+                draft_id=parsed.draft_id,
+                action=DraftAction.SCHEDULE,
+                user_id=query.from_user.id,
+                schedule_at=schedule_at,
+            )
+            await context.workflow.transition(request)
+            await context.schedule_input.cancel_for_draft(draft_id=parsed.draft_id)
+        await safe_answer(query)
+
+    async def on_transition(
+        query: CallbackQuery, parsed: DraftCallback, now_utc: datetime  # noqa: ARG001
+    ) -> None:
+        try:
+            action = DraftAction(parsed.action)
+        except ValueError:
+            await safe_answer(query)
+            return
+
+        request = TransitionRequest(
+            draft_id=parsed.draft_id,
+            action=action,
+            user_id=query.from_user.id,
+        )
+        await context.workflow.transition(request)
+        await safe_answer(query)
+
+    # Fixed actions resolve with one dict lookup; only the parametrised
+    # schedule_* families fall through to the short prefix scan.
+    exact_handlers: dict[str, CallbackHandler] = {
+        "cancel_edit": on_cancel_edit,
+        "process_now": on_process_now,
+        "schedule_open": show_menu("presets"),
+        "schedule_tz_info": on_schedule_tz_info,
+        "schedule_list": show_menu("list"),
+        "schedule_day_menu": show_menu("days"),
+        "schedule_manual_open": on_schedule_manual_open,
+        "schedule_manual_cancel": on_schedule_manual_cancel,
+        "schedule_back": on_schedule_back,
+    }
+    prefix_handlers: tuple[tuple[str, CallbackHandler], ...] = (
+        ("schedule_day_", on_schedule_day),
+        ("schedule_time_", on_schedule_time),
+        ("schedule_at_", on_schedule_at),
+    )
+
     @router.callback_query()
     async def handle_callback(query: CallbackQuery) -> None:
         if not is_admin(query):
@@ -119,183 +349,15 @@ def create_callback_router(context: CallbackContext) -> Router:
 
         try:
             now_utc = datetime.now(timezone.utc)
-
-            if parsed.action == "cancel_edit":
-                async with context.session_factory() as session:
-                    async with session.begin():
-                        await context.edit_sessions.cancel(session, draft_id=parsed.draft_id)
-                await safe_answer(query)
-                return
-
-            if parsed.action == "process_now":
-                await context.workflow.process_editing_text(draft_id=parsed.draft_id)
-                await safe_answer(query, text="Выжимка и перевод обновлены")
-                return
-
-            if parsed.action == "schedule_open":
-                await context.workflow.show_schedule_menu(
-                    draft_id=parsed.draft_id,
-                    menu="presets",
-                    now=now_utc,
-                    timezone_name=context.settings.scheduler.timezone,
-                )
-                await safe_answer(query)
-                return
-
-            if parsed.action == "schedule_tz_info":
-                await safe_answer(
-                    query,
-                    text=f"Таймзона расписания: {context.settings.scheduler.timezone}",
-                )
-                return
-
-            if parsed.action == "schedule_list":
-                await context.workflow.show_schedule_menu(
-                    draft_id=parsed.draft_id,
-                    menu="list",
-                    now=now_utc,
-                    timezone_name=context.settings.scheduler.timezone,
-                )
-                await safe_answer(query)
-                return
-
-            if parsed.action == "schedule_day_menu":
-                await context.workflow.show_schedule_menu(
-                    draft_id=parsed.draft_id,
-                    menu="days",
-                    now=now_utc,
-                    timezone_name=context.settings.scheduler.timezone,
-                )
-                await safe_answer(query)
-                return
-
-            if parsed.action == "schedule_manual_open":
-                if not query.message or not query.message.message_thread_id:
-                    await safe_answer(query, text="Откройте меню в топике")
-                    return
-                await context.schedule_input.open_session(
-                    draft_id=parsed.draft_id,
-                    chat_id=query.message.chat.id,
-                    topic_id=query.message.message_thread_id,
-                    user_id=query.from_user.id,
-                )
-                await safe_answer(
-                    query,
-                    text=(
-                        "Введите дату/время: ДД.ММ.ГГГГ ЧЧ:ММ "
-                        f"(TZ {context.settings.scheduler.timezone})"
-                    ),
-                )
-                return
-
-            if parsed.action == "schedule_manual_cancel":
-                await context.schedule_input.cancel_for_draft(draft_id=parsed.draft_id)
-                await safe_answer(query, text="Ввод даты отменён")
-                return
-
-            if parsed.action == "schedule_back":
-                await context.schedule_input.cancel_for_draft(draft_id=parsed.draft_id)
-                await context.workflow.restore_state_keyboard(draft_id=parsed.draft_id)
-                await safe_answer(query)
-                return
-
-            if parsed.action.startswith("schedule_day_"):
-                raw = parsed.action.removeprefix("schedule_day_")
-                try:
-                    selected_day = datetime.strptime(raw, "%Y%m%d").date()
-                except ValueError:
-                    await safe_answer(query, text="Некорректная дата")
-                    return
-                await context.workflow.show_schedule_menu(
-                    draft_id=parsed.draft_id,
-                    menu="times",
-                    now=now_utc,
-                    timezone_name=context.settings.scheduler.timezone,
-                    selected_day=selected_day,
-                )
-                await safe_answer(query)
-                return
-
-            if parsed.action.startswith("schedule_time_"):
-                raw = parsed.action.removeprefix("schedule_time_")
-                selected_day = None
-                try:
-                    day_raw, time_raw = raw.split("_", maxsplit=1)
-                    selected_day = datetime.strptime(day_raw, "%Y%m%d").date()
-                    if len(time_raw) != 4 or not time_raw.isdigit():
-                        raise ValueError
-                    hour = int(time_raw[:2])
-                    minute = int(time_raw[2:])
-                    if hour > 23 or minute > 59:
-                        raise ValueError
-                    tz = ZoneInfo(context.settings.scheduler.timezone)
-                    local_dt = datetime(
-                        selected_day.year,
-                        selected_day.month,
-                        selected_day.day,
-                        hour,
-                        minute,
-                        tzinfo=tz,
-                    )
-                    schedule_at = local_dt.astimezone(timezone.utc)
-                except ValueError:
-                    await safe_answer(query, text="Некорректное время")
-                    return
-
-                if schedule_at <= now_utc:
-                    if selected_day is not None:
-                        await context.workflow.show_schedule_menu(
-                            draft_id=parsed.draft_id,
-                            menu="times",
-                            now=now_utc,
-                            timezone_name=context.settings.scheduler.timezone,
-                            selected_day=selected_day,
-                        )
-                    await safe_answer(query, text="Время уже прошло")
-                    return
-
-                request = TransitionRequest(
-                    draft_id=parsed.draft_id,
-                    action=DraftAction.SCHEDULE,
-                    user_id=query.from_user.id,
-                    schedule_at=schedule_at,
-                )
-                await context.workflow.transition(request)
-                await context.schedule_input.cancel_for_draft(draft_id=parsed.draft_id)
-                await safe_answer(query)
-                return
-
-            if parsed.action.startswith("schedule_at_"):
-                raw = parsed.action.removeprefix("schedule_at_")
-                if raw.isdigit():
-                    schedule_at = datetime.fromtimestamp(int(raw), tz=timezone.utc)
-                    if schedule_at <= now_utc:
-                        await safe_answer(query, text="Время уже прошло")
-                        return
-                    request = TransitionRequest(
-                        draft_id=parsed.draft_id,
-                        action=DraftAction.SCHEDULE,
-                        user_id=query.from_user.id,
-                        schedule_at=schedule_at,
-                    )
-                    await context.workflow.transition(request)
-                    await context.schedule_input.cancel_for_draft(draft_id=parsed.draft_id)
-                await safe_answer(query)
-                return
-
-            try:
-                action = DraftAction(parsed.action)
-            except ValueError:
-                await safe_answer(query)
-                return
-
-            request = TransitionRequest(
-                draft_id=parsed.draft_id,
-                action=action,
-                user_id=query.from_user.id,
-            )
-            await context.workflow.transition(request)
-            await safe_answer(query)
+            handler = exact_handlers.get(parsed.action)
+            if handler is None:
+                for prefix, prefix_handler in prefix_handlers:
+                    if parsed.action.startswith(prefix):
+                        handler = prefix_handler
+                        break
+                else:
+                    handler = on_transition
+            await handler(query, parsed, now_utc)
         except LookupError:
             log.warning(
                 "callback.draft_not_found",
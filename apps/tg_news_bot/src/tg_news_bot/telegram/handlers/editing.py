@@ -21,11 +21,12 @@ class EditContext:
     session_factory: async_sessionmaker[AsyncSession]
     edit_sessions: EditSessionService
     publisher: PublisherPort
+    settings_repo: BotSettingsRepository | None = None
 
 
 def create_edit_router(context: EditContext) -> Router:
     router = Router()
-    settings_repo = BotSettingsRepository()
+    settings_repo = context.settings_repo or BotSettingsRepository()
 
     def is_admin(message: Message) -> bool:
         return bool(message.from_user and message.from_user.id == context.settings.admin_user_id)
@@ -65,27 +66,23 @@ def create_edit_router(context: EditContext) -> Router:
         except PublisherNotFound:
             return
 
-    @router.message()
+    # Gated by filters rather than early returns: a message that is not an
+    # admin edit in the editing topic must fall through to later routers
+    # (manual schedule input), which an executed handler would swallow.
+    @router.message(is_admin, is_editing_topic)
     async def handle_edit_message(message: Message) -> None:
-        if not is_admin(message):
-            return
-        if not await is_editing_topic(message):
-            return
-        if not message.message_thread_id:
-            return
-
-        text = None
+        # Each message field is read once and reused from locals.
+        photo = message.photo
         photo_file_id = None
         photo_unique_id = None
 
-        if message.photo:
-            largest = message.photo[-1]
+        if photo:
+            largest = photo[-1]
             photo_file_id = largest.file_id
             photo_unique_id = largest.file_unique_id
-            if message.caption:
-                text = message.caption
-        elif message.text:
-            text = message.text
+            text = message.caption or None
+        else:
+            text = message.text or None
 
         if not text and not photo_file_id:
             return
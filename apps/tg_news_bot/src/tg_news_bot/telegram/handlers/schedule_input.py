@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 
-from aiogram import Router
+from aiogram import F, Router
+from aiogram.enums import ContentType
 from aiogram.types import Message
 
 from tg_news_bot.config import Settings
+from tg_news_bot.logging import get_logger
 from tg_news_bot.ports.publisher import PublisherNotFound, PublisherPort
 from tg_news_bot.services.schedule_input import ScheduleInputService
 
@@ -17,48 +22,173 @@ class ScheduleInputContext:
     settings: Settings
     schedule_input: ScheduleInputService
     publisher: PublisherPort
+    # Strong references to in-flight deletes of accepted input messages.
+    background_jobs: set[asyncio.Task] = field(default_factory=set)
+    # Accepted updates are handed to at most `workers` tasks through a bounded
+    # queue, so slow processing never piles up dispatcher tasks.
+    workers: int = 2
+    queue_size: int = 100
+    queue: asyncio.Queue[_PendingInput] | None = None
+    # Identical rejections for the same topic within this window are sent once.
+    rejection_ttl_seconds: float = 2.0
+    clock: Callable[[], float] = time.monotonic
+    # How long dispatcher shutdown waits for queued input before dropping it.
+    shutdown_timeout_seconds: float = 10.0
+
+
+@dataclass(slots=True, frozen=True)
+class _PendingInput:
+    chat_id: int
+    topic_id: int
+    user_id: int
+    message_id: int
+    text: str
+
+
+log = get_logger(__name__)
+
+_REJECTION_CACHE_SIZE = 1024
+
+
+async def _run_side_effects(effects: list[Awaitable[object]]) -> None:
+    """Run independent Bot API side effects concurrently and log their failures."""
+    results = await asyncio.gather(*effects, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, PublisherNotFound):
+            log.error("schedule_input.side_effect_failed", exc_info=result)
 
 
 def create_schedule_input_router(context: ScheduleInputContext) -> Router:
     router = Router()
+    admin_id = context.settings.admin_user_id
+    if not admin_id:
+        # Nobody can pass the admin filter; skip registering the handler.
+        return router
+    # Bound once per router instead of resolved through context per message.
+    process_message = context.schedule_input.process_message
+    send_text = context.publisher.send_text
+    delete_message = context.publisher.delete_message
+    background_jobs = context.background_jobs
+    queue: asyncio.Queue[_PendingInput] = asyncio.Queue(maxsize=context.queue_size)
+    context.queue = queue
+    worker_count = max(1, context.workers)
+    running_workers = 0
+    shutdown_timeout = context.shutdown_timeout_seconds
+    clock = context.clock
+    rejection_ttl = context.rejection_ttl_seconds
+    # (chat_id, topic_id, text) -> monotonic time until which it is suppressed.
+    recent_rejections: dict[tuple[int, int, str], float] = {}
 
-    def is_admin(message: Message) -> bool:
-        return bool(message.from_user and message.from_user.id == context.settings.admin_user_id)
+    def is_repeated_rejection(key: tuple[int, int, str]) -> bool:
+        now = clock()
+        expires_at = recent_rejections.get(key)
+        if expires_at is not None and expires_at > now:
+            return True
+        if len(recent_rejections) >= _REJECTION_CACHE_SIZE:
+            for stale_key in [k for k, until in recent_rejections.items() if until <= now]:
+                del recent_rejections[stale_key]
+            if len(recent_rejections) >= _REJECTION_CACHE_SIZE:
+                recent_rejections.clear()
+        recent_rejections[key] = now + rejection_ttl
+        return False
 
-    @router.message()
+    # Magic filters reject other users' chatter at dispatch time without an
+    # extra coroutine per update. Most traffic is outside forum topics, so
+    # the thread check goes first.
+    @router.message(
+        F.message_thread_id,
+        F.content_type == ContentType.TEXT,
+        F.from_user.id == admin_id,
+        # Text messages always carry non-empty text, so indexing is safe.
+        F.text[0] != "/",
+    )
     async def handle_schedule_input(message: Message) -> None:
-        if not is_admin(message):
-            return
-        if not message.text:
-            return
-        if message.text.startswith("/"):
-            return
-        if not message.message_thread_id:
+        nonlocal running_workers
+        # Waits only when the queue is full, which applies backpressure to polling.
+        await queue.put(
+            _PendingInput(
+                chat_id=message.chat.id,
+                topic_id=message.message_thread_id,
+                user_id=message.from_user.id,
+                message_id=message.message_id,
+                text=message.text,
+            )
+        )
+        if running_workers < worker_count:
+            running_workers += 1
+            task = asyncio.create_task(worker())
+            background_jobs.add(task)
+            task.add_done_callback(background_jobs.discard)
+
+    async def worker() -> None:
+        # Workers drain the queue and exit when it is empty, so nothing is left
+        # running between bursts; input still queued at shutdown is handled by
+        # drain_on_shutdown.
+        nonlocal running_workers
+        while not queue.empty():
+            item = queue.get_nowait()
+            try:
+                await process(item)
+            except Exception:
+                log.exception("schedule_input.process_failed", chat_id=item.chat_id)
+            finally:
+                queue.task_done()
+        running_workers -= 1
+
+    @router.shutdown()
+    async def drain_on_shutdown() -> None:
+        # Polling has stopped: let the workers finish what is queued, and log
+        # whatever cannot be processed in time instead of losing it silently.
+        try:
+            await asyncio.wait_for(queue.join(), timeout=shutdown_timeout)
+        except TimeoutError:
+            while not queue.empty():
+                item = queue.get_nowait()
+                queue.task_done()
+                log.warning(
+                    "schedule_input.dropped_on_shutdown",
+                    chat_id=item.chat_id,
+                    topic_id=item.topic_id,
+                    message_id=item.message_id,
+                )
             return
+        if background_jobs:
+            await asyncio.wait(set(background_jobs), timeout=shutdown_timeout)
 
-        result = await context.schedule_input.process_message(
-            chat_id=message.chat.id,
-            topic_id=message.message_thread_id,
-            user_id=message.from_user.id,
-            text=message.text,
+    async def process(item: _PendingInput) -> None:
+        result = await process_message(
+            chat_id=item.chat_id,
+            topic_id=item.topic_id,
+            user_id=item.user_id,
+            text=item.text,
         )
         if result is None:
             return
 
         if result.accepted:
-            try:
-                await context.publisher.delete_message(
-                    chat_id=message.chat.id,
-                    message_id=message.message_id,
+            # The input is already applied; the remaining effects are cosmetic,
+            # so the worker does not wait for them. Further effects go into the
+            # same list and run concurrently with the delete.
+            effects: list[Awaitable[object]] = [
+                delete_message(
+                    chat_id=item.chat_id,
+                    message_id=item.message_id,
                 )
-            except PublisherNotFound:
-                return
+            ]
+            task = asyncio.create_task(_run_side_effects(effects))
+            background_jobs.add(task)
+            task.add_done_callback(background_jobs.discard)
             return
 
-        await context.publisher.send_text(
-            chat_id=message.chat.id,
-            topic_id=message.message_thread_id,
-            text=result.message,
+        feedback = result.message
+        if not feedback or feedback.isspace():
+            return
+        if is_repeated_rejection((item.chat_id, item.topic_id, feedback)):
+            return
+        await send_text(
+            chat_id=item.chat_id,
+            topic_id=item.topic_id,
+            text=feedback,
             parse_mode=None,
             keyboard=None,
         )
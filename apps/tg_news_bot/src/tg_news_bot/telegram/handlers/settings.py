@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import re
+import time
 from types import SimpleNamespace
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 from zoneinfo import ZoneInfo
 
 import feedparser
@@ -21,6 +23,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from tg_news_bot.config import Settings
 from tg_news_bot.db.models import BotSettings, DraftState, ScheduledPostStatus
 from tg_news_bot.logging import get_logger
+from tg_news_bot.utils.feeds import FEED_SNIFF_BYTES, probe_feed, sniff_feed_type
 from tg_news_bot.ports.publisher import (
     PublisherEditNotAllowed,
     PublisherNotFound,
@@ -46,10 +49,16 @@ from tg_news_bot.services.trend_discovery import TrendDiscoveryService
 from tg_news_bot.services.trends import TrendCollector
 from tg_news_bot.services.workflow import DraftWorkflowService
 from tg_news_bot.services.workflow_types import DraftAction, TransitionRequest
-from tg_news_bot.repositories.bot_settings import BotSettingsRepository
+from tg_news_bot.repositories.bot_settings import (
+    BotSettingsRepository,
+    CachedBotSettingsRepository,
+)
 
 log = get_logger(__name__)
 
+_RSS_VALIDATION_CACHE_SIZE = 512
+_RSS_VALIDATION_MAX_BYTES = 256_000
+
 
 @dataclass(slots=True)
 class SettingsContext:
@@ -68,6 +77,9 @@ class SettingsContext:
     autoplan: AutoPlanService | None = None
     trend_profile_repository: TrendTopicProfileRepository | None = None
     trend_candidates_repository: TrendCandidateRepository | None = None
+    settings_cache: CachedBotSettingsRepository | None = None
+    rss_validation_ttl_seconds: float = 600.0
+    clock: Callable[[], float] = time.monotonic
 
 
 def parse_source_args(raw_args: str) -> tuple[str, str]:
@@ -1186,7 +1198,7 @@ def create_settings_router(context: SettingsContext) -> Router:
         return bool(message.from_user and message.from_user.id == context.settings.admin_user_id)
 
     def valid_source_url(url: str) -> bool:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
 
     def parse_topics(raw: str) -> list[str]:
@@ -1651,16 +1663,69 @@ def create_settings_router(context: SettingsContext) -> Router:
                 text=page,
             )
 
+    validated_feeds: dict[str, tuple[float, str]] = {}
+
     async def validate_rss_url(url: str) -> tuple[bool, str]:
+        now = context.clock()
+        cached = validated_feeds.get(url)
+        if cached is not None and cached[0] > now:
+            return True, cached[1]
+        ok, validation_message = await fetch_and_validate_rss(url)
+        if ok:
+            if len(validated_feeds) >= _RSS_VALIDATION_CACHE_SIZE:
+                validated_feeds.clear()
+            validated_feeds[url] = (
+                now + context.rss_validation_ttl_seconds,
+                validation_message,
+            )
+        return ok, validation_message
+
+    async def check_source_url(url: str) -> tuple[bool, str]:
+        # An already enabled source was validated when it was added; skip the fetch.
+        async with context.session_factory() as session:
+            existing = await context.source_repository.get_by_url(session, url)
+        if existing is not None and existing.enabled:
+            return True, "OK (источник уже включён)"
+        return await validate_rss_url(url)
+
+    async def fetch_and_validate_rss(url: str) -> tuple[bool, str]:
+        # Validation only needs the feed head and a first entry, so the body is
+        # capped instead of parsing (and sanitizing) every item of a large feed.
+        chunks: list[bytes] = []
+        feed_type: str | None = None
+        sniffed = False
         try:
             async with AsyncClient(follow_redirects=True, timeout=20) as http:
-                response = await http.get(url)
+                async with http.stream("GET", url) as response:
+                    if response.status_code >= 400:
+                        return False, f"Источник вернул HTTP {response.status_code}."
+                    total = 0
+                    async for chunk in response.aiter_bytes():
+                        chunks.append(chunk)
+                        total += len(chunk)
+                        if not sniffed and total >= FEED_SNIFF_BYTES:
+                            sniffed = True
+                            feed_type = sniff_feed_type(b"".join(chunks))
+                            if feed_type is not None:
+                                break
+                        if total >= _RSS_VALIDATION_MAX_BYTES:
+                            break
         except Exception:
             return False, "Не удалось загрузить URL источника (network error)."
-        if response.status_code >= 400:
-            return False, f"Источник вернул HTTP {response.status_code}."
 
-        parsed = feedparser.parse(response.text)
+        body = b"".join(chunks)
+        if not sniffed:
+            feed_type = sniff_feed_type(body)
+        if feed_type is not None:
+            return True, f"OK ({feed_type})"
+
+        probe = probe_feed(body)
+        if probe.looks_like_feed:
+            return True, f"OK (entries: {probe.entries})"
+
+        # lxml found nothing usable (e.g. badly broken markup): fall back to
+        # feedparser's more forgiving parser before rejecting the source.
+        parsed = feedparser.parse(body)
         entries_count = len(parsed.entries)
         feed_title = parsed.feed.get("title")
         has_feed_meta = bool(feed_title or parsed.feed.get("link"))
@@ -1674,7 +1739,9 @@ def create_settings_router(context: SettingsContext) -> Router:
                 bot_settings = await context.repository.get_or_create(session)
                 updater(bot_settings)
                 await session.flush()
-                return bot_settings
+        if context.settings_cache is not None:
+            context.settings_cache.invalidate()
+        return bot_settings
 
     @router.message(Command("set_group"))
     async def set_group(message: Message) -> None:
@@ -2111,7 +2178,7 @@ def create_settings_router(context: SettingsContext) -> Router:
                     text="Некорректный URL. Нужен http/https RSS URL.",
                 )
                 return
-            ok, validation_message = await validate_rss_url(source_url)
+            ok, validation_message = await check_source_url(source_url)
             if not ok:
                 await context.publisher.send_text(
                     chat_id=message.chat.id,
@@ -2120,7 +2187,7 @@ def create_settings_router(context: SettingsContext) -> Router:
                 )
                 return
             if not source_name:
-                source_name = urlparse(source_url).netloc
+                source_name = urlsplit(source_url).netloc
             async with context.session_factory() as session:
                 async with session.begin():
                     existing = await context.source_repository.get_by_url(session, source_url)
@@ -2162,12 +2229,12 @@ def create_settings_router(context: SettingsContext) -> Router:
                 error_lines.append(f"{idx}. {source_url or '<empty>'} -> некорректный URL")
                 continue
 
-            ok, validation_message = await validate_rss_url(source_url)
+            ok, validation_message = await check_source_url(source_url)
             if not ok:
                 error_lines.append(f"{idx}. {source_url} -> {validation_message}")
                 continue
 
-            resolved_name = source_name or urlparse(source_url).netloc
+            resolved_name = source_name or urlsplit(source_url).netloc
             async with context.session_factory() as session:
                 async with session.begin():
                     existing = await context.source_repository.get_by_url(session, source_url)
@@ -0,0 +1,201 @@
+"""Streaming RSS/Atom helpers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+from lxml import etree
+
+
+FEED_SNIFF_BYTES = 512
+# The root element must be the first element of the document: only a BOM,
+# whitespace, the XML declaration and other processing instructions, comments
+# and a DOCTYPE may precede it. The tag name must end at a space, ">" or "/",
+# so custom elements such as <feed-item> never match.
+_FEED_ROOT_RE = re.compile(
+    rb"\A(?:\xef\xbb\xbf)?\s*(?:(?:<\?.*?\?>|<!--.*?-->|<!DOCTYPE[^>]*>)\s*)*"
+    rb"<(?P<root>rss|feed|rdf:RDF)[\s/>]",
+    re.IGNORECASE | re.DOTALL,
+)
+_JSON_FEED_RE = re.compile(rb"\A(?:\xef\xbb\xbf)?\s*\{\s*\"version\"\s*:\s*\"https?://jsonfeed")
+# A feed root alone is not enough: like probe_feed, the prefix must also show
+# an entry or feed metadata, so an empty <rss></rss> still gets rejected.
+_XML_FEED_CONTENT_RE = re.compile(rb"<(?:[\w.-]+:)?(?:item|entry|title|link)[\s/>]", re.IGNORECASE)
+_JSON_FEED_CONTENT_RE = re.compile(rb"\"(?:items|title|home_page_url)\"\s*:")
+_SNIFFED_FEED_TYPES = {b"rss": "rss", b"rdf:rdf": "rss", b"feed": "atom"}
+_ENTRY_TAGS = {"item", "entry"}
+_FEED_HEAD_TAGS = {"channel", "feed"}
+_SUMMARY_TAGS = ("summary", "description", "content")
+_DATE_TAGS = ("published", "pubDate", "updated", "date")
+# RSS 2.0 (no namespace), Atom and RSS 1.0 elements take precedence over
+# extension namespaces such as dc:, media: or itunes:.
+_CORE_NAMESPACES = {
+    None,
+    "http://www.w3.org/2005/Atom",
+    "http://purl.org/rss/1.0/",
+}
+
+
+@dataclass(slots=True)
+class FeedEntry:
+    title: str
+    link: str
+    summary: str
+    published: datetime | None
+
+
+@dataclass(slots=True)
+class FeedProbe:
+    entries: int
+    title: str
+    link: str
+
+    @property
+    def looks_like_feed(self) -> bool:
+        return bool(self.entries or self.title or self.link)
+
+
+def sniff_feed_type(head: bytes) -> str | None:
+    """Classify a feed by its first bytes; None means the prefix is ambiguous."""
+    head = head[:FEED_SNIFF_BYTES]
+    match = _FEED_ROOT_RE.match(head)
+    if match is not None:
+        if _XML_FEED_CONTENT_RE.search(head, match.end()) is None:
+            return None
+        return _SNIFFED_FEED_TYPES[match.group("root").lower()]
+    if _JSON_FEED_RE.match(head) and _JSON_FEED_CONTENT_RE.search(head):
+        return "json"
+    return None
+
+
+def probe_feed(body: bytes) -> FeedProbe:
+    """Count entries and read the feed title/link from a possibly truncated body."""
+    parser = etree.XMLPullParser(
+        events=("end",),
+        resolve_entities=False,
+        no_network=True,
+        recover=True,
+    )
+    probe = FeedProbe(entries=0, title="", link="")
+    try:
+        parser.feed(body)
+    except etree.XMLSyntaxError:
+        return probe
+    for _, element in parser.read_events():
+        name = _local_name(element)
+        if name in _ENTRY_TAGS:
+            probe.entries += 1
+            element.clear()
+            continue
+        parent = element.getparent()
+        if parent is None or _local_name(parent) not in _FEED_HEAD_TAGS:
+            continue
+        if name == "title" and not probe.title:
+            probe.title = "".join(element.itertext()).strip()
+        elif name == "link" and not probe.link:
+            probe.link = (element.get("href") or element.text or "").strip()
+    return probe
+
+
+async def stream_feed_entries(
+    http: httpx.AsyncClient,
+    url: str,
+    *,
+    limit: int,
+    headers: dict[str, str] | None = None,
+) -> list[FeedEntry]:
+    """Parse up to `limit` RSS/Atom entries while the body is still downloading."""
+    parser = etree.XMLPullParser(
+        events=("end",),
+        resolve_entities=False,
+        no_network=True,
+        recover=True,
+    )
+    entries: list[FeedEntry] = []
+    async with http.stream("GET", url, headers=headers) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            parser.feed(chunk)
+            if _drain_entries(parser, entries, limit):
+                return entries
+    parser.close()
+    _drain_entries(parser, entries, limit)
+    return entries
+
+
+def parse_feed_datetime(value: str | None) -> datetime | None:
+    text = (value or "").strip()
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _drain_entries(parser: etree.XMLPullParser, entries: list[FeedEntry], limit: int) -> bool:
+    for _, element in parser.read_events():
+        if _local_name(element) not in _ENTRY_TAGS:
+            continue
+        entries.append(_entry_from_element(element))
+        element.clear()
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+        if len(entries) >= limit:
+            return True
+    return False
+
+
+def _entry_from_element(element: etree._Element) -> FeedEntry:
+    fields: dict[str, str] = {}
+    extension_fields: dict[str, str] = {}
+    link = ""
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue
+        qname = etree.QName(child.tag)
+        name = qname.localname
+        if name == "link":
+            href = child.get("href")
+            if href is None:
+                link = link or (child.text or "").strip()
+            elif child.get("rel", "alternate") == "alternate" or not link:
+                link = href.strip()
+            continue
+        target = fields if qname.namespace in _CORE_NAMESPACES else extension_fields
+        if name not in target:
+            target[name] = "".join(child.itertext()).strip()
+    for name, value in extension_fields.items():
+        fields.setdefault(name, value)
+
+    summary = next((fields[name] for name in _SUMMARY_TAGS if fields.get(name)), "")
+    published = None
+    for name in _DATE_TAGS:
+        published = parse_feed_datetime(fields.get(name))
+        if published is not None:
+            break
+    return FeedEntry(
+        title=fields.get("title", ""),
+        link=link,
+        summary=summary,
+        published=published,
+    )
+
+
+def _local_name(element: etree._Element) -> str:
+    tag = element.tag
+    if not isinstance(tag, str):
+        return ""
+    return etree.QName(tag).localname
@@ -0,0 +1,87 @@
+"""Shared HTTP client helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+
+
+def create_http_client(
+    *,
+    timeout_seconds: float = 20.0,
+    connect_timeout_seconds: float = 5.0,
+    max_connections: int = 64,
+    max_keepalive_connections: int = 32,
+    max_connections_per_host: int | None = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    headers: dict[str, str] | None = None,
+) -> httpx.AsyncClient:
+    """Build a long-lived HTTP/2 client whose connections are reused across scans."""
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+    )
+    if max_connections_per_host is not None:
+        transport = HostLimitedTransport(transport, max_per_host=max_connections_per_host)
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds),
+        follow_redirects=True,
+        headers=headers,
+    )
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Cap in-flight requests per host; a slot is held until the response body is closed."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, *, max_per_host: int) -> None:
+        self._transport = transport
+        self._max_per_host = max(max_per_host, 1)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphores.get(request.url.host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_per_host)
+            self._semaphores[request.url.host] = semaphore
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, semaphore),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, semaphore: asyncio.Semaphore) -> None:
+        self._stream = stream
+        self._semaphore = semaphore
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._semaphore.release()
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import re
-from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+from urllib.parse import ParseResult, parse_qsl, urlencode, urljoin, urlparse, urlunparse
 
 
 TRACKING_PARAMS = {
@@ -26,9 +27,18 @@ TRACKING_PARAMS = {
     "mc_eid",
 }
 
+# Feeds and trend scans see the same URLs on every pass; the caches are bounded.
+_URL_CACHE_SIZE = 16384
 
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
 def normalize_url(raw_url: str) -> str:
-    parsed = urlparse(raw_url)
+    return normalize_parsed_url(urlparse(raw_url))[0]
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def normalize_parsed_url(parsed: ParseResult) -> tuple[str, str]:
+    """Return the normalized URL and its domain from an already parsed URL."""
     scheme = parsed.scheme.lower() if parsed.scheme else "https"
     netloc = parsed.netloc.lower()
     path = parsed.path or "/"
@@ -45,11 +55,16 @@ def normalize_url(raw_url: str) -> str:
     ]
     query = urlencode(sorted(query_params))
 
-    return urlunparse((scheme, netloc, path, "", query, ""))
+    normalized = urlunparse((scheme, netloc, path, "", query, ""))
+    return normalized, _domain_from_netloc(netloc)
 
 
+@lru_cache(maxsize=_URL_CACHE_SIZE)
 def extract_domain(raw_url: str) -> str:
-    netloc = urlparse(raw_url).netloc.lower()
+    return _domain_from_netloc(urlparse(raw_url).netloc.lower())
+
+
+def _domain_from_netloc(netloc: str) -> str:
     if netloc.startswith("www."):
         return netloc[4:]
     return netloc
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import orjson
+import pytest
+
+from tg_news_bot.config import TelegramSettings
+from tg_news_bot.main import create_bot_session
+
+
+@pytest.mark.asyncio
+async def test_bot_session_configures_shared_keepalive_pool() -> None:
+    session = create_bot_session(
+        TelegramSettings(connection_limit=32, keepalive_timeout_seconds=90)
+    )
+    try:
+        client = await session.create_session()
+        connector = client.connector
+
+        assert connector.limit == 32
+        assert connector._keepalive_timeout == 90  # noqa: SLF001
+        assert session.json_loads is orjson.loads
+    finally:
+        await session.close()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from tg_news_bot.db.models import BotSettings
+from tg_news_bot.repositories.bot_settings import CachedBotSettingsRepository
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingRepo(CachedBotSettingsRepository):
+    def __init__(self, **kwargs) -> None:  # noqa: ANN003
+        super().__init__(**kwargs)
+        self.loads = 0
+
+    async def get(self, session) -> BotSettings | None:  # noqa: ANN001, ARG002
+        self.loads += 1
+        return BotSettings(id=1, group_chat_id=-1001, editing_topic_id=12)
+
+
+@pytest.mark.asyncio
+async def test_cached_settings_are_reused_within_ttl() -> None:
+    clock = _Clock()
+    repo = _CountingRepo(ttl_seconds=30, clock=clock)
+
+    first = await repo.get_or_create(object())
+    clock.now += 29
+    second = await repo.get_or_create(object())
+
+    assert second is first
+    assert repo.loads == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_settings_reload_after_ttl_or_invalidate() -> None:
+    clock = _Clock()
+    repo = _CountingRepo(ttl_seconds=30, clock=clock)
+
+    await repo.get_or_create(object())
+    clock.now += 30
+    await repo.get_or_create(object())
+    repo.invalidate()
+    await repo.get_or_create(object())
+
+    assert repo.loads == 3
+
+
+class _SyncSessionAdapter:
+    """Expose a sync Session through the async calls the repository makes."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    async def execute(self, statement):  # noqa: ANN001, ANN201
+        return self._session.execute(statement)
+
+    def add(self, instance) -> None:  # noqa: ANN001
+        self._session.add(instance)
+
+    async def flush(self) -> None:
+        self._session.flush()
+
+
+@pytest.mark.asyncio
+async def test_cached_settings_survive_rollback_of_loading_session() -> None:
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE bot_settings ("
+            "id INTEGER PRIMARY KEY, group_chat_id BIGINT, inbox_topic_id BIGINT,"
+            " editing_topic_id BIGINT, ready_topic_id BIGINT, scheduled_topic_id BIGINT,"
+            " published_topic_id BIGINT, archive_topic_id BIGINT,"
+            " trend_candidates_topic_id BIGINT, channel_id BIGINT, autoplan_rules TEXT,"
+            " created_at TIMESTAMP, updated_at TIMESTAMP)"
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO bot_settings (id, group_chat_id, editing_topic_id, created_at, updated_at)"
+            " VALUES (1, -1001, 12, '2026-01-01 00:00:00', '2026-01-01 00:00:00')"
+        )
+    repo = CachedBotSettingsRepository(ttl_seconds=30, clock=_Clock())
+
+    with Session(engine) as session:
+        session.begin()
+        first = await repo.get_or_create(_SyncSessionAdapter(session))
+        session.rollback()
+
+    with Session(engine) as session:
+        cached = await repo.get_or_create(_SyncSessionAdapter(session))
+
+    assert cached is first
+    assert (cached.group_chat_id, cached.editing_topic_id) == (-1001, 12)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from tg_news_bot.services.workflow_types import DraftAction
+from tg_news_bot.telegram.callbacks import (
+    DraftCallback,
+    build_callback,
+    callback_prefix,
+    encode_action,
+    parse_callback,
+)
+
+
+def test_parse_callback_round_trips_build_callback() -> None:
+    data = build_callback(42, DraftAction.TO_READY)
+
+    assert parse_callback(data) == DraftCallback(draft_id=42, action="to_ready")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "",
+        "draft:42",
+        "draft:x:to_ready",
+        "draft:-1:to_ready",
+        "other:42:to_ready",
+        "draft:42:to_ready:extra",
+    ],
+)
+def test_parse_callback_rejects_malformed_data(data: str) -> None:
+    assert parse_callback(data) is None
+
+
+def test_callback_prefix_matches_build_callback() -> None:
+    assert callback_prefix(7) + encode_action("schedule_open") == build_callback(7, "schedule_open")
+
+
+@pytest.mark.parametrize(
+    ("action", "wire"),
+    [
+        ("schedule_manual_cancel", "mc"),
+        ("publish_now", "p"),
+        ("schedule_day_20250103", "d20250103"),
+        ("schedule_time_20250103_0930", "t20250103_0930"),
+        ("schedule_at_1735900000", "at1735900000"),
+    ],
+)
+def test_actions_use_short_codes_on_the_wire(action: str, wire: str) -> None:
+    data = build_callback(12345, action)
+
+    assert data == f"draft:12345:{wire}"
+    assert parse_callback(data) == DraftCallback(draft_id=12345, action=action)
+
+
+@pytest.mark.parametrize(
+    "action",
+    ["schedule_manual_cancel", "schedule_day_20250103", "repost", "unknown_action"],
+)
+def test_parse_callback_keeps_full_action_names(action: str) -> None:
+    assert parse_callback(f"draft:5:{action}") == DraftCallback(draft_id=5, action=action)
@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from types import SimpleNamespace
@@ -231,6 +232,21 @@ async def test_schedule_day_menu_and_day_callback() -> None:
     assert workflow.show_calls[1]["selected_day"] == date(2026, 2, 17)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("raw_day", ["20260230", "2026021", "2026-2-17", "2026021x"])
+async def test_schedule_day_callback_rejects_malformed_day(raw_day: str) -> None:
+    workflow = _WorkflowSpy()
+    edit_sessions = _EditSessionsSpy()
+    schedule_input = _ScheduleInputSpy()
+    handler = _get_handler(_make_context(workflow, edit_sessions, schedule_input))
+    query = _Query(data=f"draft:7:schedule_day_{raw_day}")
+
+    await handler(query)
+
+    assert workflow.show_calls == []
+    assert query.answers == ["Некорректная дата"]
+
+
 @pytest.mark.asyncio
 async def test_schedule_manual_open_starts_session() -> None:
     workflow = _WorkflowSpy()
@@ -374,8 +390,9 @@ async def test_cancel_edit_callback_uses_edit_session_service() -> None:
 
     await handler(query)
 
-    assert edit_sessions.cancel_calls == [22]
     assert query.answers == [None]
+    await asyncio.sleep(0)
+    assert edit_sessions.cancel_calls == [22]
 
 
 @pytest.mark.asyncio
@@ -16,3 +16,26 @@ async def test_safe_delete_ignores_delete_not_allowed() -> None:
     service = EditSessionService(_DeleteDeniedPublisher())
 
     await service._safe_delete(chat_id=-1001, message_id=42)
+
+
+class _BatchDeleteDeniedPublisher:
+    def __init__(self) -> None:
+        self.deleted: list[int] = []
+
+    async def delete_messages(self, *, chat_id: int, message_ids: list[int]) -> None:  # noqa: ARG002
+        raise PublisherEditNotAllowed("message can't be deleted")
+
+    async def delete_message(self, *, chat_id: int, message_id: int) -> None:  # noqa: ARG002
+        if message_id == 41:
+            raise PublisherEditNotAllowed("message can't be deleted")
+        self.deleted.append(message_id)
+
+
+@pytest.mark.asyncio
+async def test_delete_messages_falls_back_to_single_deletes() -> None:
+    publisher = _BatchDeleteDeniedPublisher()
+    service = EditSessionService(publisher)
+
+    await service._delete_messages(-1001, [41, 42])
+
+    assert publisher.deleted == [42]
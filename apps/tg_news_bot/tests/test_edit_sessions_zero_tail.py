@@ -111,6 +111,7 @@ class _Publisher:
     next_message_id: int = 1000
     instruction_message_ids: list[int] = field(default_factory=list)
     deleted_message_ids: list[int] = field(default_factory=list)
+    delete_batches: list[list[int]] = field(default_factory=list)
     post_edit_calls: int = 0
     card_edit_calls: int = 0
     fail_card_send: bool = False
@@ -192,6 +193,10 @@ class _Publisher:
     async def delete_message(self, *, chat_id: int, message_id: int) -> None:  # noqa: ARG002
         self.deleted_message_ids.append(message_id)
 
+    async def delete_messages(self, *, chat_id: int, message_ids: list[int]) -> None:  # noqa: ARG002
+        self.delete_batches.append(list(message_ids))
+        self.deleted_message_ids.extend(message_ids)
+
 
 @dataclass
 class _InstructionNotModifiedPublisher(_Publisher):
@@ -397,6 +402,7 @@ async def test_apply_edit_can_update_manual_hashtags_without_text_rewrite() -> N
     assert publisher.post_edit_calls == 1
     assert active_session.status == EditSessionStatus.COMPLETED
     assert 801 in publisher.deleted_message_ids
+    assert publisher.delete_batches == [[801, 999]]
 
 
 @pytest.mark.asyncio
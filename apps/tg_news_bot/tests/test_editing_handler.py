@@ -228,8 +228,13 @@ async def test_non_admin_edit_message_is_ignored(monkeypatch: pytest.MonkeyPatch
         edit_sessions=edit_sessions,
         publisher=publisher,
     )
-    _, edit_handler = _get_handlers(context)
+    edit_handler = create_edit_router(context).message.handlers[1]
 
-    await edit_handler(_message(user_id=999, text="ignored"))
+    admin_passed, _ = await edit_handler.check(_message(text="edit"))
+    stranger_passed, _ = await edit_handler.check(_message(user_id=999, text="ignored"))
+    other_topic_passed, _ = await edit_handler.check(_message(topic_id=33, text="18:00"))
 
+    assert admin_passed
+    assert not stranger_passed
+    assert not other_topic_passed
     assert edit_sessions.payloads == []
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from tg_news_bot.utils.feeds import probe_feed, sniff_feed_type, stream_feed_entries
+
+
+class _StreamResponse:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def __aenter__(self):  # noqa: ANN201
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001, ANN201
+        return False
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def aiter_bytes(self):  # noqa: ANN201
+        yield self._body
+
+
+class _HTTPFake:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def stream(self, method: str, url: str, **kwargs):  # noqa: ANN003, ANN201
+        return _StreamResponse(self._body)
+
+
+@pytest.mark.asyncio
+async def test_stream_feed_entries_prefers_core_rss_fields_over_extensions() -> None:
+    body = (
+        '<?xml version="1.0"?>'
+        '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"'
+        ' xmlns:media="http://search.yahoo.com/mrss/">'
+        "<channel><item>"
+        "<dc:title>DC first</dc:title>"
+        "<media:description>Media summary</media:description>"
+        "<title>Real title</title>"
+        "<description>Real summary</description>"
+        "<link>https://example.com/a</link>"
+        "<dc:date>2026-02-01T10:00:00Z</dc:date>"
+        "</item></channel></rss>"
+    ).encode("utf-8")
+
+    entries = await stream_feed_entries(_HTTPFake(body), "https://example.com/rss", limit=5)
+
+    assert len(entries) == 1
+    assert entries[0].title == "Real title"
+    assert entries[0].summary == "Real summary"
+    assert entries[0].link == "https://example.com/a"
+    assert entries[0].published == datetime(2026, 2, 1, 10, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_stream_feed_entries_reads_atom_entries() -> None:
+    body = (
+        '<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        "<entry><title>Atom title</title>"
+        '<link rel="self" href="https://example.com/self"/>'
+        '<link rel="alternate" href="https://example.com/post"/>'
+        "<summary>Atom summary</summary>"
+        "<updated>2026-02-02T08:30:00+03:00</updated></entry>"
+        "</feed>"
+    ).encode("utf-8")
+
+    entries = await stream_feed_entries(_HTTPFake(body), "https://example.com/atom", limit=5)
+
+    assert [(row.title, row.link, row.summary) for row in entries] == [
+        ("Atom title", "https://example.com/post", "Atom summary")
+    ]
+    assert entries[0].published == datetime(2026, 2, 2, 5, 30, tzinfo=timezone.utc)
+
+
+def test_probe_feed_reads_rss_head_from_truncated_body() -> None:
+    body = (
+        b"<?xml version='1.0'?><rss version='2.0'><channel>"
+        b"<title>News</title><link>https://example.com</link>"
+        b"<item><title>A</title></item><item><title>B</title></item>"
+        b"<item><title>C"
+    )
+
+    probe = probe_feed(body)
+
+    assert probe.entries == 2
+    assert probe.title == "News"
+    assert probe.link == "https://example.com"
+    assert probe.looks_like_feed
+
+
+def test_probe_feed_reads_atom_link_href() -> None:
+    body = (
+        b'<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>'
+        b'<link href="https://example.com/"/><entry><title>A</title></entry></feed>'
+    )
+
+    probe = probe_feed(body)
+
+    assert (probe.entries, probe.title, probe.link) == (1, "Atom", "https://example.com/")
+
+
+def test_probe_feed_rejects_html_page() -> None:
+    probe = probe_feed(b"<html><head><title>Page</title></head><body></body></html>")
+
+    assert not probe.looks_like_feed
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (b"<?xml version='1.0'?>\n<rss version='2.0'><channel><title>News", "rss"),
+        (
+            b"\xef\xbb\xbf<?xml version='1.0'?><?xml-stylesheet href='s.xsl'?>"
+            b"<!-- generated --><rss version='2.0'><channel><item>",
+            "rss",
+        ),
+        (b'<rdf:RDF xmlns="http://purl.org/rss/1.0/"><channel><title>', "rss"),
+        (b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>', "atom"),
+        (b'  {"version": "https://jsonfeed.org/version/1.1", "items": []}', "json"),
+        (b"<!doctype html><html><head><title>Page</title>", None),
+        (b"<!doctype html><html><body><feed-item><title>A</title></feed-item>", None),
+        (b"<html><body><channel-list><channel>x</channel></channel-list>", None),
+        (b"<html><body><rss version='2.0'><channel><title>Embedded", None),
+        (b'<rss version="2.0"></rss>', None),
+        (b'{"version": "https://jsonfeed.org/version/1.1"}', None),
+    ],
+)
+def test_sniff_feed_type(head: bytes, expected: str | None) -> None:
+    assert sniff_feed_type(head) == expected
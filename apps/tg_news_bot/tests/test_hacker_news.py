@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+
+import orjson
+import pytest
+
+from tg_news_bot.services import hacker_news
+from tg_news_bot.services.hacker_news import (
+    HN_ITEM_URL,
+    HN_TOP_STORIES_URL,
+    fetch_hn_items,
+    fetch_hn_top_story_ids,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_item_cache():  # noqa: ANN202
+    hacker_news._item_cache.clear()  # noqa: SLF001
+    yield
+    hacker_news._item_cache.clear()  # noqa: SLF001
+
+
+class _Response:
+    def __init__(self, payload, status_code: int = 200) -> None:  # noqa: ANN001
+        self._payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    @property
+    def content(self) -> bytes:
+        return orjson.dumps(self._payload)
+
+
+class _HTTPFake:
+    def __init__(self, payloads: dict[str, _Response]) -> None:
+        self._payloads = payloads
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.urls: list[str] = []
+
+    async def get(self, url: str, **kwargs):  # noqa: ANN003, ANN201
+        self.urls.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return self._payloads[url]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_hn_top_story_ids_skips_invalid_ids() -> None:
+    http = _HTTPFake({HN_TOP_STORIES_URL: _Response([1, "2", None, "x", 5])})
+
+    assert await fetch_hn_top_story_ids(http, limit=4) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_fetch_hn_items_runs_concurrently_and_keeps_order() -> None:
+    payloads = {
+        HN_ITEM_URL.format(story_id=story_id): _Response({"id": story_id, "title": f"Story {story_id}"})
+        for story_id in range(1, 9)
+    }
+    payloads[HN_ITEM_URL.format(story_id=3)] = _Response({}, status_code=500)
+    payloads[HN_ITEM_URL.format(story_id=4)] = _Response(None)
+    http = _HTTPFake(payloads)
+
+    rows = await fetch_hn_items(http, list(range(1, 9)), concurrency=4)
+
+    assert [row["id"] if row else None for row in rows] == [1, 2, None, None, 5, 6, 7, 8]
+    assert 1 < http.max_in_flight <= 4
+
+
+@pytest.mark.asyncio
+async def test_fetch_hn_items_reuses_cached_payloads_until_expiry(monkeypatch) -> None:  # noqa: ANN001
+    clock = [1000.0]
+    cache = hacker_news._ItemCache(  # noqa: SLF001
+        maxsize=16,
+        ttl_seconds=hacker_news.HN_ITEM_CACHE_TTL_SECONDS,
+        clock=lambda: clock[0],
+    )
+    monkeypatch.setattr(hacker_news, "_item_cache", cache)
+    payloads = {
+        HN_ITEM_URL.format(story_id=1): _Response({"id": 1}),
+        HN_ITEM_URL.format(story_id=2): _Response({}, status_code=500),
+    }
+    http = _HTTPFake(payloads)
+
+    await fetch_hn_items(http, [1, 2])
+    second = await fetch_hn_items(http, [1, 2])
+
+    assert second == [{"id": 1}, None]
+    assert http.urls.count(HN_ITEM_URL.format(story_id=1)) == 1
+    assert http.urls.count(HN_ITEM_URL.format(story_id=2)) == 2
+
+    clock[0] += hacker_news.HN_ITEM_CACHE_TTL_SECONDS
+    await fetch_hn_items(http, [1])
+
+    assert http.urls.count(HN_ITEM_URL.format(story_id=1)) == 2
+
+
+def test_item_cache_evicts_oldest_entry_when_full() -> None:
+    cache = hacker_news._ItemCache(maxsize=2, ttl_seconds=60.0)  # noqa: SLF001
+    cache.put(1, {"id": 1})
+    cache.put(2, {"id": 2})
+    cache.put(3, {"id": 3})
+
+    assert cache.get(1) is None
+    assert cache.get(2) == {"id": 2}
+    assert cache.get(3) == {"id": 3}
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from tg_news_bot.utils.http import HostLimitedTransport, create_http_client
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    def __init__(self) -> None:
+        self.in_flight: dict[str, int] = {}
+        self.max_in_flight: dict[str, int] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.max_in_flight[host] = max(self.max_in_flight.get(host, 0), self.in_flight[host])
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight[host] -= 1
+        if request.url.path == "/boom":
+            raise httpx.ConnectError("boom", request=request)
+        return httpx.Response(200, content=b"ok")
+
+
+@pytest.mark.asyncio
+async def test_host_limited_transport_caps_requests_per_host() -> None:
+    inner = _CountingTransport()
+    async with httpx.AsyncClient(transport=HostLimitedTransport(inner, max_per_host=2)) as http:
+        urls = [f"https://a.example/{index}" for index in range(6)]
+        urls += [f"https://b.example/{index}" for index in range(3)]
+        responses = await asyncio.gather(*(http.get(url) for url in urls))
+
+    assert all(response.text == "ok" for response in responses)
+    assert inner.max_in_flight == {"a.example": 2, "b.example": 2}
+
+
+@pytest.mark.asyncio
+async def test_host_limited_transport_releases_slot_on_errors_and_streams() -> None:
+    transport = HostLimitedTransport(_CountingTransport(), max_per_host=1)
+    async with httpx.AsyncClient(transport=transport) as http:
+        with pytest.raises(httpx.ConnectError):
+            await http.get("https://a.example/boom")
+        async with http.stream("GET", "https://a.example/stream") as response:
+            assert await response.aread() == b"ok"
+        response = await asyncio.wait_for(http.get("https://a.example/next"), timeout=1)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_create_http_client_applies_host_limit_by_default() -> None:
+    http = create_http_client(headers={"User-Agent": "tg-news-bot/1.0"})
+    try:
+        assert isinstance(http._transport, HostLimitedTransport)  # noqa: SLF001
+        assert http.headers["User-Agent"] == "tg-news-bot/1.0"
+    finally:
+        await http.aclose()
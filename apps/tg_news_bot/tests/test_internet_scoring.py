@@ -106,3 +106,41 @@ def test_score_item_limits_signal_boost_by_total_cap() -> None:
     assert result.components["internet_signal_boost"] == pytest.approx(0.4)
     assert result.total == pytest.approx(0.4)
     assert result.signal_hits[0] == "openai"
+
+
+def test_score_item_ranks_signal_boosts_once_per_context() -> None:
+    service = InternetScoringService(
+        settings=InternetScoringSettings(
+            source_weights={},
+            default_source_weight=0.0,
+            signal_keyword_multiplier=1.0,
+            max_signal_boost_per_keyword=1.0,
+            max_total_signal_boost=5.0,
+            max_signal_matches_per_item=5,
+            google_trends_enabled=False,
+        ),
+        trends_settings=TrendsSettings(),
+        session_factory=object(),
+    )
+    boosts = {"ai": 0.2, "zero": 0.0, "openai": 0.9}
+
+    def _score(text: str, signal_boosts: dict[str, float]):  # noqa: ANN202
+        return service.score_item(
+            text=text,
+            source_name="HN",
+            seed_hits=[],
+            exclude_hits=[],
+            trusted_domain_match=False,
+            source_trust_score=None,
+            signal_boosts=signal_boosts,
+        )
+
+    first = _score("openai and ai with zero", boosts)
+    ranked = service._ranked_signal_boosts(boosts)  # noqa: SLF001
+    second = _score("ai only", boosts)
+
+    assert first.signal_hits == ["openai", "ai"]
+    assert second.signal_hits == ["ai"]
+    assert service._ranked_signal_boosts(boosts) is ranked  # noqa: SLF001
+    assert ranked == [("openai", 0.9), ("ai", 0.2)]
+    assert _score("ai only", {"ai": 0.5}).total == pytest.approx(0.5)
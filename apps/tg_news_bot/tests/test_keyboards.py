@@ -115,4 +115,14 @@ def test_build_state_keyboard_editing_has_process_button() -> None:
 
     first_button = keyboard.inline_keyboard[0][0]
     assert first_button.text == "Сделать выжимку"
-    assert first_button.callback_data == "draft:1:process_now"
+    assert first_button.callback_data == "draft:1:pn"
+
+
+def test_build_state_keyboard_reuses_layout_for_same_draft_and_state() -> None:
+    first = build_state_keyboard(_draft(), DraftState.READY)
+    second = build_state_keyboard(_draft(), DraftState.READY)
+    moved = build_state_keyboard(_draft(), DraftState.SCHEDULED)
+
+    assert second is first
+    assert moved is not first
+    assert moved.inline_keyboard[0][0].callback_data == "draft:1:so"
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from tg_news_bot.ports.publisher import PublisherNotFound
+from tg_news_bot.services.markup_coalescer import ReplyMarkupCoalescer
+
+
+@dataclass
+class _PublisherSpy:
+    calls: list[tuple[int, int, object]] = field(default_factory=list)
+    error: Exception | None = None
+
+    async def edit_reply_markup(self, *, chat_id: int, message_id: int, keyboard) -> None:  # noqa: ANN001
+        self.calls.append((chat_id, message_id, keyboard))
+        if self.error is not None:
+            raise self.error
+
+
+@pytest.mark.asyncio
+async def test_coalescer_sends_only_latest_keyboard_per_message() -> None:
+    publisher = _PublisherSpy()
+    coalescer = ReplyMarkupCoalescer(publisher, window_seconds=0.01)
+
+    await asyncio.gather(
+        coalescer.submit(chat_id=1, message_id=10, keyboard="days"),
+        coalescer.submit(chat_id=1, message_id=10, keyboard="hours"),
+        coalescer.submit(chat_id=1, message_id=11, keyboard="other"),
+        coalescer.submit(chat_id=1, message_id=10, keyboard="minutes"),
+    )
+
+    assert sorted(publisher.calls) == [(1, 10, "minutes"), (1, 11, "other")]
+
+
+@pytest.mark.asyncio
+async def test_coalescer_propagates_errors_to_every_caller() -> None:
+    publisher = _PublisherSpy(error=PublisherNotFound("gone"))
+    coalescer = ReplyMarkupCoalescer(publisher, window_seconds=0.01)
+
+    results = await asyncio.gather(
+        coalescer.submit(chat_id=1, message_id=10, keyboard="a"),
+        coalescer.submit(chat_id=1, message_id=10, keyboard="b"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(item, PublisherNotFound) for item in results)
+    assert publisher.calls == [(1, 10, "b")]
+
+    publisher.error = None
+    await coalescer.submit(chat_id=1, message_id=10, keyboard="c")
+    assert publisher.calls[-1] == (1, 10, "c")
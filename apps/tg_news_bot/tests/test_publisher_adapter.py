@@ -88,7 +88,7 @@ async def test_publisher_adapter_delegates_send_and_edit_calls() -> None:
     await adapter.edit_reply_markup(
         chat_id=-1001,
         message_id=77,
-        keyboard=None,
+        keyboard="menu",
     )
     await adapter.delete_message(chat_id=-1001, message_id=77)
 
@@ -137,3 +137,51 @@ async def test_publisher_adapter_maps_upstream_not_found() -> None:
 
     with pytest.raises(PublisherNotFound):
         await adapter.delete_message(chat_id=-1001, message_id=7)
+
+
+@pytest.mark.asyncio
+async def test_publisher_adapter_skips_edit_text_when_content_is_unchanged() -> None:
+    spy = _PublisherSpy()
+    adapter = PublisherAdapter(spy)  # type: ignore[arg-type]
+
+    sent = await adapter.send_text(chat_id=-1001, topic_id=12, text="card v1")
+    for text in ("card v1", "card v2", "card v2"):
+        await adapter.edit_text(
+            chat_id=-1001,
+            message_id=sent.message_id,
+            text=text,
+            keyboard=None,
+            disable_web_page_preview=True,
+        )
+    await adapter.edit_reply_markup(
+        chat_id=-1001, message_id=sent.message_id, keyboard="menu"
+    )
+    await adapter.edit_text(
+        chat_id=-1001,
+        message_id=sent.message_id,
+        text="card v2",
+        keyboard=None,
+    )
+
+    edits = [kwargs["text"] for name, kwargs in spy.calls if name == "edit_text"]
+    assert edits == ["card v2", "card v2"]
+
+
+@pytest.mark.asyncio
+async def test_publisher_adapter_skips_edit_reply_markup_when_keyboard_is_unchanged() -> None:
+    spy = _PublisherSpy()
+    adapter = PublisherAdapter(spy)  # type: ignore[arg-type]
+    content = PostContent(text="post", photo=None)
+
+    sent = await adapter.send_post(chat_id=-1001, topic_id=12, content=content, keyboard="state")
+    for keyboard in ("state", "schedule", "schedule", "state"):
+        await adapter.edit_reply_markup(
+            chat_id=-1001,
+            message_id=sent.message_id,
+            keyboard=keyboard,
+        )
+    await adapter.delete_message(chat_id=-1001, message_id=sent.message_id)
+    await adapter.edit_reply_markup(chat_id=-1001, message_id=sent.message_id, keyboard="state")
+
+    markups = [kwargs["keyboard"] for name, kwargs in spy.calls if name == "edit_reply_markup"]
+    assert markups == ["schedule", "state", "state"]
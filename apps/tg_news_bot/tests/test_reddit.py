@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import orjson
+
+from tg_news_bot.services.reddit import RedditPost, parse_reddit_listing
+
+
+def test_parse_reddit_listing_extracts_used_fields() -> None:
+    content = orjson.dumps(
+        {
+            "kind": "Listing",
+            "data": {
+                "children": [
+                    {
+                        "kind": "t3",
+                        "data": {
+                            "title": "Fusion milestone",
+                            "url": "https://example.com/fusion",
+                            "selftext": "",
+                            "created_utc": 1760000000.0,
+                            "ups": 1200,
+                        },
+                    },
+                    "garbage",
+                    {"kind": "t3", "data": {"title": "No timestamp", "url": None}},
+                    {"kind": "t3", "data": {"title": "Over limit"}},
+                ]
+            },
+        }
+    )
+
+    assert parse_reddit_listing(content, limit=3) == [
+        RedditPost(
+            title="Fusion milestone",
+            url="https://example.com/fusion",
+            selftext="",
+            created_utc=1760000000,
+        ),
+        RedditPost(title="No timestamp", url="", selftext="", created_utc=None),
+    ]
+
+
+def test_parse_reddit_listing_ignores_unexpected_shapes() -> None:
+    assert parse_reddit_listing(b"[]", limit=10) == []
+    assert parse_reddit_listing(b'{"data": {"children": {}}}', limit=10) == []
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 
 from tg_news_bot.config import PostFormattingSettings
 from tg_news_bot.db.models import Draft, DraftState
+from tg_news_bot.services import rendering
 from tg_news_bot.services.rendering import CAPTION_MAX_LEN, render_card_text, render_post_content
 
 
@@ -354,3 +355,18 @@ def test_post_formatting_section_separator_unescapes_newline() -> None:
     )
 
     assert formatting.section_separator == "\n\n"
+
+
+def test_render_post_content_reuses_split_until_text_changes() -> None:
+    rendering._split_title_body_text.cache_clear()
+    draft = _make_draft(state=DraftState.READY, post_text_ru="Заголовок\n\nПервый текст")
+
+    first = render_post_content(draft)
+    second = render_post_content(draft)
+    draft.post_text_ru = "Заголовок\n\nВторой текст"
+    edited = render_post_content(draft)
+
+    info = rendering._split_title_body_text.cache_info()
+    assert first.text == second.text
+    assert "Второй текст" in edited.text
+    assert (info.hits, info.misses) == (1, 2)
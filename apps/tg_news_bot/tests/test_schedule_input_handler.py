@@ -1,10 +1,12 @@
 ﻿from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from types import SimpleNamespace
 
 import pytest
 
+from tg_news_bot.ports.publisher import PublisherNotFound
 from tg_news_bot.telegram.handlers.schedule_input import (
     ScheduleInputContext,
     create_schedule_input_router,
@@ -32,9 +34,12 @@ class _ScheduleInputSpy:
 class _PublisherSpy:
     deleted: list[tuple[int, int]] = field(default_factory=list)
     sent: list[dict] = field(default_factory=list)
+    raise_not_found: bool = False
 
     async def delete_message(self, *, chat_id: int, message_id: int) -> None:
         self.deleted.append((chat_id, message_id))
+        if self.raise_not_found:
+            raise PublisherNotFound("gone")
 
     async def send_text(self, *, chat_id: int, topic_id: int | None, text: str, parse_mode=None, keyboard=None):  # noqa: ANN001
         self.sent.append({"chat_id": chat_id, "topic_id": topic_id, "text": text})
@@ -66,6 +71,10 @@ class _Message:
     def message_thread_id(self):
         return self.topic_id
 
+    @property
+    def content_type(self) -> str:
+        return "text" if self.text is not None else "photo"
+
 
 def _handler(schedule_input: _ScheduleInputSpy, publisher: _PublisherSpy):
     context = ScheduleInputContext(
@@ -74,7 +83,15 @@ def _handler(schedule_input: _ScheduleInputSpy, publisher: _PublisherSpy):
         publisher=publisher,
     )
     router = create_schedule_input_router(context)
-    return router.message.handlers[0].callback
+    handler = router.message.handlers[0].callback
+
+    async def _dispatch(message: _Message) -> None:
+        await handler(message)
+        await context.queue.join()
+        # Let the background delete started by the worker run.
+        await asyncio.sleep(0)
+
+    return _dispatch
 
 
 @pytest.mark.asyncio
@@ -90,6 +107,65 @@ async def test_schedule_input_accepted_deletes_message() -> None:
     assert publisher.sent == []
 
 
+@pytest.mark.asyncio
+async def test_schedule_input_delete_runs_in_background_and_ignores_not_found() -> None:
+    schedule_input = _ScheduleInputSpy(result=_Result(accepted=True, message="ok"))
+    publisher = _PublisherSpy(raise_not_found=True)
+    context = ScheduleInputContext(
+        settings=SimpleNamespace(admin_user_id=10),
+        schedule_input=schedule_input,
+        publisher=publisher,
+    )
+    handler = create_schedule_input_router(context).message.handlers[0].callback
+
+    await handler(_Message(text="17.02.2026 10:00"))
+
+    assert schedule_input.calls == []
+    await context.queue.join()
+    assert len(schedule_input.calls) == 1
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert publisher.deleted == [(-1001, 77)]
+    assert context.background_jobs == set()
+
+
+@dataclass
+class _SlowScheduleInput:
+    started: int = 0
+    peak: int = 0
+    running: int = 0
+
+    async def process_message(self, *, chat_id: int, topic_id: int, user_id: int, text: str):  # noqa: ARG002
+        self.started += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0)
+        self.running -= 1
+        return None
+
+
+@pytest.mark.asyncio
+async def test_schedule_input_bounds_concurrent_processing() -> None:
+    schedule_input = _SlowScheduleInput()
+    context = ScheduleInputContext(
+        settings=SimpleNamespace(admin_user_id=10),
+        schedule_input=schedule_input,
+        publisher=_PublisherSpy(),
+        workers=2,
+    )
+    handler = create_schedule_input_router(context).message.handlers[0].callback
+
+    for message_id in range(5):
+        await handler(_Message(text="17.02.2026 10:00", message_id=message_id))
+    await context.queue.join()
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert schedule_input.started == 5
+    assert schedule_input.peak == 2
+    assert context.background_jobs == set()
+
+
 @pytest.mark.asyncio
 async def test_schedule_input_error_sends_feedback() -> None:
     schedule_input = _ScheduleInputSpy(result=_Result(accepted=False, message="Формат даты"))
@@ -103,16 +179,157 @@ async def test_schedule_input_error_sends_feedback() -> None:
 
 
 @pytest.mark.asyncio
-async def test_schedule_input_ignores_non_admin_or_no_session() -> None:
+async def test_schedule_input_ignores_no_session() -> None:
     schedule_input = _ScheduleInputSpy(result=None)
     publisher = _PublisherSpy()
     handler = _handler(schedule_input, publisher)
 
-    await handler(_Message(text="17.02.2026 10:00", user_id=999))
-    await handler(_Message(text=None, user_id=10))
-    await handler(_Message(text="17.02.2026 10:00", topic_id=None))
     await handler(_Message(text="17.02.2026 10:00", user_id=10))
 
     assert len(schedule_input.calls) == 1
     assert publisher.deleted == []
     assert publisher.sent == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        (_Message(text="17.02.2026 10:00"), True),
+        (_Message(text="17.02.2026 10:00", user_id=999), False),
+        (_Message(text=None), False),
+        (_Message(text="/cancel"), False),
+        (_Message(text="17.02.2026 10:00", topic_id=None), False),
+    ],
+)
+async def test_schedule_input_filters_reject_before_dispatch(message: _Message, expected: bool) -> None:
+    context = ScheduleInputContext(
+        settings=SimpleNamespace(admin_user_id=10),
+        schedule_input=_ScheduleInputSpy(),
+        publisher=_PublisherSpy(),
+    )
+    handler = create_schedule_input_router(context).message.handlers[0]
+
+    passed, _ = await handler.check(message)
+
+    assert passed is expected
+
+
+@pytest.mark.asyncio
+async def test_schedule_input_suppresses_repeated_rejection_within_ttl() -> None:
+    now = [100.0]
+    schedule_input = _ScheduleInputSpy(result=_Result(accepted=False, message="Формат даты"))
+    publisher = _PublisherSpy()
+    context = ScheduleInputContext(
+        settings=SimpleNamespace(admin_user_id=10),
+        schedule_input=schedule_input,
+        publisher=publisher,
+        clock=lambda: now[0],
+    )
+    handler = create_schedule_input_router(context).message.handlers[0].callback
+
+    await handler(_Message(text="bad"))
+    await context.queue.join()
+    await handler(_Message(text="bad"))
+    await context.queue.join()
+    now[0] += 2.5
+    await handler(_Message(text="bad"))
+    await context.queue.join()
+
+    assert len(schedule_input.calls) == 3
+    assert len(publisher.sent) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("feedback", ["", "   \n"])
+async def test_schedule_input_skips_empty_rejection_feedback(feedback: str) -> None:
+    schedule_input = _ScheduleInputSpy(result=_Result(accepted=False, message=feedback))
+    publisher = _PublisherSpy()
+    handler = _handler(schedule_input, publisher)
+
+    await handler(_Message(text="bad"))
+
+    assert len(schedule_input.calls) == 1
+    assert publisher.sent == []
+
+
+def test_schedule_input_router_is_empty_without_admin() -> None:
+    context = ScheduleInputContext(
+        settings=SimpleNamespace(admin_user_id=0),
+        schedule_input=_ScheduleInputSpy(),
+        publisher=_PublisherSpy(),
+    )
+
+    router = create_schedule_input_router(context)
+
+    assert router.message.handlers == []
+    assert context.queue is None
+
+
+class _BlockingScheduleInput:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.processed: list[str] = []
+
+    async def process_message(self, *, chat_id: int, topic_id: int, user_id: int, text: str):  # noqa: ARG002
+        await self.release.wait()
+        self.processed.append(text)
+        return None
+
+
+def _shutdown_hook(router):  # noqa: ANN001
+    return router.shutdown.handlers[0].callback
+
+
+@pytest.mark.asyncio
+async def test_schedule_input_shutdown_drains_queued_input() -> None:
+    schedule_input = _BlockingScheduleInput()
+    context = ScheduleInputContext(
+        settings=SimpleNamespace(admin_user_id=10),
+        schedule_input=schedule_input,
+        publisher=_PublisherSpy(),
+        workers=1,
+    )
+    router = create_schedule_input_router(context)
+    handler = router.message.handlers[0].callback
+    for message_id in range(3):
+        await handler(_Message(text=f"input {message_id}", message_id=message_id))
+
+    shutdown = asyncio.create_task(_shutdown_hook(router)())
+    await asyncio.sleep(0)
+    schedule_input.release.set()
+    await shutdown
+
+    assert schedule_input.processed == ["input 0", "input 1", "input 2"]
+    assert context.background_jobs == set()
+
+
+@pytest.mark.asyncio
+async def test_schedule_input_shutdown_logs_input_it_cannot_finish(monkeypatch) -> None:  # noqa: ANN001
+    warnings: list[dict] = []
+    monkeypatch.setattr(
+        "tg_news_bot.telegram.handlers.schedule_input.log.warning",
+        lambda event, **kwargs: warnings.append({"event": event, **kwargs}),
+    )
+    schedule_input = _BlockingScheduleInput()
+    context = ScheduleInputContext(
+        settings=SimpleNamespace(admin_user_id=10),
+        schedule_input=schedule_input,
+        publisher=_PublisherSpy(),
+        workers=1,
+        shutdown_timeout_seconds=0.01,
+    )
+    router = create_schedule_input_router(context)
+    handler = router.message.handlers[0].callback
+    for message_id in (1, 2, 3):
+        await handler(_Message(text="17.02.2026 10:00", message_id=message_id))
+
+    await _shutdown_hook(router)()
+
+    assert [item["message_id"] for item in warnings] == [2, 3]
+    assert {item["event"] for item in warnings} == {"schedule_input.dropped_on_shutdown"}
+    assert context.queue.empty()
+    schedule_input.release.set()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert schedule_input.processed == ["17.02.2026 10:00"]
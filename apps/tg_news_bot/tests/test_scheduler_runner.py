@@ -120,32 +120,46 @@ class _PublishFailureRepo:
     def __init__(self) -> None:
         self.created = []
         self.resolved = []
+        self.resolve_calls = 0
 
     async def create(self, session, **kwargs):  # noqa: ANN001
         self.created.append(kwargs)
 
-    async def mark_resolved_for_draft(self, session, *, draft_id: int):  # noqa: ANN001
-        self.resolved.append(draft_id)
+    async def mark_resolved_for_drafts(self, session, *, draft_ids: list[int]):  # noqa: ANN001
+        self.resolved.extend(draft_ids)
+        self.resolve_calls += 1
 
 
 class _WorkflowSpy:
     def __init__(self) -> None:
         self.publish_calls = 0
         self.move_calls = 0
+        self.render_calls = 0
+        self.published_contents: list = []
+        self.moved_contents: list = []
         self.fail_publish = False
         self.fail_move = False
 
-    async def _publish_now(self, session, draft, settings) -> None:  # noqa: ANN001
+    async def _render_post_content(self, draft):  # noqa: ANN001
+        self.render_calls += 1
+        return f"post:{draft.id}"
+
+    async def _publish_now(self, draft, settings, *, post_content=None) -> None:  # noqa: ANN001
         self.publish_calls += 1
+        self.published_contents.append(post_content)
         draft.published_message_id = 700 + self.publish_calls
         draft.published_at = datetime.now(timezone.utc)
         if self.fail_publish:
             raise RuntimeError("publish failed")
 
-    async def _move_in_group(self, *, session, draft, settings, target_state) -> None:  # noqa: ANN001
+    async def _move_in_group(  # noqa: ANN001
+        self, *, draft, settings, target_state, post_content=None
+    ) -> list[int]:
         self.move_calls += 1
+        self.moved_contents.append(post_content)
         if self.fail_move:
             raise RuntimeError("move failed")
+        return []
 
 
 
@@ -185,11 +199,42 @@ async def test_scheduler_publishes_due_draft() -> None:
 
     assert workflow.publish_calls == 1
     assert workflow.move_calls == 1
+    assert workflow.render_calls == 1
+    assert workflow.published_contents == workflow.moved_contents == ["post:1"]
     assert drafts[1].state == DraftState.PUBLISHED
     assert due_row.status == ScheduledPostStatus.PUBLISHED
     assert failure_repo.resolved == [1]
 
 
+@pytest.mark.asyncio
+async def test_scheduler_resolves_failures_for_batch_in_one_call() -> None:
+    past = datetime.now(timezone.utc) - timedelta(minutes=1)
+    rows = [
+        _ScheduledRow(draft_id=7, schedule_at=past, id=7),
+        _ScheduledRow(draft_id=8, schedule_at=past, id=8),
+    ]
+    drafts = {
+        7: _make_draft(7, DraftState.SCHEDULED),
+        8: _make_draft(8, DraftState.SCHEDULED),
+    }
+    failure_repo = _PublishFailureRepo()
+
+    runner = SchedulerRunner(
+        session_factory=_DummySessionFactory(_DummySession()),
+        workflow=_WorkflowSpy(),
+        config=SchedulerConfig(poll_interval_seconds=10, batch_size=20),
+        scheduled_repo=_ScheduledRepo(rows),
+        draft_repo=_DraftRepo(drafts),
+        settings_repo=_SettingsRepo(),
+        publish_failure_repo=failure_repo,
+    )
+
+    await runner._process_due()
+
+    assert failure_repo.resolved == [7, 8]
+    assert failure_repo.resolve_calls == 1
+
+
 @pytest.mark.asyncio
 async def test_scheduler_retries_on_publish_failure() -> None:
     due_row = _ScheduledRow(
@@ -423,6 +423,7 @@ def _router_and_callback_handler(
     repository=None,  # noqa: ANN001
     trend_profile_repository=None,  # noqa: ANN001
     trend_candidates_repository=None,  # noqa: ANN001
+    settings_cache=None,  # noqa: ANN001
 ):
     context = SettingsContext(
         settings=SimpleNamespace(
@@ -442,6 +443,7 @@ def _router_and_callback_handler(
         trend_discovery=trend_discovery,
         trend_profile_repository=trend_profile_repository,
         trend_candidates_repository=trend_candidates_repository,
+        settings_cache=settings_cache,
     )
     router = create_settings_router(context)
     for handler in router.callback_query.handlers:
@@ -819,6 +821,29 @@ async def test_ops_setup_cfg_ready_updates_settings() -> None:
     assert "Последнее действие: ready_topic_id=55" in publisher.edits[-1]["text"]
 
 
+@pytest.mark.asyncio
+async def test_ops_setup_cfg_invalidates_settings_cache() -> None:
+    publisher = _PublisherSpy()
+    ingestion = _IngestionRunnerSpy()
+    cache = SimpleNamespace(invalidations=0)
+
+    def _invalidate() -> None:
+        cache.invalidations += 1
+
+    cache.invalidate = _invalidate
+    _, handler = _router_and_callback_handler(
+        publisher=publisher,
+        ingestion=ingestion,
+        repository=_BotSettingsRepositorySpy(),
+        session_factory=_dummy_session_factory,
+        settings_cache=cache,
+    )
+
+    await handler(_CallbackQuery(data="ops:cfg:ready", chat_id=-10077, topic_id=55))
+
+    assert cache.invalidations == 1
+
+
 @pytest.mark.asyncio
 async def test_ops_setup_cfg_requires_topic() -> None:
     publisher = _PublisherSpy()
@@ -1486,3 +1511,234 @@ async def test_autoplan_apply_forwards_to_service() -> None:
     assert publisher.sent
     assert "Запускаю Smart Scheduler apply" in publisher.sent[0]["text"]
     assert "Успешно переведено в SCHEDULED: 1" in publisher.sent[1]["text"]
+
+
+_RSS_BODY = (
+    "<?xml version='1.0'?><rss version='2.0'><channel><title>Feed</title>"
+    "<link>https://example.com</link><item><title>A</title></item></channel></rss>"
+)
+
+
+@dataclass
+class _AddSourceRepositorySpy:
+    existing: dict[str, object] = field(default_factory=dict)
+    created: list[str] = field(default_factory=list)
+
+    async def get_by_url(self, session, url: str):  # noqa: ANN001
+        return self.existing.get(url)
+
+    async def create(self, session, *, name: str, url: str, enabled: bool):  # noqa: ANN001
+        self.created.append(url)
+        source = SimpleNamespace(id=len(self.created), name=name, url=url, enabled=enabled, trust_score=0.0)
+        self.existing[url] = source
+        return source
+
+
+class _StreamResponse:
+    status_code = 200
+
+    def __init__(self, body: bytes, *, chunk_size: int = 64) -> None:
+        self.body = body
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001
+        return False
+
+    async def aiter_bytes(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            self.chunks_read += 1
+            yield self.body[start : start + self.chunk_size]
+
+
+def _patch_rss_client(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    fetched: list[str] = []
+
+    class _Client:
+        def __init__(self, **kwargs) -> None:  # noqa: ANN003
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001
+            return False
+
+        def stream(self, method: str, url: str):
+            fetched.append(url)
+            return _StreamResponse(_RSS_BODY.encode())
+
+    monkeypatch.setattr("tg_news_bot.telegram.handlers.settings.AsyncClient", _Client)
+    return fetched
+
+
+def _add_source_router(source_repository: _AddSourceRepositorySpy, clock):  # noqa: ANN001
+    context = SettingsContext(
+        settings=SimpleNamespace(admin_user_id=10),
+        session_factory=_dummy_session_factory,
+        repository=_BotSettingsRepositorySpy(),
+        source_repository=source_repository,
+        publisher=_PublisherSpy(),
+        clock=clock,
+    )
+    return _message_handler(create_settings_router(context), "add_source")
+
+
+@pytest.mark.asyncio
+async def test_add_source_reuses_rss_validation_within_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    fetched = _patch_rss_client(monkeypatch)
+    now = [100.0]
+    source_repository = _AddSourceRepositorySpy()
+    handler = _add_source_router(source_repository, lambda: now[0])
+    command = SimpleNamespace(args="https://example.com/rss")
+
+    await handler(_Message(), command)
+    source_repository.existing.clear()
+    await handler(_Message(), command)
+    assert fetched == ["https://example.com/rss"]
+
+    source_repository.existing.clear()
+    now[0] += 601.0
+    await handler(_Message(), command)
+    assert fetched == ["https://example.com/rss", "https://example.com/rss"]
+
+
+@pytest.mark.asyncio
+async def test_add_source_skips_rss_validation_for_enabled_source(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fetched = _patch_rss_client(monkeypatch)
+    source_repository = _AddSourceRepositorySpy(
+        existing={
+            "https://example.com/on": SimpleNamespace(
+                id=1, name="on", url="https://example.com/on", enabled=True, trust_score=0.0
+            ),
+            "https://example.com/off": SimpleNamespace(
+                id=2, name="off", url="https://example.com/off", enabled=False, trust_score=0.0
+            ),
+        }
+    )
+    handler = _add_source_router(source_repository, lambda: 0.0)
+
+    await handler(_Message(), SimpleNamespace(args="https://example.com/on\nhttps://example.com/off"))
+
+    assert fetched == ["https://example.com/off"]
+    assert source_repository.existing["https://example.com/off"].enabled is True
+
+
+@pytest.mark.asyncio
+async def test_add_source_caps_rss_validation_download(monkeypatch: pytest.MonkeyPatch) -> None:
+    item = "<item><title>A</title><description>" + "x" * 4000 + "</description></item>"
+    # A long leading comment hides the root element from the prefix sniffer.
+    padding = "<!--" + "-" * 600 + "-->"
+    body = (
+        padding + "<rss version='2.0'><channel><title>Big</title>" + item * 200 + "</channel></rss>"
+    ).encode()
+    response = _StreamResponse(body, chunk_size=16_384)
+
+    class _Client:
+        def __init__(self, **kwargs) -> None:  # noqa: ANN003
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001
+            return False
+
+        def stream(self, method: str, url: str):
+            return response
+
+    monkeypatch.setattr("tg_news_bot.telegram.handlers.settings.AsyncClient", _Client)
+    source_repository = _AddSourceRepositorySpy()
+    handler = _add_source_router(source_repository, lambda: 0.0)
+
+    await handler(_Message(), SimpleNamespace(args="https://example.com/big"))
+
+    assert source_repository.created == ["https://example.com/big"]
+    assert response.chunks_read * response.chunk_size < len(body)
+    assert response.chunks_read == 16
+
+
+@pytest.mark.asyncio
+async def test_add_source_accepts_sniffed_feed_after_first_bytes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    body = ("<rss version='2.0'><channel><title>Feed</title>" + "<item/>" * 2000 + "</channel></rss>").encode()
+    response = _StreamResponse(body, chunk_size=1024)
+
+    class _Client:
+        def __init__(self, **kwargs) -> None:  # noqa: ANN003
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001
+            return False
+
+        def stream(self, method: str, url: str):
+            return response
+
+    monkeypatch.setattr("tg_news_bot.telegram.handlers.settings.AsyncClient", _Client)
+    source_repository = _AddSourceRepositorySpy()
+    publisher = _PublisherSpy()
+    context = SettingsContext(
+        settings=SimpleNamespace(admin_user_id=10),
+        session_factory=_dummy_session_factory,
+        repository=_BotSettingsRepositorySpy(),
+        source_repository=source_repository,
+        publisher=publisher,
+    )
+    handler = _message_handler(create_settings_router(context), "add_source")
+
+    await handler(_Message(), SimpleNamespace(args="https://example.com/rss"))
+
+    assert response.chunks_read == 1
+    assert source_repository.created == ["https://example.com/rss"]
+    assert publisher.sent[-1]["text"].endswith("validation: OK (rss)")
+
+
+@pytest.mark.asyncio
+async def test_add_source_rejects_html_page_with_feed_like_custom_element(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    body = (
+        "<!doctype html><html><head><title>Shop</title></head><body>"
+        + "<feed-item><span>deal</span></feed-item>" * 40
+        + "</body></html>"
+    ).encode()
+    response = _StreamResponse(body, chunk_size=256)
+
+    class _Client:
+        def __init__(self, **kwargs) -> None:  # noqa: ANN003
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001
+            return False
+
+        def stream(self, method: str, url: str):
+            return response
+
+    monkeypatch.setattr("tg_news_bot.telegram.handlers.settings.AsyncClient", _Client)
+    source_repository = _AddSourceRepositorySpy()
+    publisher = _PublisherSpy()
+    context = SettingsContext(
+        settings=SimpleNamespace(admin_user_id=10),
+        session_factory=_dummy_session_factory,
+        repository=_BotSettingsRepositorySpy(),
+        source_repository=source_repository,
+        publisher=publisher,
+    )
+    handler = _message_handler(create_settings_router(context), "add_source")
+
+    await handler(_Message(), SimpleNamespace(args="https://example.com/shop"))
+
+    assert source_repository.created == []
+    assert "не похож на RSS/Atom" in publisher.sent[-1]["text"]
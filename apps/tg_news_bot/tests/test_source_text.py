@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from tg_news_bot.services import source_text
 from tg_news_bot.services.source_text import sanitize_source_text
 
 
@@ -74,3 +75,15 @@ def test_sanitize_source_text_removes_nature_access_options_block() -> None:
         "US President Donald Trump plans to nominate biotechnology investor Jim O'Neill to be the next leader "
         "of the National Science Foundation (NSF)."
     )
+
+
+def test_sanitize_source_text_reuses_result_for_same_text() -> None:
+    source_text._sanitize_cached.cache_clear()  # noqa: SLF001
+    raw = "Source: Example\n\nBody line one.\n---\nBody line two."
+
+    first = sanitize_source_text(raw)
+    second = sanitize_source_text("".join(raw))
+
+    info = source_text._sanitize_cached.cache_info()  # noqa: SLF001
+    assert first == second
+    assert (info.hits, info.misses) == (1, 1)
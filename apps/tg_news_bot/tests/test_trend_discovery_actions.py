@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from tg_news_bot.db.models import TrendCandidateStatus
+from tg_news_bot.repositories.trend_candidates import TrendCandidateMessageRef
+from tg_news_bot.services.trend_discovery import TrendDiscoveryService
+
+
+class _Session:
+    async def __aenter__(self):  # noqa: ANN201
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001, ANN201
+        return False
+
+    def begin(self):  # noqa: ANN201
+        return self
+
+
+def _session_factory() -> _Session:
+    return _Session()
+
+
+class _CandidatesRepo:
+    def __init__(self, candidate: SimpleNamespace | None) -> None:
+        self.candidate = candidate
+        self.updates: list[tuple[str, dict]] = []
+
+    async def get_article_candidate(self, session, candidate_id):  # noqa: ANN001, ANN201
+        return self.candidate
+
+    async def get_source_candidate(self, session, candidate_id):  # noqa: ANN001, ANN201
+        return self.candidate
+
+    async def mark_article_candidate_ingested(self, session, **kwargs):  # noqa: ANN001, ANN003, ANN201
+        return self._update("ingested", kwargs)
+
+    async def mark_article_candidate_failed(self, session, **kwargs):  # noqa: ANN001, ANN003, ANN201
+        return self._update("failed", kwargs)
+
+    async def reject_article_candidate(self, session, **kwargs):  # noqa: ANN001, ANN003, ANN201
+        if self.candidate is not None and self.candidate.status == TrendCandidateStatus.REJECTED:
+            return None
+        return self._update("rejected", kwargs)
+
+    async def reject_source_candidate(self, session, **kwargs):  # noqa: ANN001, ANN003, ANN201
+        return await self.reject_article_candidate(session, **kwargs)
+
+    def _update(self, kind: str, values: dict) -> TrendCandidateMessageRef | None:
+        if self.candidate is None:
+            return None
+        self.updates.append((kind, values))
+        return TrendCandidateMessageRef(
+            group_chat_id=self.candidate.group_chat_id,
+            message_id=self.candidate.message_id,
+        )
+
+
+class _IngestionRunner:
+    def __init__(self, result: SimpleNamespace) -> None:
+        self.result = result
+        self.urls: list[str] = []
+
+    async def ingest_url(self, *, url: str):  # noqa: ANN201
+        self.urls.append(url)
+        return self.result
+
+
+class _Publisher:
+    def __init__(self) -> None:
+        self.cleared: list[tuple[int, int]] = []
+
+    async def edit_reply_markup(self, *, chat_id, message_id, keyboard):  # noqa: ANN001, ANN201
+        self.cleared.append((chat_id, message_id))
+
+
+def _candidate(status: TrendCandidateStatus = TrendCandidateStatus.PENDING) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=5,
+        status=status,
+        draft_id=None,
+        score=4.2,
+        url="https://example.com/a",
+        group_chat_id=-100,
+        message_id=42,
+    )
+
+
+def _make_service(
+    repo: _CandidatesRepo,
+    publisher: _Publisher,
+    runner: _IngestionRunner | None = None,
+) -> TrendDiscoveryService:
+    settings = SimpleNamespace(
+        trend_discovery=SimpleNamespace(ai_enrichment=False),
+        internet_scoring=SimpleNamespace(),
+        trends=SimpleNamespace(),
+        llm=SimpleNamespace(enabled=False, provider="openai_compat", api_key=None),
+    )
+    return TrendDiscoveryService(
+        settings=settings,
+        session_factory=_session_factory,
+        publisher=publisher,
+        ingestion_runner=runner,
+        candidates_repo=repo,
+        internet_scoring=SimpleNamespace(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_article_candidate_updates_once_and_clears_keyboard() -> None:
+    repo = _CandidatesRepo(_candidate())
+    publisher = _Publisher()
+    runner = _IngestionRunner(SimpleNamespace(created=True, draft_id=77, reason=None))
+    service = _make_service(repo, publisher, runner)
+
+    result = await service.ingest_article_candidate(candidate_id=5, user_id=10)
+
+    assert result.ok is True
+    assert result.draft_id == 77
+    assert runner.urls == ["https://example.com/a"]
+    assert [kind for kind, _ in repo.updates] == ["ingested"]
+    assert repo.updates[0][1]["draft_id"] == 77
+    assert repo.updates[0][1]["reviewed_by_user_id"] == 10
+    assert publisher.cleared == [(-100, 42)]
+
+
+@pytest.mark.asyncio
+async def test_ingest_article_candidate_records_failure_reason() -> None:
+    repo = _CandidatesRepo(_candidate())
+    publisher = _Publisher()
+    runner = _IngestionRunner(SimpleNamespace(created=False, draft_id=None, reason="duplicate"))
+    service = _make_service(repo, publisher, runner)
+
+    result = await service.ingest_article_candidate(candidate_id=5, user_id=0)
+
+    assert result.ok is False
+    assert "duplicate" in result.message
+    assert repo.updates == [
+        (
+            "failed",
+            {
+                "candidate_id": 5,
+                "reason": "duplicate",
+                "reviewed_by_user_id": None,
+                "reviewed_at": repo.updates[0][1]["reviewed_at"],
+            },
+        )
+    ]
+    assert publisher.cleared == [(-100, 42)]
+
+
+@pytest.mark.asyncio
+async def test_reject_article_candidate_reports_already_rejected() -> None:
+    repo = _CandidatesRepo(_candidate(TrendCandidateStatus.REJECTED))
+    publisher = _Publisher()
+    service = _make_service(repo, publisher)
+
+    result = await service.reject_article_candidate(candidate_id=5, user_id=10)
+
+    assert result.ok is True
+    assert result.message == "Кандидат уже отклонён."
+    assert publisher.cleared == []
+
+
+@pytest.mark.asyncio
+async def test_reject_source_candidate_not_found() -> None:
+    repo = _CandidatesRepo(None)
+    publisher = _Publisher()
+    service = _make_service(repo, publisher)
+
+    result = await service.reject_source_candidate(candidate_id=9, user_id=10)
+
+    assert result.ok is False
+    assert "#9" in result.message
+    assert publisher.cleared == []
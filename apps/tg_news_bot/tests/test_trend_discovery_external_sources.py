@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
 import httpx
+import orjson
 import pytest
 
 from tg_news_bot.services.trend_discovery import TrendDiscoveryService
@@ -27,6 +29,24 @@ class _Response:
         )
 
 
+class _StreamResponse(_Response):
+    def __init__(self, url: str, chunks: list[bytes]) -> None:
+        super().__init__(url, b"".join(chunks).decode("utf-8"))
+        self._chunks = chunks
+        self.chunks_read = 0
+
+    async def __aenter__(self):  # noqa: ANN201
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001, ANN201
+        return False
+
+    async def aiter_bytes(self):  # noqa: ANN201
+        for chunk in self._chunks:
+            self.chunks_read += 1
+            yield chunk
+
+
 class _HTTPFake:
     def __init__(self, payloads: dict[str, _Response | Exception]) -> None:
         self._payloads = payloads
@@ -37,6 +57,9 @@ class _HTTPFake:
             raise payload
         return payload
 
+    def stream(self, method: str, url: str, **kwargs):  # noqa: ANN003, ANN201
+        return self._payloads[url]
+
 
 class _DummyAsyncSession:
     async def __aenter__(self):  # noqa: ANN201
@@ -57,6 +80,7 @@ def _make_service() -> TrendDiscoveryService:
     settings = SimpleNamespace(
         trend_discovery=SimpleNamespace(
             ai_enrichment=False,
+            arxiv_stream_parser=True,
             github_trending_enabled=True,
             github_trending_url="https://github.com/trending",
             steam_charts_enabled=True,
@@ -65,7 +89,7 @@ def _make_service() -> TrendDiscoveryService:
             boxoffice_urls=["https://www.boxofficemojo.com/month/february/2026/"],
         ),
         internet_scoring=SimpleNamespace(),
-        trends=SimpleNamespace(),
+        trends=SimpleNamespace(arxiv_feeds=["https://export.arxiv.org/rss/cs.AI"]),
         llm=SimpleNamespace(enabled=False, provider="openai_compat", api_key=None),
     )
     return TrendDiscoveryService(
@@ -152,3 +176,274 @@ async def test_collect_boxoffice_returns_empty_on_fetch_failure() -> None:
     rows = await service._collect_boxoffice(http, since, 5)  # noqa: SLF001
 
     assert rows == []
+
+
+@pytest.mark.asyncio
+async def test_collect_arxiv_streams_entries_and_stops_at_limit() -> None:
+    service = _make_service()
+    now = datetime.now(timezone.utc)
+    entries = [
+        (
+            f"<item><title>Paper {index}</title>"
+            f"<link>https://arxiv.org/abs/2602.0000{index}</link>"
+            f"<description>Abstract {index}</description>"
+            f"<pubDate>{now.strftime('%a, %d %b %Y %H:%M:%S +0000')}</pubDate></item>"
+        ).encode("utf-8")
+        for index in range(8)
+    ]
+    chunks = [b'<?xml version="1.0"?><rss version="2.0"><channel><title>cs.AI</title>']
+    chunks.extend(entries)
+    chunks.append(b"</channel></rss>")
+    response = _StreamResponse("https://export.arxiv.org/rss/cs.AI", chunks)
+    http = _HTTPFake({"https://export.arxiv.org/rss/cs.AI": response})
+    since = now - timedelta(hours=24)
+
+    rows = await service._collect_arxiv(http, since, 5)  # noqa: SLF001
+
+    assert [row.title for row in rows] == [f"Paper {index}" for index in range(5)]
+    assert rows[0].source_name == "ARXIV"
+    assert rows[0].domain == "arxiv.org"
+    assert rows[0].summary == "Abstract 0"
+    assert response.chunks_read < len(chunks)
+
+
+@pytest.mark.asyncio
+async def test_collect_x_parses_atom_entries_with_lxml() -> None:
+    service = _make_service()
+    feed_url = "https://nitter.example/openai/rss"
+    service._settings.trends.x_feeds = [feed_url]  # noqa: SLF001
+    now = datetime.now(timezone.utc)
+    old = now - timedelta(days=3)
+    body = (
+        '<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        "<entry><title>Fresh &amp; hot</title>"
+        '<link rel="alternate" href="https://x.com/openai/status/1"/>'
+        f"<summary>Fresh summary</summary><updated>{now.isoformat()}</updated></entry>"
+        "<entry><title>Stale post</title>"
+        '<link href="https://x.com/openai/status/2"/>'
+        f"<updated>{old.isoformat()}</updated></entry>"
+        "</feed>"
+    ).encode("utf-8")
+    http = _HTTPFake({feed_url: _StreamResponse(feed_url, [body])})
+
+    rows = await service._collect_x(http, now - timedelta(hours=24), 10)  # noqa: SLF001
+
+    assert len(rows) == 1
+    assert rows[0].title == "Fresh & hot"
+    assert rows[0].url == "https://x.com/openai/status/1"
+    assert rows[0].summary == "Fresh summary"
+    assert rows[0].source_name == "X"
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_is_reused_until_closed() -> None:
+    service = _make_service()
+
+    first = service._get_http()  # noqa: SLF001
+    assert service._get_http() is first  # noqa: SLF001
+
+    await service.aclose()
+
+    assert first.is_closed
+    second = service._get_http()  # noqa: SLF001
+    assert second is not first
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_collect_network_items_keeps_latest_duplicate() -> None:
+    service = _make_service()
+    service._settings.trend_discovery.item_limit_per_source = 10  # noqa: SLF001
+    now = datetime.now(timezone.utc)
+    older = service._build_item(  # noqa: SLF001
+        source_name="HN",
+        source_ref=None,
+        title="Shared story",
+        url="https://example.com/story?utm_source=hn",
+        summary="",
+        observed=now - timedelta(hours=2),
+    )
+    newer = service._build_item(  # noqa: SLF001
+        source_name="REDDIT",
+        source_ref=None,
+        title="Shared story",
+        url="https://example.com/story",
+        summary="",
+        observed=now,
+    )
+
+    async def _batch(rows):  # noqa: ANN001, ANN202
+        return rows
+
+    async def _empty(http, since, limit):  # noqa: ANN001, ANN202
+        return []
+
+    for name in (
+        "_collect_arxiv",
+        "_collect_x",
+        "_collect_github_trending",
+        "_collect_steam_charts",
+        "_collect_boxoffice",
+    ):
+        setattr(service, name, _empty)
+    service._collect_hn = lambda http, since, limit: _batch([older])  # noqa: SLF001
+    service._collect_reddit = lambda http, since, limit: _batch([newer])  # noqa: SLF001
+
+    rows = await service._collect_network_items(since=now - timedelta(hours=24))  # noqa: SLF001
+    await service.aclose()
+
+    assert rows == [newer]
+
+
+@pytest.mark.asyncio
+async def test_collect_network_items_is_independent_of_completion_order() -> None:
+    service = _make_service()
+    service._settings.trend_discovery.item_limit_per_source = 10  # noqa: SLF001
+    now = datetime.now(timezone.utc)
+
+    def _row(source_name: str, path: str) -> object:
+        return service._build_item(  # noqa: SLF001
+            source_name=source_name,
+            source_ref=None,
+            title=f"{source_name} {path}",
+            url=f"https://example.com/{path}",
+            summary="",
+            observed=now,
+        )
+
+    arxiv_tie = _row("ARXIV", "tie")
+    arxiv_only = _row("ARXIV", "a")
+    hn_tie = _row("HN", "tie")
+    x_only = _row("X", "x")
+
+    def _delayed(rows, delay: float):  # noqa: ANN001, ANN202
+        async def _collect(http, since, limit):  # noqa: ANN001, ANN202
+            await asyncio.sleep(delay)
+            return rows
+
+        return _collect
+
+    async def _empty(http, since, limit):  # noqa: ANN001, ANN202
+        return []
+
+    for name in ("_collect_reddit", "_collect_github_trending", "_collect_steam_charts", "_collect_boxoffice"):
+        setattr(service, name, _empty)
+    service._collect_arxiv = _delayed([arxiv_only, arxiv_tie], 0.03)  # noqa: SLF001
+    service._collect_hn = _delayed([hn_tie], 0.0)  # noqa: SLF001
+    service._collect_x = _delayed([x_only], 0.01)  # noqa: SLF001
+
+    rows = await service._collect_network_items(since=now - timedelta(hours=24))  # noqa: SLF001
+    await service.aclose()
+
+    assert rows == [arxiv_only, arxiv_tie, x_only]
+
+
+class _SlowJSONHTTP:
+    def __init__(self, payloads: dict[str, dict | Exception]) -> None:
+        self._payloads = payloads
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url: str, **kwargs):  # noqa: ANN003, ANN201
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            payload = self._payloads[url]
+            if isinstance(payload, Exception):
+                raise payload
+            return SimpleNamespace(raise_for_status=lambda: None, content=orjson.dumps(payload))
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_collect_reddit_fetches_feeds_concurrently() -> None:
+    service = _make_service()
+    now = datetime.now(timezone.utc)
+    feeds = [f"https://www.reddit.com/r/sub{index}/top.json" for index in range(3)]
+    service._settings.trends.reddit_feeds = feeds  # noqa: SLF001
+    http = _SlowJSONHTTP(
+        {
+            feeds[0]: {
+                "data": {
+                    "children": [
+                        {
+                            "data": {
+                                "title": "First post",
+                                "url": "https://example.com/first",
+                                "created_utc": int(now.timestamp()),
+                            }
+                        }
+                    ]
+                }
+            },
+            feeds[1]: RuntimeError("reddit down"),
+            feeds[2]: {
+                "data": {
+                    "children": [
+                        {
+                            "data": {
+                                "title": "Third post",
+                                "url": "https://example.org/third",
+                                "created_utc": int(now.timestamp()),
+                            }
+                        }
+                    ]
+                }
+            },
+        }
+    )
+
+    rows = await service._collect_reddit(http, now - timedelta(hours=1), 30)  # noqa: SLF001
+
+    assert http.max_in_flight == 3
+    assert [row.title for row in rows] == ["First post", "Third post"]
+
+
+@pytest.mark.asyncio
+async def test_collect_reddit_skips_posts_older_than_since() -> None:
+    service = _make_service()
+    feed_url = "https://www.reddit.com/r/science/top.json"
+    service._settings.trends.reddit_feeds = [feed_url]  # noqa: SLF001
+    since = datetime(2026, 2, 1, 12, 0, 0, 500000, tzinfo=timezone.utc)
+    boundary = int(since.timestamp())
+    http = _SlowJSONHTTP(
+        {
+            feed_url: {
+                "data": {
+                    "children": [
+                        {"data": {"title": "Too old", "url": "https://a.example/1", "created_utc": boundary}},
+                        {"data": {"title": "Fresh", "url": "https://a.example/2", "created_utc": boundary + 1.0}},
+                    ]
+                }
+            }
+        }
+    )
+
+    rows = await service._collect_reddit(http, since, 10)  # noqa: SLF001
+
+    assert [row.title for row in rows] == ["Fresh"]
+    assert rows[0].observed_at == datetime(2026, 2, 1, 12, 0, 1, tzinfo=timezone.utc)
+
+
+def test_build_item_rejects_non_http_links() -> None:
+    service = _make_service()
+    now = datetime.now(timezone.utc)
+
+    def _build(url: str):  # noqa: ANN202
+        return service._build_item(  # noqa: SLF001
+            source_name="X",
+            source_ref=None,
+            title="Title",
+            url=url,
+            summary="",
+            observed=now,
+        )
+
+    assert _build("ftp://example.com/file") is None
+    assert _build("mailto:editor@example.com") is None
+    assert _build("https:///missing-host") is None
+    row = _build("HTTPS://WWW.Example.com/Path?utm_source=x")
+    assert row is not None
+    assert row.domain == "example.com"
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from telegram_publisher.types import SendResult
+from tg_news_bot.services.trend_discovery import TrendDiscoveryService
+
+
+class _Session:
+    async def __aenter__(self):  # noqa: ANN201
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001, ANN201
+        return False
+
+    def begin(self):  # noqa: ANN201
+        return self
+
+    async def flush(self) -> None:
+        return None
+
+
+def _session_factory() -> _Session:
+    return _Session()
+
+
+class _BotSettingsRepo:
+    async def get(self, session):  # noqa: ANN001, ANN201
+        return SimpleNamespace(group_chat_id=-100123, trend_candidates_topic_id=77, inbox_topic_id=10)
+
+
+class _CandidatesRepo:
+    def __init__(self, articles: list[SimpleNamespace], sources: list[SimpleNamespace]) -> None:
+        self.articles = {row.id: row for row in articles}
+        self.sources = {row.id: row for row in sources}
+        self.mark_calls = 0
+
+    async def list_unannounced_article_candidates(self, session, *, topic_ids):  # noqa: ANN001, ANN201
+        return list(self.articles.values())
+
+    async def list_unannounced_source_candidates(self, session, *, topic_ids):  # noqa: ANN001, ANN201
+        return list(self.sources.values())
+
+    async def mark_article_candidates_announced(self, session, *, announcements):  # noqa: ANN001, ANN201
+        self.mark_calls += 1
+        _apply(self.articles, announcements)
+
+    async def mark_source_candidates_announced(self, session, *, announcements):  # noqa: ANN001, ANN201
+        self.mark_calls += 1
+        _apply(self.sources, announcements)
+
+
+def _apply(rows: dict[int, SimpleNamespace], announcements) -> None:  # noqa: ANN001
+    for item in announcements:
+        row = rows[item.candidate_id]
+        row.group_chat_id = item.group_chat_id
+        row.topic_id_telegram = item.topic_id_telegram
+        row.message_id = item.message_id
+
+
+class _Publisher:
+    def __init__(self, *, fail_texts: set[str] | None = None) -> None:
+        self.fail_texts = fail_texts or set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.sent: list[str] = []
+        self._next_id = 500
+
+    async def send_text(self, *, chat_id, topic_id, text, keyboard=None, parse_mode=None):  # noqa: ANN001, ANN201
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if any(marker in text for marker in self.fail_texts):
+                raise RuntimeError("telegram failed")
+            self._next_id += 1
+            self.sent.append(text)
+            return SendResult(chat_id=chat_id, message_id=self._next_id)
+        finally:
+            self.in_flight -= 1
+
+
+def _article(candidate_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=candidate_id,
+        topic_id=1,
+        score=3.5,
+        domain="example.com",
+        title=f"Article {candidate_id}",
+        snippet=None,
+        url=f"https://example.com/{candidate_id}",
+        group_chat_id=None,
+        topic_id_telegram=None,
+        message_id=None,
+    )
+
+
+def _source(candidate_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=candidate_id,
+        topic_id=1,
+        score=2.0,
+        domain="source.example",
+        source_url="https://source.example",
+        reasons={"mentions": 3},
+        group_chat_id=None,
+        topic_id_telegram=None,
+        message_id=None,
+    )
+
+
+def _make_service(
+    publisher: _Publisher,
+    repo: _CandidatesRepo,
+    *,
+    concurrency: int,
+) -> TrendDiscoveryService:
+    settings = SimpleNamespace(
+        trend_discovery=SimpleNamespace(ai_enrichment=False, publish_concurrency=concurrency),
+        internet_scoring=SimpleNamespace(),
+        trends=SimpleNamespace(),
+        llm=SimpleNamespace(enabled=False, provider="openai_compat", api_key=None),
+    )
+    return TrendDiscoveryService(
+        settings=settings,
+        session_factory=_session_factory,
+        publisher=publisher,
+        bot_settings_repo=_BotSettingsRepo(),
+        candidates_repo=repo,
+        internet_scoring=SimpleNamespace(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_pending_candidates_sends_concurrently_and_stores_message_ids() -> None:
+    articles = [_article(index) for index in range(1, 7)]
+    sources = [_source(100)]
+    repo = _CandidatesRepo(articles, sources)
+    publisher = _Publisher()
+    service = _make_service(publisher, repo, concurrency=3)
+
+    sent = await service.publish_pending_candidates(topic_ids=[1])
+
+    assert sent == 7
+    assert 1 < publisher.max_in_flight <= 3
+    assert all(row.message_id is not None for row in articles + sources)
+    assert all(row.group_chat_id == -100123 for row in articles + sources)
+    assert all(row.topic_id_telegram == 77 for row in articles + sources)
+    assert len({row.message_id for row in articles + sources}) == 7
+    assert repo.mark_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_pending_candidates_skips_failed_sends() -> None:
+    articles = [_article(1), _article(2)]
+    repo = _CandidatesRepo(articles, [])
+    publisher = _Publisher(fail_texts={"Article 2"})
+    service = _make_service(publisher, repo, concurrency=2)
+
+    sent = await service.publish_pending_candidates(topic_ids=[1])
+
+    assert sent == 1
+    assert articles[0].message_id is not None
+    assert articles[1].message_id is None
+
+
+@pytest.mark.asyncio
+async def test_publish_pending_candidates_skips_db_write_when_nothing_sent() -> None:
+    repo = _CandidatesRepo([_article(1)], [])
+    publisher = _Publisher(fail_texts={"Article 1"})
+    service = _make_service(publisher, repo, concurrency=1)
+
+    sent = await service.publish_pending_candidates(topic_ids=[1])
+
+    assert sent == 0
+    assert repo.mark_calls == 0
+
+
+def test_render_candidate_cards_layout() -> None:
+    article = _article(5)
+    article.snippet = "Short <summary>"
+
+    assert TrendDiscoveryService._render_article_card(article) == (  # noqa: SLF001
+        "<b>Кандидат трендовой статьи #5</b>\n"
+        "topic_id: 1\n"
+        "оценка: 3.50\n"
+        "домен: example.com\n"
+        "заголовок: Article 5\n"
+        "кратко: Short &lt;summary&gt;\n"
+        "ссылка: https://example.com/5"
+    )
+    assert TrendDiscoveryService._render_source_card(_source(9)) == (  # noqa: SLF001
+        "<b>Кандидат трендового источника #9</b>\n"
+        "topic_id: 1\n"
+        "оценка: 2.00\n"
+        "домен: source.example\n"
+        "ссылка: https://source.example\n"
+        "упоминаний: 3"
+    )
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from tg_news_bot.config import TrendDiscoveryProfileSettings
+from tg_news_bot.services.internet_scoring import InternetScoringContext
+from tg_news_bot.services.trend_discovery import (
+    NetworkTrendItem,
+    ProfileMatchedItem,
+    TrendDiscoveryService,
+    _ProfileMatcher,
+)
+
+
+class _InternetScoring:
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def score_item(self, **kwargs):  # noqa: ANN003, ANN201
+        self.calls.append(kwargs)
+        return SimpleNamespace(
+            total=1.0 + len(kwargs["seed_hits"]),
+            components={"source_trust": 0.0},
+            signal_hits=[],
+        )
+
+
+def _make_service(scoring: _InternetScoring) -> TrendDiscoveryService:
+    settings = SimpleNamespace(
+        trend_discovery=SimpleNamespace(ai_enrichment=False, min_topic_score=0.0),
+        internet_scoring=SimpleNamespace(),
+        trends=SimpleNamespace(),
+        llm=SimpleNamespace(enabled=False, provider="openai_compat", api_key=None),
+    )
+    return TrendDiscoveryService(
+        settings=settings,
+        session_factory=lambda: None,
+        publisher=None,
+        internet_scoring=scoring,
+    )
+
+
+def _item(title: str, *, domain: str = "example.com") -> NetworkTrendItem:
+    return NetworkTrendItem(
+        title=title,
+        url=f"https://{domain}/a",
+        normalized_url=f"https://{domain}/a",
+        domain=domain,
+        summary="",
+        source_name="HN",
+        source_ref=None,
+        observed_at=datetime.now(timezone.utc),
+    )
+
+
+def _matcher(**kwargs) -> _ProfileMatcher:  # noqa: ANN003
+    return _ProfileMatcher.build(TrendDiscoveryProfileSettings(name="AI", **kwargs))
+
+
+def _score(service: TrendDiscoveryService, matcher: _ProfileMatcher, item: NetworkTrendItem):  # noqa: ANN202
+    return service._score_item_for_profile(  # noqa: SLF001
+        matcher,
+        item,
+        {},
+        _context(),
+        text=f"{item.title} {item.summary}".strip().lower(),
+        domain=item.domain,
+    )
+
+
+def _context() -> InternetScoringContext:
+    return InternetScoringContext(
+        signal_boosts={},
+        provider_stats={},
+        collected_at=datetime.now(timezone.utc),
+    )
+
+
+def test_score_item_collects_overlapping_seed_hits() -> None:
+    scoring = _InternetScoring()
+    service = _make_service(scoring)
+    matcher = _matcher(seed_keywords=["ai", "ai safety", "robot"])
+
+    row = _score(service, matcher, _item("New AI Safety benchmark"))
+
+    assert row is not None
+    assert row.seed_hits == ["ai", "ai safety"]
+    assert row.score == 3.0
+
+
+def test_score_item_skips_scoring_without_seed_match() -> None:
+    scoring = _InternetScoring()
+    service = _make_service(scoring)
+    matcher = _matcher(seed_keywords=["quantum", "qubit"])
+
+    row = _score(service, matcher, _item("Football results"))
+
+    assert row is None
+    assert scoring.calls == []
+
+
+def test_score_item_rejects_when_excludes_outweigh_seeds() -> None:
+    scoring = _InternetScoring()
+    service = _make_service(scoring)
+    matcher = _matcher(seed_keywords=["ai"], exclude_keywords=["crypto"])
+
+    row = _score(service, matcher, _item("AI crypto token launch"))
+
+    assert row is None
+
+
+def test_score_item_marks_trusted_domain_case_insensitively() -> None:
+    scoring = _InternetScoring()
+    service = _make_service(scoring)
+    matcher = _matcher(seed_keywords=["ai"], trusted_domains=["Nature.com"])
+
+    assert matcher.trusted_domains == frozenset({"nature.com"})
+    assert _score(service, matcher, _item("AI model", domain="nature.com")) is not None
+    assert _score(service, matcher, _item("AI model", domain="blog.example")) is not None
+    assert [call["trusted_domain_match"] for call in scoring.calls] == [True, False]
+
+
+class _LLM:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.prompts: list[str] = []
+
+    async def complete(self, *, system_prompt: str, user_prompt: str) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            self.prompts.append(user_prompt)
+            return f"Title for {user_prompt.splitlines()[0]}"
+        finally:
+            self.in_flight -= 1
+
+
+def _profile(name: str, seed: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        name=name,
+        seed_keywords=[seed],
+        exclude_keywords=[],
+        trusted_domains=[],
+        min_article_score=0.0,
+        enabled=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_build_topic_candidates_requests_titles_concurrently_for_kept_topics() -> None:
+    service = _make_service(_InternetScoring())
+    llm = _LLM()
+    service._llm_client = llm  # noqa: SLF001
+    items = [
+        _item("Robot arm demo", domain="a.example"),
+        _item("Robot swarm and quantum sensor", domain="b.example"),
+        _item("Quantum chip", domain="c.example"),
+        _item("Quantum network robot", domain="d.example"),
+        _item("Fusion record", domain="e.example"),
+    ]
+
+    rows = await service._build_topic_candidates(  # noqa: SLF001
+        items=items,
+        profiles=[_profile("Fusion", "fusion"), _profile("Robots", "robot"), _profile("Quantum", "quantum")],
+        trust_by_domain={},
+        topic_limit=2,
+        internet_context=_context(),
+    )
+
+    assert [row[0].name for row in rows] == ["Robots", "Quantum"]
+    assert [row[2] for row in rows] == ["Title for Profile: Robots", "Title for Profile: Quantum"]
+    assert len(llm.prompts) == 2
+    assert llm.max_in_flight == 2
+
+
+def _matched(domain: str, score: float) -> ProfileMatchedItem:
+    return ProfileMatchedItem(
+        item=_item("AI", domain=domain),
+        score=score,
+        seed_hits=["ai"],
+        exclude_hits=[],
+        trust_boost=0.0,
+        score_components={},
+        signal_hits=[],
+    )
+
+
+def test_build_source_candidates_keeps_top_unknown_domains() -> None:
+    service = _make_service(_InternetScoring())
+    matched = [
+        _matched("known.example", 9.0),
+        _matched("a.example", 1.0),
+        _matched("b.example", 2.0),
+        _matched("b.example", 2.0),
+        _matched("c.example", 3.0),
+    ]
+
+    rows = service._build_source_candidates(  # noqa: SLF001
+        matched_items=matched,
+        known_domains={"known.example"},
+        max_items=2,
+    )
+
+    assert [row["domain"] for row in rows] == ["c.example", "b.example"]
+    assert rows[0]["source_url"] == "https://c.example"
+    assert rows[1]["score"] == 2.5
+    assert rows[1]["reasons"] == {"mentions": 2, "avg_article_score": 2.0, "sources": ["HN"]}
+
+
+def test_index_sources_by_domain_keeps_newest_source_per_domain() -> None:
+    service = _make_service(_InternetScoring())
+    sources = [
+        SimpleNamespace(id=1, url="https://www.Example.com/feed", trust_score=2.0),
+        SimpleNamespace(id=2, url="https://example.com/other", trust_score=5.0),
+        SimpleNamespace(id=3, url="https://news.site/rss", trust_score=None),
+        SimpleNamespace(id=4, url="not a url", trust_score=1.0),
+    ]
+
+    index = service._index_sources_by_domain(sources)  # noqa: SLF001
+
+    assert {domain: source.id for domain, source in index.items()} == {"example.com": 2, "news.site": 3}
+    assert service._build_trust_by_domain(sources) == {"example.com": 5.0, "news.site": 0.0}  # noqa: SLF001
+
+
+def test_topic_score_caps_item_scores_and_diversity() -> None:
+    assert TrendDiscoveryService._topic_score([], 3, 2) == 0.0  # noqa: SLF001
+    score = TrendDiscoveryService._topic_score([9.0, 3.0], 20, 6)  # noqa: SLF001
+    assert score == (5.0 + 3.0) / 2 + 12 * 0.2 + 4 * 0.35
+
+
+def test_top_keywords_and_signal_hits_count_across_rows() -> None:
+    first = _matched("a.example", 1.0)
+    second = _matched("b.example", 1.0)
+    second.seed_hits = ["ai", "robot"]
+    second.signal_hits = ["GPU", "gpu", "Chips"]
+
+    assert TrendDiscoveryService._top_keywords([first, second], limit=1) == ["ai"]  # noqa: SLF001
+    assert TrendDiscoveryService._top_signal_hits([first, second]) == ["gpu", "chips"]  # noqa: SLF001
+
+
+def test_slug_and_strip_html_helpers() -> None:
+    from tg_news_bot.services.trend_discovery import _slug, _strip_html
+
+    assert _slug("  Квантовые  Computers: 2026!! ") == "квантовые-computers-2026"
+    assert _slug("!!!") == "topic"
+    assert _strip_html("<p>Fast &amp; <b>cheap</b></p>\n chips") == "Fast & cheap chips"
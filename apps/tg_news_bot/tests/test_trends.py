@@ -64,6 +64,20 @@ def test_extract_keywords_filters_noise() -> None:
     assert "2026" not in result
 
 
+def test_extract_keywords_skips_out_of_range_tokens_whole() -> None:
+    settings = TrendsSettings(min_keyword_length=3, max_keyword_length=6)
+
+    result = _extract_keywords("GPT-4o beats supercomputers; C++ ok, https-proxy c#", settings)
+
+    assert result == ["gpt-4o", "beats", "c++"]
+
+
+def test_extract_keywords_returns_empty_for_inverted_length_bounds() -> None:
+    settings = TrendsSettings(min_keyword_length=20, max_keyword_length=10)
+
+    assert _extract_keywords("Quantum computing breakthrough", settings) == []
+
+
 @pytest.mark.asyncio
 async def test_trend_collector_returns_boosts_from_recent_scores() -> None:
     collector = TrendCollector(
@@ -77,3 +91,41 @@ async def test_trend_collector_returns_boosts_from_recent_scores() -> None:
     assert boosts["openai"] == pytest.approx(0.7)
     assert boosts["nasa"] == pytest.approx(0.4)
     assert collector._cached_at is not None  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_trend_collector_reuses_http_client_until_closed() -> None:
+    collector = TrendCollector(
+        settings=TrendsSettings(enabled=True),
+        session_factory=_SessionFactory(),
+        repository=_RepoStub(rows=[]),
+    )
+
+    first = collector._get_http()  # noqa: SLF001
+    assert collector._get_http() is first  # noqa: SLF001
+    assert first.headers["User-Agent"] == "tg-news-bot/1.0"
+
+    await collector.aclose()
+
+    assert first.is_closed
+    assert collector._get_http() is not first  # noqa: SLF001
+    await collector.aclose()
+
+
+@pytest.mark.asyncio
+async def test_trend_collector_serves_cached_boosts_until_ttl_expires() -> None:
+    repo = _RepoStub(rows=[("openai", 7.0)])
+    collector = TrendCollector(
+        settings=TrendsSettings(enabled=True, max_boost_per_keyword=2.0),
+        session_factory=_SessionFactory(),
+        repository=repo,
+    )
+
+    first = await collector.get_keyword_boosts()
+    repo.rows = [("nasa", 4.0)]
+    cached = await collector.get_keyword_boosts()
+    collector._cached_at -= 121.0  # noqa: SLF001
+    refreshed = await collector.get_keyword_boosts()
+
+    assert first == cached == {"openai": pytest.approx(0.7)}
+    assert refreshed == {"nasa": pytest.approx(0.4)}
@@ -1,6 +1,9 @@
-﻿from tg_news_bot.utils.url import (
+﻿from urllib.parse import urlparse
+
+from tg_news_bot.utils.url import (
     extract_domain,
     make_absolute,
+    normalize_parsed_url,
     normalize_title_key,
     normalize_url,
 )
@@ -20,6 +23,13 @@ def test_extract_domain_strips_www() -> None:
     assert extract_domain("https://www.Example.com/test") == "example.com"
 
 
+def test_normalize_parsed_url_matches_separate_helpers() -> None:
+    raw = "https://WWW.Example.com:443/news/?utm_medium=x&id=7"
+    normalized, domain = normalize_parsed_url(urlparse(raw))
+    assert normalized == normalize_url(raw) == "https://www.example.com/news?id=7"
+    assert domain == extract_domain(normalized) == "example.com"
+
+
 def test_make_absolute_joins_urls() -> None:
     base = "https://example.com/a/b"
     assert make_absolute("/img.png", base) == "https://example.com/img.png"
@@ -27,3 +37,12 @@ def test_make_absolute_joins_urls() -> None:
 
 def test_normalize_title_key_compacts_text() -> None:
     assert normalize_title_key("AI: New model!!!") == "ai new model"
+
+
+def test_normalize_url_reuses_cached_result() -> None:
+    raw = "https://example.com/cached/?utm_source=feed&id=1"
+    first = normalize_url(raw)
+    hits_before = normalize_url.cache_info().hits
+
+    assert normalize_url(raw) == first
+    assert normalize_url.cache_info().hits == hits_before + 1
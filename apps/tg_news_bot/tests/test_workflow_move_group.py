@@ -1,25 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+from datetime import datetime, timezone
 
 import pytest
 
 from telegram_publisher.types import SendResult
+from tg_news_bot.ports.publisher import PublisherNotModified
 from tg_news_bot.db.models import BotSettings, Draft, DraftState
+from tg_news_bot.services import workflow as workflow_module
 from tg_news_bot.services.workflow import DraftWorkflowService
 
 
-class _Session:
-    async def flush(self) -> None:
-        return None
-
-
 class _SessionFactory:
     def __call__(self):
         return self
 
     async def __aenter__(self):  # pragma: no cover - not used in this test
-        return _Session()
+        return object()
 
     async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001
         return None
@@ -67,7 +66,6 @@ async def test_move_in_group_rolls_back_post_when_card_send_fails() -> None:
 
     with pytest.raises(RuntimeError, match="card send failed"):
         await workflow._move_in_group(
-            session=_Session(),
             draft=draft,
             settings=settings,
             target_state=DraftState.READY,
@@ -76,3 +74,232 @@ async def test_move_in_group_rolls_back_post_when_card_send_fails() -> None:
     assert publisher.deleted == [(-1001, 501)]
     assert draft.post_message_id is None
     assert draft.card_message_id is None
+
+
+@dataclass
+class _PublisherSpy:
+    deleted: list[tuple[int, int]]
+
+    async def send_post(self, *, chat_id: int, topic_id: int | None, content, keyboard):  # noqa: ANN001
+        return SendResult(chat_id=chat_id, message_id=601)
+
+    async def send_text(self, *, chat_id: int, topic_id: int | None, text: str, keyboard, parse_mode):  # noqa: ANN001, ARG002
+        return SendResult(chat_id=chat_id, message_id=602)
+
+    async def delete_messages(self, *, chat_id: int, message_ids: list[int]) -> None:
+        self.deleted.extend((chat_id, message_id) for message_id in message_ids)
+
+
+@dataclass
+class _BatchDeletePublisher:
+    batches: list[tuple[int, list[int]]]
+
+    async def send_post(self, *, chat_id: int, topic_id: int | None, content, keyboard):  # noqa: ANN001
+        return SendResult(chat_id=chat_id, message_id=701)
+
+    async def send_text(self, *, chat_id: int, topic_id: int | None, text: str, keyboard, parse_mode):  # noqa: ANN001, ARG002
+        return SendResult(chat_id=chat_id, message_id=702)
+
+    async def delete_messages(self, *, chat_id: int, message_ids: list[int]) -> None:
+        self.batches.append((chat_id, list(message_ids)))
+
+
+@pytest.mark.asyncio
+async def test_move_in_group_returns_superseded_pair_for_batch_delete() -> None:
+    publisher = _BatchDeletePublisher(batches=[])
+    workflow = DraftWorkflowService(
+        session_factory=_SessionFactory(),
+        publisher=publisher,
+        scheduled_repo=_ScheduledRepoStub(),
+    )
+    draft = Draft(
+        id=1,
+        state=DraftState.INBOX,
+        normalized_url="https://example.com/item",
+        domain="example.com",
+        title_en="title",
+        post_text_ru="text",
+        post_message_id=10,
+        card_message_id=11,
+    )
+    settings = BotSettings(group_chat_id=-1001, ready_topic_id=13)
+
+    superseded = await workflow._move_in_group(
+        draft=draft,
+        settings=settings,
+        target_state=DraftState.READY,
+    )
+    assert publisher.batches == []
+
+    await workflow._delete_messages(-1001, superseded)
+    await workflow._delete_messages(-1001, [])
+
+    assert publisher.batches == [(-1001, [10, 11])]
+    assert (draft.post_message_id, draft.card_message_id) == (701, 702)
+
+
+@dataclass
+class _EditSpy:
+    card_texts: list[str]
+
+    async def edit_reply_markup(self, *, chat_id: int, message_id: int, keyboard) -> None:  # noqa: ANN001, ARG002
+        raise PublisherNotModified("same keyboard")
+
+    async def edit_text(self, *, chat_id: int, message_id: int, text: str, keyboard, parse_mode, disable_web_page_preview) -> None:  # noqa: ANN001, ARG002
+        self.card_texts.append(text)
+
+
+@pytest.mark.asyncio
+async def test_refresh_scheduled_messages_updates_card_when_keyboard_unchanged() -> None:
+    publisher = _EditSpy(card_texts=[])
+    workflow = DraftWorkflowService(
+        session_factory=_SessionFactory(),
+        publisher=publisher,
+        scheduled_repo=_ScheduledRepoStub(),
+    )
+    draft = Draft(
+        id=1,
+        state=DraftState.SCHEDULED,
+        normalized_url="https://example.com/item",
+        domain="example.com",
+        title_en="title",
+        post_text_ru="text",
+        group_chat_id=-1001,
+        post_message_id=10,
+        card_message_id=11,
+    )
+
+    await workflow._refresh_scheduled_messages(draft=draft)
+
+    assert len(publisher.card_texts) == 1
+    assert "Schedule at:" in publisher.card_texts[0]
+
+
+@dataclass
+class _ScheduledRepoForbidden:
+    async def get_by_draft(self, session, draft_id: int):  # noqa: ANN001, ARG002
+        raise AssertionError("schedule lookup is not needed")
+
+
+@pytest.mark.asyncio
+async def test_move_in_group_reuses_known_schedule_without_lookup() -> None:
+    publisher = _PublisherSpy(deleted=[])
+    workflow = DraftWorkflowService(
+        session_factory=_SessionFactory(),
+        publisher=publisher,
+        scheduled_repo=_ScheduledRepoForbidden(),
+    )
+    draft = Draft(
+        id=1,
+        state=DraftState.READY,
+        normalized_url="https://example.com/item",
+        domain="example.com",
+        title_en="title",
+        post_text_ru="text",
+    )
+    settings = BotSettings(group_chat_id=-1001, ready_topic_id=13, scheduled_topic_id=14)
+
+    await workflow._move_in_group(
+        draft=draft,
+        settings=settings,
+        target_state=DraftState.SCHEDULED,
+        schedule_at=datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc),
+    )
+    await workflow._move_in_group(
+        draft=draft,
+        settings=settings,
+        target_state=DraftState.READY,
+    )
+
+    assert draft.card_message_id == 602
+
+
+def test_topic_id_for_state_reads_matching_settings_field() -> None:
+    settings = BotSettings(group_chat_id=-1001, ready_topic_id=13, archive_topic_id=None)
+
+    assert DraftWorkflowService._topic_id_for_state(settings, DraftState.READY) == 13
+    with pytest.raises(RuntimeError, match="topic_id"):
+        DraftWorkflowService._topic_id_for_state(settings, DraftState.ARCHIVE)
+
+
+@dataclass
+class _PublisherCardCancelledSpy:
+    deleted: list[tuple[int, int]]
+
+    async def send_post(self, *, chat_id: int, topic_id: int | None, content, keyboard):  # noqa: ANN001
+        return SendResult(chat_id=chat_id, message_id=801)
+
+    async def send_text(self, *, chat_id: int, topic_id: int | None, text: str, keyboard, parse_mode):  # noqa: ANN001, ARG002
+        raise asyncio.CancelledError
+
+    async def delete_message(self, *, chat_id: int, message_id: int) -> None:
+        self.deleted.append((chat_id, message_id))
+
+
+@pytest.mark.asyncio
+async def test_move_in_group_removes_post_when_card_send_is_cancelled() -> None:
+    publisher = _PublisherCardCancelledSpy(deleted=[])
+    workflow = DraftWorkflowService(
+        session_factory=_SessionFactory(),
+        publisher=publisher,
+        scheduled_repo=_ScheduledRepoStub(),
+    )
+    draft = Draft(
+        id=1,
+        state=DraftState.INBOX,
+        normalized_url="https://example.com/item",
+        domain="example.com",
+        title_en="title",
+        post_text_ru="text",
+    )
+    settings = BotSettings(group_chat_id=-1001, ready_topic_id=13)
+
+    with pytest.raises(asyncio.CancelledError):
+        await workflow._move_in_group(
+            draft=draft,
+            settings=settings,
+            target_state=DraftState.READY,
+        )
+
+    assert publisher.deleted == [(-1001, 801)]
+    assert draft.post_message_id is None
+
+
+@pytest.mark.asyncio
+async def test_move_in_group_renders_card_before_sending_post(monkeypatch) -> None:  # noqa: ANN001
+    publisher = _PublisherSpy(deleted=[])
+    sent: list[str] = []
+
+    async def _send_post(**kwargs):  # noqa: ANN003, ARG001
+        sent.append("post")
+        return SendResult(chat_id=-1001, message_id=601)
+
+    def _broken_card(*args, **kwargs) -> str:  # noqa: ANN002, ANN003, ARG001
+        raise ValueError("card render failed")
+
+    publisher.send_post = _send_post
+    monkeypatch.setattr(workflow_module, "render_card_text", _broken_card)
+    workflow = DraftWorkflowService(
+        session_factory=_SessionFactory(),
+        publisher=publisher,
+        scheduled_repo=_ScheduledRepoStub(),
+    )
+    draft = Draft(
+        id=1,
+        state=DraftState.INBOX,
+        normalized_url="https://example.com/item",
+        domain="example.com",
+        title_en="title",
+        post_text_ru="text",
+    )
+    settings = BotSettings(group_chat_id=-1001, ready_topic_id=13)
+
+    with pytest.raises(ValueError, match="card render failed"):
+        await workflow._move_in_group(
+            draft=draft,
+            settings=settings,
+            target_state=DraftState.READY,
+        )
+
+    assert sent == []
+    assert publisher.deleted == []
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from types import SimpleNamespace
 
 import pytest
 
 from tg_news_bot.db.models import Draft, DraftState
+from tg_news_bot.repositories.drafts import DraftWithRelated
+from tg_news_bot.services.markup_coalescer import ReplyMarkupCoalescer
 from tg_news_bot.services.workflow import DraftWorkflowService
 
 
@@ -39,36 +42,23 @@ class _SessionFactory:
 @dataclass
 class _DraftRepo:
     draft: Draft
+    source_tags: dict | None = None
+    article_text: str | None = None
+    schedule_at: datetime | None = None
 
-    async def get_for_update(self, session, draft_id: int) -> Draft:  # noqa: ANN001, ARG002
+    async def get_for_update_with_related(self, session, draft_id: int) -> DraftWithRelated:  # noqa: ANN001, ARG002
         if draft_id != self.draft.id:
             raise LookupError
-        return self.draft
+        return DraftWithRelated(
+            draft=self.draft,
+            source_tags=self.source_tags,
+            article_text=self.article_text,
+        )
 
-    async def get(self, session, draft_id: int) -> Draft | None:  # noqa: ANN001, ARG002
+    async def get_with_active_schedule(self, session, draft_id: int):  # noqa: ANN001, ARG002
         if draft_id != self.draft.id:
             return None
-        return self.draft
-
-
-@dataclass
-class _SourceRepo:
-    tags: dict | None = None
-
-    async def get_by_id(self, session, source_id: int):  # noqa: ANN001, ARG002
-        if self.tags is None:
-            return None
-        return SimpleNamespace(tags=self.tags)
-
-
-@dataclass
-class _ArticleRepo:
-    extracted_text: str | None = None
-
-    async def get_by_id(self, session, article_id: int):  # noqa: ANN001, ARG002
-        if self.extracted_text is None:
-            return None
-        return SimpleNamespace(extracted_text=self.extracted_text)
+        return self.draft, self.schedule_at
 
 
 @dataclass
@@ -158,8 +148,7 @@ async def test_process_editing_text_updates_draft_and_messages() -> None:
     workflow = DraftWorkflowService(
         session_factory=_SessionFactory(),
         publisher=publisher,
-        draft_repo=_DraftRepo(draft),
-        source_repo=_SourceRepo(tags={"topics": ["AI", "Space"]}),
+        draft_repo=_DraftRepo(draft, source_tags={"topics": ["AI", "Space"]}),
         text_pipeline=pipeline,
     )
 
@@ -182,8 +171,7 @@ async def test_process_editing_text_rejects_non_editing_state() -> None:
     workflow = DraftWorkflowService(
         session_factory=_SessionFactory(),
         publisher=_PublisherSpy(),
-        draft_repo=_DraftRepo(draft),
-        source_repo=_SourceRepo(tags={"topics": ["ai"]}),
+        draft_repo=_DraftRepo(draft, source_tags={"topics": ["ai"]}),
         text_pipeline=pipeline,
     )
 
@@ -201,8 +189,7 @@ async def test_process_editing_text_requires_source_text() -> None:
     workflow = DraftWorkflowService(
         session_factory=_SessionFactory(),
         publisher=_PublisherSpy(),
-        draft_repo=_DraftRepo(draft),
-        source_repo=_SourceRepo(tags=None),
+        draft_repo=_DraftRepo(draft, source_tags=None),
         text_pipeline=_TextPipelineStub(),
     )
 
@@ -216,8 +203,7 @@ async def test_process_editing_text_requires_pipeline() -> None:
     workflow = DraftWorkflowService(
         session_factory=_SessionFactory(),
         publisher=_PublisherSpy(),
-        draft_repo=_DraftRepo(draft),
-        source_repo=_SourceRepo(tags={"topics": ["ai"]}),
+        draft_repo=_DraftRepo(draft, source_tags={"topics": ["ai"]}),
     )
 
     with pytest.raises(RuntimeError, match="text pipeline"):
@@ -235,9 +221,11 @@ async def test_process_editing_text_prefers_article_source_over_post_text() -> N
     workflow = DraftWorkflowService(
         session_factory=_SessionFactory(),
         publisher=publisher,
-        draft_repo=_DraftRepo(draft),
-        source_repo=_SourceRepo(tags={"topics": ["AI"]}),
-        article_repo=_ArticleRepo(extracted_text="Article source text"),
+        draft_repo=_DraftRepo(
+            draft,
+            source_tags={"topics": ["AI"]},
+            article_text="Article source text",
+        ),
         text_pipeline=pipeline,
     )
 
@@ -257,13 +245,13 @@ async def test_process_editing_text_strips_metadata_prefix_from_source() -> None
     workflow = DraftWorkflowService(
         session_factory=_SessionFactory(),
         publisher=_PublisherSpy(),
-        draft_repo=_DraftRepo(draft),
-        source_repo=_SourceRepo(tags={"topics": ["AI"]}),
-        article_repo=_ArticleRepo(
-            extracted_text=(
+        draft_repo=_DraftRepo(
+            draft,
+            source_tags={"topics": ["AI"]},
+            article_text=(
                 "Date: - November 17, 2025 - Source: - Florida State University - Summary: "
                 "Researchers found a robust signal in long-term data."
-            )
+            ),
         ),
         text_pipeline=pipeline,
     )
@@ -272,3 +260,80 @@ async def test_process_editing_text_strips_metadata_prefix_from_source() -> None
 
     assert len(pipeline.calls) == 1
     assert pipeline.calls[0]["text_en"] == "Researchers found a robust signal in long-term data."
+
+
+@pytest.mark.parametrize(
+    ("source_tags", "expected"),
+    [
+        (None, []),
+        ({"topics": [" AI ", "", "Space"]}, ["ai", "space"]),
+        ({"topics": " Quantum "}, ["quantum"]),
+        ({"topics": [], "topic": "ignored"}, []),
+        ({"topics": 5, "topic": " Biotech "}, ["biotech"]),
+        ({"topic": 7}, []),
+    ],
+)
+def test_topic_hints_from_tags(source_tags: dict | None, expected: list[str]) -> None:
+    assert DraftWorkflowService._topic_hints_from_tags(source_tags) == expected  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_refresh_draft_messages_keeps_schedule_on_card() -> None:
+    draft = _editing_draft()
+    draft.state = DraftState.SCHEDULED
+    publisher = _PublisherSpy()
+    workflow = DraftWorkflowService(
+        _SessionFactory(),
+        publisher,
+        draft_repo=_DraftRepo(
+            draft=draft,
+            schedule_at=datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc),
+        ),
+    )
+
+    await workflow.refresh_draft_messages(draft_id=1)
+
+    assert len(publisher.edit_text_calls) == 1
+    assert "Schedule at: 2026-03-01 09:30 UTC" in publisher.edit_text_calls[0]["text"]
+
+
+@dataclass
+class _ManyDraftRepo:
+    drafts: dict[int, Draft]
+    get_many_calls: list[list[int]] = field(default_factory=list)
+
+    async def get_many(self, session, draft_ids: list[int]) -> dict[int, Draft]:  # noqa: ANN001, ARG002
+        self.get_many_calls.append(list(draft_ids))
+        return {draft_id: self.drafts[draft_id] for draft_id in draft_ids if draft_id in self.drafts}
+
+
+@dataclass
+class _MarkupSpy:
+    edits: list[tuple[int, int]] = field(default_factory=list)
+
+    async def edit_reply_markup(self, *, chat_id: int, message_id: int, keyboard) -> None:  # noqa: ANN001, ARG002
+        self.edits.append((chat_id, message_id))
+
+
+@pytest.mark.asyncio
+async def test_restore_state_keyboards_loads_drafts_in_one_query() -> None:
+    first = _editing_draft()
+    second = _editing_draft()
+    second.id = 2
+    second.post_message_id = 201
+    unsent = _editing_draft()
+    unsent.id = 3
+    unsent.post_message_id = None
+    repo = _ManyDraftRepo(drafts={1: first, 2: second, 3: unsent})
+    publisher = _MarkupSpy()
+    workflow = DraftWorkflowService(
+        session_factory=_SessionFactory(),
+        publisher=publisher,
+        draft_repo=repo,
+        markup_coalescer=ReplyMarkupCoalescer(publisher, window_seconds=0),
+    )
+
+    await workflow.restore_state_keyboards([1, 2, 3, 4])
+
+    assert repo.get_many_calls == [[1, 2, 3, 4]]
+    assert sorted(publisher.edits) == [(-1001, 101), (-1001, 201)]
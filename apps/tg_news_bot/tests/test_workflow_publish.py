@@ -11,17 +11,12 @@ from tg_news_bot.db.models import BotSettings, Draft, DraftState
 from tg_news_bot.services.workflow import DraftWorkflowService
 
 
-class _Session:
-    async def flush(self) -> None:
-        return None
-
-
 class _SessionFactory:
     def __call__(self):
         return self
 
     async def __aenter__(self):  # pragma: no cover - not used in this test
-        return _Session()
+        return object()
 
     async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001
         return None
@@ -54,7 +49,7 @@ async def test_publish_now_adds_source_button_when_source_mode_button() -> None:
     )
     settings = BotSettings(channel_id=-100777)
 
-    await workflow._publish_now(_Session(), draft, settings)
+    await workflow._publish_now(draft, settings)
 
     assert publisher.sent_keyboard is not None
     button = publisher.sent_keyboard.inline_keyboard[0][0]
@@ -86,7 +81,7 @@ async def test_publish_now_adds_discussion_button_when_configured() -> None:
     )
     settings = BotSettings(channel_id=-100777)
 
-    await workflow._publish_now(_Session(), draft, settings)
+    await workflow._publish_now(draft, settings)
 
     assert publisher.sent_keyboard is not None
     row = publisher.sent_keyboard.inline_keyboard[0]
@@ -94,3 +89,36 @@ async def test_publish_now_adds_discussion_button_when_configured() -> None:
     assert row[0].url == "https://example.com/item2"
     assert row[1].text == "Обсудить"
     assert row[1].url == "https://t.me/my_discussion_group"
+
+
+@pytest.mark.asyncio
+async def test_render_post_content_offloads_only_oversized_bodies(monkeypatch) -> None:  # noqa: ANN001
+    offloaded: list[int] = []
+
+    async def _to_thread(func, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003
+        offloaded.append(len(args[0].post_text_ru))
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr("tg_news_bot.services.workflow.asyncio.to_thread", _to_thread)
+    workflow = DraftWorkflowService(session_factory=_SessionFactory(), publisher=_PublisherSpy())
+    short = Draft(
+        id=1,
+        state=DraftState.READY,
+        normalized_url="https://example.com/item",
+        domain="example.com",
+        post_text_ru="Title\n\nshort body",
+    )
+    long = Draft(
+        id=2,
+        state=DraftState.READY,
+        normalized_url="https://example.com/item",
+        domain="example.com",
+        post_text_ru="Title\n\n" + "x" * 40_000,
+    )
+
+    short_content = await workflow._render_post_content(short)
+    long_content = await workflow._render_post_content(long)
+
+    assert offloaded == [len(long.post_text_ru)]
+    assert short_content.text.startswith("<b>Title</b>")
+    assert long_content.text.startswith("<b>Title</b>")
@@ -7,6 +7,7 @@ import pytest
 
 from tg_news_bot.ports.publisher import PublisherEditNotAllowed
 from tg_news_bot.db.models import BotSettings, Draft, DraftState
+from tg_news_bot.services import workflow as workflow_module
 from tg_news_bot.services.workflow import DraftWorkflowService
 from tg_news_bot.services.workflow_types import DraftAction, TransitionRequest
 
@@ -27,15 +28,17 @@ class DummySession:
 class DummySessionFactory:
     def __init__(self, session: DummySession) -> None:
         self._session = session
+        self.open_sessions = 0
 
     def __call__(self) -> _AsyncContext:
         return self
 
     async def __aenter__(self) -> DummySession:
+        self.open_sessions += 1
         return self._session
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
-        return None
+        self.open_sessions -= 1
 
 
 class FakeDraftRepo:
@@ -47,6 +50,11 @@ class FakeDraftRepo:
             raise LookupError
         return self._draft
 
+    async def get(self, session: DummySession, draft_id: int) -> Draft | None:  # noqa: ARG002
+        if draft_id != self._draft.id:
+            return None
+        return self._draft
+
 
 class FakeSettingsRepo:
     def __init__(self, settings: BotSettings) -> None:
@@ -120,9 +128,11 @@ class SpyWorkflow(DraftWorkflowService):
         self.move_calls = 0
         self.publish_calls = 0
         self.refresh_scheduled_calls = 0
+        self.sessions_open_during_io: list[int] = []
         self.fail_move = False
+        self.session_factory = DummySessionFactory(self.session)
         super().__init__(
-            session_factory=DummySessionFactory(self.session),
+            session_factory=self.session_factory,
             publisher=object(),
             settings_repo=FakeSettingsRepo(self.settings),
             draft_repo=FakeDraftRepo(draft),
@@ -131,19 +141,22 @@ class SpyWorkflow(DraftWorkflowService):
             publish_failure_repo=self.publish_failures,
         )
 
-    async def _move_in_group(self, *, session, draft, settings, target_state) -> None:  # noqa: ANN001, D401
+    async def _move_in_group(self, *, draft, settings, target_state, schedule_at=None, post_content=None) -> list[int]:  # noqa: ANN001, D401
         self.move_calls += 1
+        self.sessions_open_during_io.append(self.session_factory.open_sessions)
         if self.fail_move:
             raise RuntimeError("move failed")
+        return []
 
-    async def _publish_now(self, session, draft, settings) -> None:  # noqa: ANN001, D401
+    async def _publish_now(self, draft, settings, *, post_content=None) -> None:  # noqa: ANN001, D401
         self.publish_calls += 1
+        self.sessions_open_during_io.append(self.session_factory.open_sessions)
         if draft.published_message_id is None:
             draft.published_message_id = 999
         if draft.published_at is None:
             draft.published_at = datetime.now(timezone.utc)
 
-    async def _refresh_scheduled_messages(self, *, session, draft) -> None:  # noqa: ANN001, D401
+    async def _refresh_scheduled_messages(self, *, draft, schedule_at=None) -> None:  # noqa: ANN001, D401
         self.refresh_scheduled_calls += 1
 
 
@@ -273,3 +286,138 @@ async def test_to_ready_auto_archives_empty_post_when_quality_gate_rejects() ->
     assert workflow.move_calls == 1
     assert isinstance(draft.score_reasons, dict)
     assert "quality_gate" in draft.score_reasons
+
+
+@pytest.mark.asyncio
+async def test_transition_discards_sent_messages_and_retries_after_version_change(monkeypatch) -> None:  # noqa: ANN001
+    draft = _make_draft(state=DraftState.INBOX)
+    draft.version = 1
+    workflow = SpyWorkflow(draft=draft)
+    repo = workflow._draft_repo
+    concurrent_commit = [True]
+    deleted: list[tuple[int, list[int]]] = []
+    original_get_for_update = repo.get_for_update
+
+    async def _get_for_update(session, draft_id: int) -> Draft:  # noqa: ANN001
+        current = await original_get_for_update(session, draft_id)
+        if concurrent_commit[0]:
+            concurrent_commit[0] = False
+            current.version = 2
+        return current
+
+    async def _move(**kwargs) -> list[int]:  # noqa: ANN003
+        moved = kwargs["draft"]
+        moved.group_chat_id = -1001
+        moved.post_message_id = 100 + 2 * workflow.move_calls
+        moved.card_message_id = 101 + 2 * workflow.move_calls
+        workflow.move_calls += 1
+        return []
+
+    async def _delete(chat_id: int, message_ids: list[int]) -> None:
+        deleted.append((chat_id, message_ids))
+
+    async def _no_sleep(delay: float) -> None:  # noqa: ARG001
+        return None
+
+    monkeypatch.setattr(repo, "get_for_update", _get_for_update)
+    monkeypatch.setattr(workflow, "_move_in_group", _move)
+    monkeypatch.setattr(workflow, "_delete_messages", _delete)
+    monkeypatch.setattr("tg_news_bot.services.workflow.asyncio.sleep", _no_sleep)
+
+    await workflow.transition(
+        TransitionRequest(draft_id=1, action=DraftAction.TO_EDITING, user_id=1)
+    )
+
+    assert workflow.move_calls == 2
+    assert deleted == [(-1001, [100, 101])]
+    assert (draft.post_message_id, draft.card_message_id) == (102, 103)
+    assert draft.state == DraftState.EDITING
+    assert workflow.edit_sessions.start_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_transition_runs_publisher_calls_without_open_session() -> None:
+    draft = _make_draft(state=DraftState.READY)
+    workflow = SpyWorkflow(draft=draft)
+
+    await workflow.transition(
+        TransitionRequest(draft_id=1, action=DraftAction.PUBLISH_NOW, user_id=1)
+    )
+
+    assert workflow.sessions_open_during_io == [0, 0]
+    assert draft.state == DraftState.PUBLISHED
+
+
+@pytest.mark.parametrize(
+    ("current", "action", "expected"),
+    [
+        (DraftState.READY, DraftAction.SCHEDULE, DraftState.SCHEDULED),
+        (DraftState.SCHEDULED, DraftAction.CANCEL_SCHEDULE, DraftState.READY),
+        (DraftState.INBOX, DraftAction.PUBLISH_NOW, None),
+        (DraftState.ARCHIVE, DraftAction.TO_EDITING, None),
+    ],
+)
+def test_resolve_target_state_uses_transition_table(
+    current: DraftState,
+    action: DraftAction,
+    expected: DraftState | None,
+) -> None:
+    assert DraftWorkflowService._resolve_target_state(current, action) == expected
+
+
+@pytest.mark.asyncio
+async def test_transition_deletes_superseded_messages_after_commit(monkeypatch) -> None:  # noqa: ANN001
+    draft = _make_draft(state=DraftState.INBOX)
+    draft.group_chat_id = -1001
+    workflow = SpyWorkflow(draft=draft)
+    events: list[str] = []
+
+    class _TrackedBegin(_AsyncContext):
+        async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+            events.append("commit")
+
+    async def _move(**kwargs) -> list[int]:  # noqa: ANN003, ARG001
+        events.append("move")
+        return [5, 6]
+
+    async def _delete(chat_id: int, message_ids: list[int]) -> None:
+        events.append(f"delete:{chat_id}:{message_ids}")
+
+    async def _start_edit(session, draft_id: int, user_id: int) -> None:  # noqa: ANN001, ARG001
+        events.append("edit_start")
+
+    monkeypatch.setattr(workflow.session, "begin", lambda: _TrackedBegin())
+    monkeypatch.setattr(workflow, "_move_in_group", _move)
+    monkeypatch.setattr(workflow, "_delete_messages", _delete)
+    monkeypatch.setattr(workflow.edit_sessions, "start", _start_edit)
+
+    await workflow.transition(
+        TransitionRequest(draft_id=1, action=DraftAction.TO_EDITING, user_id=1)
+    )
+
+    # The edit session runs in its own transaction after the draft commit.
+    assert events == ["move", "commit", "edit_start", "commit", "delete:-1001:[5, 6]"]
+
+
+def test_default_safety_services_are_shared_between_workflows() -> None:
+    first = DraftWorkflowService(
+        session_factory=DummySessionFactory(DummySession()),
+        publisher=object(),
+    )
+    second = DraftWorkflowService(
+        session_factory=DummySessionFactory(DummySession()),
+        publisher=object(),
+    )
+
+    assert first._content_safety is second._content_safety
+    assert first._quality_gate is second._quality_gate
+
+
+def test_transition_table_covers_every_state_and_action() -> None:
+    table = workflow_module._TRANSITIONS_BY_STATE
+
+    assert set(table) == set(DraftState)
+    assert len(workflow_module._TRANSITIONS) == sum(len(row) for row in table.values())
+    for (state, action), target in workflow_module._TRANSITIONS.items():
+        assert isinstance(action, DraftAction)
+        assert table[state][action] is target
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Awaitable, Callable
 
 from aiogram import Bot
@@ -20,6 +21,38 @@ from telegram_publisher.types import PostContent, SendResult
 log = logging.getLogger(__name__)
 
 
+class _TokenBucket:
+    """Pace calls to ``rate`` per second, allowing bursts of ``burst`` calls."""
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self._burst = float(max(1, burst))
+        self._clock = clock
+        self._tokens = self._burst
+        self._updated_at = clock()
+        # Waiters queue on the lock so calls go out in arrival order.
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+
 class TelegramPublisher:
     def __init__(
         self,
@@ -27,8 +60,19 @@ class TelegramPublisher:
         *,
         max_retry_after_attempts: int = 3,
         max_retry_after_delay_seconds: int = 60,
+        max_requests_per_second: float | None = None,
     ) -> None:
         self._bot = bot
+        # Optional client-side pacing under the bot-wide flood limit, so bursts
+        # are spread out instead of being answered with RetryAfter.
+        self._rate_limiter = (
+            _TokenBucket(
+                max_requests_per_second,
+                burst=max(1, int(max_requests_per_second)),
+            )
+            if max_requests_per_second
+            else None
+        )
         self._max_retry_after_attempts = max(1, max_retry_after_attempts)
         self._max_retry_after_delay_seconds = max(1, max_retry_after_delay_seconds)
 
@@ -224,6 +268,21 @@ class TelegramPublisher:
         except TelegramNotFound as exc:
             raise PublisherNotFound(str(exc)) from exc
 
+    async def delete_messages(self, *, chat_id: int, message_ids: list[int]) -> None:
+        if not message_ids:
+            return
+        try:
+            await self._call_with_retry(
+                "delete_messages",
+                self._bot.delete_messages,
+                chat_id=chat_id,
+                message_ids=message_ids,
+            )
+        except TelegramBadRequest as exc:
+            self._raise_edit_error(exc)
+        except TelegramNotFound as exc:
+            raise PublisherNotFound(str(exc)) from exc
+
     async def move_post(
         self,
         *,
@@ -250,6 +309,8 @@ class TelegramPublisher:
     ):
         last_error: Exception | None = None
         for attempt in range(1, self._max_retry_after_attempts + 1):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
             try:
                 return await func(**kwargs)
             except TelegramRetryAfter as exc:
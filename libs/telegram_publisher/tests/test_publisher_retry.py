@@ -7,7 +7,7 @@ from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
 from aiogram.methods import DeleteMessage, SendMessage
 
 from telegram_publisher.exceptions import PublisherEditNotAllowed, PublisherNotFound
-from telegram_publisher.publisher import TelegramPublisher
+from telegram_publisher.publisher import TelegramPublisher, _TokenBucket
 
 
 def _retry_after_exception() -> TelegramRetryAfter:
@@ -116,3 +116,55 @@ async def test_delete_message_maps_message_to_delete_not_found_to_not_found() ->
 
     with pytest.raises(PublisherNotFound):
         await publisher.delete_message(chat_id=123, message_id=77)
+
+
+@pytest.mark.asyncio
+async def test_delete_messages_sends_one_batch() -> None:
+    calls: list[dict] = []
+
+    async def delete_messages(**kwargs):  # noqa: ANN003
+        calls.append(kwargs)
+        return True
+
+    bot = SimpleNamespace(delete_messages=delete_messages)
+    publisher = TelegramPublisher(bot)
+
+    await publisher.delete_messages(chat_id=1, message_ids=[10, 11])
+    await publisher.delete_messages(chat_id=1, message_ids=[])
+
+    assert calls == [{"chat_id": 1, "message_ids": [10, 11]}]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_calls_after_burst(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = {"value": 100.0}
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now["value"] += seconds
+
+    monkeypatch.setattr("telegram_publisher.publisher.asyncio.sleep", fake_sleep)
+    bucket = _TokenBucket(2.0, burst=2, clock=lambda: now["value"])
+
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_publisher_acquires_before_each_call() -> None:
+    calls: list[dict] = []
+
+    async def delete_message(**kwargs):  # noqa: ANN003
+        calls.append(kwargs)
+        return True
+
+    bot = SimpleNamespace(delete_message=delete_message)
+    publisher = TelegramPublisher(bot, max_requests_per_second=30)
+
+    for message_id in range(3):
+        await publisher.delete_message(chat_id=1, message_id=message_id)
+
+    assert len(calls) == 3